@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 from collections import defaultdict
 import contextlib
+from dataclasses import dataclass
 from functools import partial
 from itertools import chain
 import logging
@@ -69,6 +70,7 @@ from .const import (
     REQUIRED_NEXT_PYTHON_HA_RELEASE,
     REQUIRED_NEXT_PYTHON_VER,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
 )
 from .core_config import async_process_ha_core_config
 from .exceptions import HomeAssistantError
@@ -88,7 +90,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
 from .setup import (
@@ -125,6 +127,14 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
 DATA_REGISTRIES_LOADED: HassKey[None] = HassKey("bootstrap_registries_loaded")
+DATA_STARTUP_SNAPSHOT: HassKey[_StartupSnapshot] = HassKey("bootstrap_startup_snapshot")
+
+STARTUP_SNAPSHOT_STORAGE_KEY = "core.startup_snapshot"
+STARTUP_SNAPSHOT_STORAGE_VERSION = 1
+STARTUP_SNAPSHOT_SAVE_DELAY = 60
+
+# The number of integrations imported ahead of their setup at a time
+PREFETCH_CONCURRENCY = os.cpu_count() or 1
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
@@ -313,6 +323,7 @@ async def async_setup_hass(
     if not (recovery_mode := runtime_config.recovery_mode):
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
 
+        conf_util.async_enable_yaml_cache(hass)
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
         except HomeAssistantError as err:
@@ -443,6 +454,80 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
     )
 
 
+@dataclass(slots=True)
+class _StartupSnapshot:
+    """Snapshot of the integrations resolved at startup.
+
+    It is only valid for the version and the custom integrations it was
+    taken with.
+    """
+
+    store: Store[dict[str, Any]]
+    key: dict[str, Any]
+    previous: dict[str, list[str]] | None
+    resolved: dict[str, list[str]] | None = None
+
+
+def _startup_snapshot_key() -> dict[str, Any]:
+    """Return the version and the modification times of the custom integrations."""
+    custom_components: dict[str, float] = {}
+    try:
+        import custom_components as custom_components_pkg  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        pass
+    else:
+        for path in custom_components_pkg.__path__:
+            custom_components[path] = os.stat(path).st_mtime
+            for entry in os.scandir(path):
+                if not entry.is_dir():
+                    continue
+                custom_components[entry.path] = entry.stat().st_mtime
+                manifest_path = os.path.join(entry.path, "manifest.json")
+                with contextlib.suppress(FileNotFoundError):
+                    custom_components[manifest_path] = os.stat(manifest_path).st_mtime
+    return {"version": __version__, "custom_components": custom_components}
+
+
+async def _async_load_startup_snapshot(hass: core.HomeAssistant) -> None:
+    """Load the snapshot of the integrations resolved by the previous start.
+
+    The snapshot is not used in recovery or safe mode or on development
+    versions where the integrations change without a version change.
+    """
+    if (
+        hass.config.recovery_mode
+        or hass.config.safe_mode
+        or core.get_release_channel() is core.ReleaseChannel.DEV
+    ):
+        return
+    store = Store[dict[str, Any]](
+        hass, STARTUP_SNAPSHOT_STORAGE_VERSION, STARTUP_SNAPSHOT_STORAGE_KEY, True
+    )
+    key, data = await asyncio.gather(
+        hass.async_add_executor_job(_startup_snapshot_key),
+        create_eager_task(store.async_load()),
+    )
+    if data is not None and data["key"] == key:
+        loader.async_set_integration_snapshot(hass, data["integrations"])
+        previous = data["bootstrap"]
+    else:
+        _LOGGER.debug("Startup snapshot is outdated, resolving all integrations")
+        previous = None
+    hass.data[DATA_STARTUP_SNAPSHOT] = _StartupSnapshot(store, key, previous)
+
+
+@core.callback
+def _async_startup_snapshot_data(
+    hass: core.HomeAssistant, snapshot: _StartupSnapshot
+) -> dict[str, Any]:
+    """Return the snapshot of the integrations resolved at startup to store."""
+    return {
+        "key": snapshot.key,
+        "integrations": loader.async_get_integration_snapshot(hass),
+        "bootstrap": snapshot.resolved,
+    }
+
+
 async def async_from_config_dict(
     config: ConfigType, hass: core.HomeAssistant
 ) -> core.HomeAssistant | None:
@@ -458,6 +543,7 @@ async def async_from_config_dict(
     # to a custom integration
     await loader.async_get_custom_components(hass)
     await async_load_base_functionality(hass)
+    await _async_load_startup_snapshot(hass)
 
     # Set up core.
     _LOGGER.debug("Setting up %s", CORE_INTEGRATIONS)
@@ -804,10 +890,55 @@ async def async_setup_multi_components(
             )
 
 
+async def _async_resolve_domains_from_snapshot(
+    hass: core.HomeAssistant,
+    resolved: dict[str, list[str]],
+    domains_to_setup: set[str],
+    platforms: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> bool:
+    """Resolve the domains to set up like the previous start did.
+
+    Returns False if the domains to set up resolve differently now.
+    """
+    if (
+        set(resolved["requested"]) != domains_to_setup
+        or set(resolved.get("platforms", ())) != platforms
+    ):
+        return False
+    integrations = {
+        domain: itg
+        for domain, itg in (
+            await loader.async_get_integrations(hass, resolved["manifests"])
+        ).items()
+        if isinstance(itg, loader.Integration)
+    }
+    resolved_domains = set(resolved["domains"])
+    if not resolved_domains.issubset(integrations):
+        return False
+    # Only the custom integrations are not resolved by the snapshot
+    if not all(
+        await asyncio.gather(
+            *(
+                integrations[domain].resolve_dependencies()
+                for domain in resolved_domains
+            )
+        )
+    ) or any(
+        not integrations[domain].all_dependencies.issubset(resolved_domains)
+        for domain in resolved_domains
+    ):
+        return False
+    integration_cache.update(integrations)
+    domains_to_setup.update(resolved_domains)
+    return True
+
+
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> tuple[set[str], dict[str, loader.Integration]]:
     """Resolve all dependencies and return list of domains to set up."""
+    start = monotonic()
     domains_to_setup = _get_domains(hass, config)
     needed_requirements: set[str] = set()
     platform_integrations = conf_util.extract_platform_integrations(
@@ -843,11 +974,34 @@ async def _async_resolve_domains_to_setup(
     }
 
     translations_to_load = additional_manifests_to_load.copy()
+    requested_domains = sorted(domains_to_setup)
+    # The platform integrations are not set up by their own config, they
+    # are only part of the manifests of the snapshot
+    requested_platforms = set(chain.from_iterable(platform_integrations.values()))
 
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
     to_resolve: set[str] = domains_to_setup
+    from_snapshot = False
+    if (
+        (snapshot := hass.data.get(DATA_STARTUP_SNAPSHOT))
+        and snapshot.previous
+        and await _async_resolve_domains_from_snapshot(
+            hass,
+            snapshot.previous,
+            domains_to_setup,
+            requested_platforms,
+            integration_cache,
+        )
+    ):
+        # The previous start loaded the same manifests, nothing is left
+        # to resolve
+        from_snapshot = True
+        for itg in integration_cache.values():
+            needed_requirements.update(itg.requirements)
+        to_resolve = set()
+        additional_manifests_to_load.clear()
     while to_resolve or additional_manifests_to_load:
         old_to_resolve: set[str] = to_resolve
         to_resolve = set()
@@ -923,6 +1077,18 @@ async def _async_resolve_domains_to_setup(
                 to_resolve.add(dep)
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
+    _LOGGER.debug(
+        "Resolved the domains to set up in %.2fs (from startup snapshot: %s)",
+        monotonic() - start,
+        from_snapshot,
+    )
+    if snapshot:
+        snapshot.resolved = {
+            "requested": requested_domains,
+            "platforms": sorted(requested_platforms),
+            "domains": sorted(domains_to_setup),
+            "manifests": sorted(integration_cache),
+        }
 
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
@@ -968,6 +1134,50 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_prefetch_integrations(
+    hass: core.HomeAssistant,
+    domains_to_setup: set[str],
+    integration_cache: dict[str, loader.Integration],
+) -> None:
+    """Import the integrations to set up and their entity platforms ahead of need.
+
+    Integrations with fewer dependencies are imported first since they are
+    set up first. Only PREFETCH_CONCURRENCY imports are queued on the import
+    executor at a time so the imports of the running setups do not wait
+    behind all of them.
+    """
+    integrations: list[tuple[int, loader.Integration]] = []
+    for domain in domains_to_setup:
+        if (itg := integration_cache.get(domain)) is None or not itg.import_executor:
+            continue
+        try:
+            all_dependencies = itg.all_dependencies
+        except RuntimeError:
+            # The integration is not set up if its dependencies do not resolve
+            continue
+        integrations.append((len(all_dependencies), itg))
+    integrations.sort(key=itemgetter(0))
+    to_import = iter(itg for _, itg in integrations)
+
+    async def _async_import_integrations() -> None:
+        """Import the next integration until all were imported."""
+        for integration in to_import:
+            # Import errors are logged by the setup, not by the prefetch
+            with contextlib.suppress(Exception):
+                await integration.async_get_component(log_import_errors=False)
+                if platforms := integration.platforms_exists(BASE_PLATFORMS):
+                    await integration.async_get_platforms(
+                        platforms, log_import_errors=False
+                    )
+
+    await asyncio.gather(
+        *(
+            create_eager_task(_async_import_integrations(), loop=hass.loop)
+            for _ in range(min(PREFETCH_CONCURRENCY, len(integrations)))
+        )
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -979,6 +1189,13 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    # Start importing the integrations while the first ones are set up
+    hass.async_create_background_task(
+        _async_prefetch_integrations(hass, domains_to_setup, integration_cache),
+        "prefetch integrations",
+        eager_start=True,
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -989,25 +1206,37 @@ async def _async_set_up_integrations(
 
     # calculate what components to setup in what stage
     stage_1_domains: set[str] = set()
+    snapshot = hass.data.get(DATA_STARTUP_SNAPSHOT)
 
-    # Find all dependencies of any dependency of any stage 1 integration that
-    # we plan on loading and promote them to stage 1. This is done only to not
-    # get misleading log messages
-    deps_promotion: set[str] = STAGE_1_INTEGRATIONS
-    while deps_promotion:
-        old_deps_promotion = deps_promotion
-        deps_promotion = set()
+    if (
+        snapshot
+        and snapshot.previous
+        and set(snapshot.previous["domains"]) == domains_to_setup
+    ):
+        # Same domains as the previous start, so the same stages
+        stage_1_domains.update(snapshot.previous["stage_1"])
+    else:
+        # Find all dependencies of any dependency of any stage 1 integration
+        # that we plan on loading and promote them to stage 1. This is done
+        # only to not get misleading log messages
+        deps_promotion: set[str] = STAGE_1_INTEGRATIONS
+        while deps_promotion:
+            old_deps_promotion = deps_promotion
+            deps_promotion = set()
+
+            for domain in old_deps_promotion:
+                if domain not in domains_to_setup or domain in stage_1_domains:
+                    continue
 
-        for domain in old_deps_promotion:
-            if domain not in domains_to_setup or domain in stage_1_domains:
-                continue
+                stage_1_domains.add(domain)
 
-            stage_1_domains.add(domain)
+                if (dep_itg := integration_cache.get(domain)) is None:
+                    continue
 
-            if (dep_itg := integration_cache.get(domain)) is None:
-                continue
+                deps_promotion.update(dep_itg.all_dependencies)
 
-            deps_promotion.update(dep_itg.all_dependencies)
+    if snapshot and snapshot.resolved is not None:
+        snapshot.resolved["stage_1"] = sorted(stage_1_domains)
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
@@ -1071,9 +1300,20 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    if snapshot:
+        snapshot.store.async_delay_save(
+            partial(_async_startup_snapshot_data, hass, snapshot),
+            STARTUP_SNAPSHOT_SAVE_DELAY,
+        )
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        import_time = loader.async_get_import_timings(hass)
+        _LOGGER.debug(
+            "Integration import times: %s",
+            dict(sorted(import_time.items(), key=itemgetter(1), reverse=True)),
+        )
@@ -69,6 +69,7 @@ async def async_attach_trigger(
         )
     event_data_schema: vol.Schema | None = None
     event_data_items: ItemsView | None = None
+    event_keys: dict[str, tuple[str | int | float]] | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         event_data = {}
@@ -87,6 +88,13 @@ async def async_attach_trigger(
         else:
             # Use a simple items comparison if possible
             event_data_items = event_data.items()
+        # Let the event bus index the listener on the scalar values so the
+        # filter is only called for events which can match
+        event_keys = {
+            key: (value,)
+            for key, value in event_data.items()
+            if isinstance(value, (str, int, float))
+        }
 
     event_context_schema: vol.Schema | None = None
     event_context_items: ItemsView | None = None
@@ -167,7 +175,9 @@ async def async_attach_trigger(
 
     event_filter = filter_event if event_data_items or event_data_schema else None
     removes = [
-        hass.bus.async_listen(event_type, handle_event, event_filter=event_filter)
+        hass.bus.async_listen(
+            event_type, handle_event, event_filter=event_filter, event_keys=event_keys
+        )
         for event_type in event_types
     ]
 
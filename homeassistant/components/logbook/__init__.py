@@ -20,8 +20,12 @@ from homeassistant.const import (
     ATTR_NAME,
     EVENT_LOGBOOK_ENTRY,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
@@ -136,7 +140,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         EventType[Any] | str,
         tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]],
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    logbook_config = LogbookConfig(external_events, filters, entities_filter)
+    hass.data[DOMAIN] = logbook_config
+
+    @callback
+    def _async_clear_described_events(event: Event) -> None:
+        """Forget described events since they may contain registry names."""
+        logbook_config.described_events.clear()
+
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _async_clear_described_events
+    )
+    hass.bus.async_listen(
+        dr.EVENT_DEVICE_REGISTRY_UPDATED, _async_clear_described_events
+    )
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
@@ -160,5 +177,6 @@ def _process_logbook_platform(hass: HomeAssistant, domain: str, platform: Any) -
     ) -> None:
         """Teach logbook how to describe a new event."""
         external_events[event_name] = (domain, describe_callback)
+        logbook_config.described_events.clear()
 
     platform.async_describe_events(hass, _async_describe_event)
@@ -43,6 +43,11 @@ LOGBOOK_ENTRY_NAME = "name"
 LOGBOOK_ENTRY_STATE = "state"
 LOGBOOK_ENTRY_WHEN = "when"
 
+# The number of context origins remembered between logbook runs
+CONTEXT_ORIGIN_CACHE_SIZE = 16384
+# The number of described events remembered between logbook runs
+DESCRIBED_EVENT_CACHE_SIZE = 16384
+
 # Automation events that can affect an entity_id or device_id
 AUTOMATION_EVENTS = {EVENT_AUTOMATION_TRIGGERED, EVENT_SCRIPT_STARTED}
 
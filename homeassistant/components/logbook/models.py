@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Final, NamedTuple, cast
 
+from lru import LRU
 from propcache import cached_property
 from sqlalchemy.engine.row import Row
 
@@ -22,6 +23,8 @@ from homeassistant.util.event_type import EventType
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+from .const import CONTEXT_ORIGIN_CACHE_SIZE, DESCRIBED_EVENT_CACHE_SIZE
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -33,6 +36,14 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    # The earliest row seen for each context id, shared by all runs
+    context_origins: LRU[bytes, Row] = field(
+        default_factory=lambda: LRU(CONTEXT_ORIGIN_CACHE_SIZE)
+    )
+    # The descriptions of recorded events by row id, shared by all runs
+    described_events: LRU[int, dict[str, Any]] = field(
+        default_factory=lambda: LRU(DESCRIBED_EVENT_CACHE_SIZE)
+    )
 
 
 class LazyEventPartialState:
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Generator, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 import logging
 import time
 from typing import TYPE_CHECKING, Any
 
+from lru import LRU
 from sqlalchemy.engine import Result
 from sqlalchemy.engine.row import Row
 
@@ -47,10 +48,12 @@ from .const import (
     CONTEXT_EVENT_TYPE,
     CONTEXT_MESSAGE,
     CONTEXT_NAME,
+    CONTEXT_ORIGIN_CACHE_SIZE,
     CONTEXT_SERVICE,
     CONTEXT_SOURCE,
     CONTEXT_STATE,
     CONTEXT_USER_ID,
+    DESCRIBED_EVENT_CACHE_SIZE,
     DOMAIN,
     LOGBOOK_ENTRY_DOMAIN,
     LOGBOOK_ENTRY_ENTITY_ID,
@@ -99,6 +102,12 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    context_origins: LRU[bytes, Row] = field(
+        default_factory=lambda: LRU(CONTEXT_ORIGIN_CACHE_SIZE)
+    )
+    described_events: LRU[int, dict[str, Any]] = field(
+        default_factory=lambda: LRU(DESCRIBED_EVENT_CACHE_SIZE)
+    )
 
 
 class EventProcessor:
@@ -133,6 +142,8 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             timestamp=timestamp,
+            context_origins=logbook_config.context_origins,
+            described_events=logbook_config.described_events,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -156,6 +167,18 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        return list(self.iter_events(start_day, end_day))
+
+    def iter_events(
+        self,
+        start_day: dt,
+        end_day: dt,
+    ) -> Generator[dict[str, Any]]:
+        """Generate the events for a period of time.
+
+        When the period is longer than a day the rows are fetched from
+        the database in batches as the events are consumed.
+        """
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -180,8 +203,18 @@ class EventProcessor:
                 self.filters,
                 self.context_id,
             )
-            return self.humanify(
-                execute_stmt_lambda_element(session, stmt, orm_rows=False)
+            yield from _humanify(
+                self.hass,
+                execute_stmt_lambda_element(
+                    session,
+                    stmt,
+                    dt_util.as_utc(start_day),
+                    dt_util.as_utc(end_day),
+                    orm_rows=False,
+                ),
+                self.ent_reg,
+                self.logbook_run,
+                self.context_augmenter,
             )
 
     def humanify(
@@ -210,6 +243,7 @@ def _humanify(
     # Continuous sensors, will be excluded from the logbook
     continuous_sensors: dict[str, bool] = {}
     context_lookup = logbook_run.context_lookup
+    context_origins = logbook_run.context_origins
     external_events = logbook_run.external_events
     event_cache_get = logbook_run.event_cache.get
     entity_name_cache_get = logbook_run.entity_name_cache.get
@@ -217,6 +251,7 @@ def _humanify(
     timestamp = logbook_run.timestamp
     memoize_new_contexts = logbook_run.memoize_new_contexts
     get_context = context_augmenter.get_context
+    describe = context_augmenter.describe
     context_id_bin: bytes
     data: dict[str, Any]
 
@@ -224,7 +259,9 @@ def _humanify(
     for row in rows:
         context_id_bin = row[CONTEXT_ID_BIN_POS]
         if memoize_new_contexts and context_id_bin not in context_lookup:
-            context_lookup[context_id_bin] = row
+            context_lookup[context_id_bin] = _context_origin(
+                context_origins, context_id_bin, row
+            )
         if row[CONTEXT_ONLY_POS]:
             continue
         event_type = row[EVENT_TYPE_POS]
@@ -256,7 +293,7 @@ def _humanify(
         elif event_type in external_events:
             domain, describe_event = external_events[event_type]
             try:
-                data = describe_event(event_cache_get(row))
+                data = describe(row, describe_event)
             except Exception:
                 _LOGGER.exception(
                     "Error with %s describe event for %s", domain, event_type
@@ -319,6 +356,7 @@ class ContextAugmenter:
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
+        self.described_events = logbook_run.described_events
         self.include_entity_name = logbook_run.include_entity_name
 
     def get_context(
@@ -337,6 +375,24 @@ class ContextAugmenter:
             return async_event_to_row(origin_event)
         return None
 
+    def describe(
+        self,
+        row: Row | EventAsRow,
+        describe_event: Callable[[LazyEventPartialState], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Describe the event of the row.
+
+        Descriptions of recorded events are cached by row id, events that
+        are not recorded yet are described every time.
+        """
+        row_id: int | None
+        if type(row) is EventAsRow or (row_id := row[ROW_ID_POS]) is None:
+            return describe_event(self.event_cache.get(row))
+        if (described := self.described_events.get(row_id)) is None:
+            described = describe_event(self.event_cache.get(row))
+            self.described_events[row_id] = described
+        return described.copy()
+
     def augment(self, data: dict[str, Any], context_row: Row | EventAsRow) -> None:
         """Augment data from the row and cache."""
         event_type = context_row[EVENT_TYPE_POS]
@@ -365,9 +421,8 @@ class ContextAugmenter:
         domain, describe_event = self.external_events[event_type]
         data[CONTEXT_EVENT_TYPE] = event_type
         data[CONTEXT_DOMAIN] = domain
-        event = self.event_cache.get(context_row)
         try:
-            described = describe_event(event)
+            described = self.describe(context_row, describe_event)
         except Exception:
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
             return
@@ -385,6 +440,24 @@ class ContextAugmenter:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
 
 
+def _context_origin(
+    context_origins: LRU[bytes, Row],
+    context_id_bin: bytes,
+    row: Row | EventAsRow,
+) -> Row | EventAsRow:
+    """Return the origin of a context seen for the first time in a run.
+
+    The earliest recorded row of each context is remembered between runs
+    so the origin is found even if it is before the start of the run.
+    """
+    if type(row) is EventAsRow:
+        return row
+    origin = context_origins.get(context_id_bin)
+    if origin is None or row[TIME_FIRED_TS_POS] < origin[TIME_FIRED_TS_POS]:
+        context_origins[context_id_bin] = origin = row
+    return origin
+
+
 def _rows_ids_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
     """Check of rows match by using the same method as Events __hash__."""
     return bool((row_id := row[ROW_ID_POS]) and row_id == other_row[ROW_ID_POS])
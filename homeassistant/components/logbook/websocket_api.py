@@ -35,6 +35,10 @@ EVENT_COALESCE_TIME = 0.35
 BIG_QUERY_HOURS = 25
 # how many hours to deliver in the first chunk when we split the query
 BIG_QUERY_RECENT_HOURS = 24
+# maximum number of historical events sent in one message
+MAX_EVENTS_PER_MESSAGE = 1000
+# period of historical events fetched at once
+STREAM_SLICE = timedelta(days=1)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -104,6 +108,7 @@ async def _async_send_historical_events(
     if not is_big_query:
         message, last_event_time = await _async_get_ws_stream_events(
             hass,
+            connection,
             msg_id,
             start_time,
             end_time,
@@ -125,6 +130,7 @@ async def _async_send_historical_events(
     recent_query_start = end_time - timedelta(hours=BIG_QUERY_RECENT_HOURS)
     recent_message, recent_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         recent_query_start,
         end_time,
@@ -136,6 +142,7 @@ async def _async_send_historical_events(
 
     older_message, older_query_last_event_time = await _async_get_ws_stream_events(
         hass,
+        connection,
         msg_id,
         start_time,
         recent_query_start,
@@ -156,6 +163,7 @@ async def _async_send_historical_events(
 
 async def _async_get_ws_stream_events(
     hass: HomeAssistant,
+    connection: ActiveConnection,
     msg_id: int,
     start_time: dt,
     end_time: dt,
@@ -163,13 +171,16 @@ async def _async_get_ws_stream_events(
     partial: bool,
 ) -> tuple[bytes, dt | None]:
     """Async wrapper around _ws_formatted_get_events."""
-    return await get_instance(hass).async_add_executor_job(
+    return await get_instance(hass).async_add_read_executor_job(
         _ws_stream_get_events,
         msg_id,
         start_time,
         end_time,
         event_processor,
         partial,
+        lambda message: hass.loop.call_soon_threadsafe(
+            connection.send_message, message
+        ),
     )
 
 
@@ -190,19 +201,48 @@ def _ws_stream_get_events(
     end_day: dt,
     event_processor: EventProcessor,
     partial: bool,
+    send_message: Callable[[bytes], Any],
 ) -> tuple[bytes, dt | None]:
-    """Fetch events and convert them to json in the executor."""
-    events = event_processor.get_events(start_day, end_day)
-    last_time = None
-    if events:
-        last_time = dt_util.utc_from_timestamp(events[-1]["when"])
-    message = _generate_stream_message(events, start_day, end_day)
+    """Fetch events and convert them to json in the executor.
+
+    The period is fetched a day at a time from the newest day to the oldest
+    one, so only the events of a day are held in memory. The events are sent
+    with send_message as partial messages of up to MAX_EVENTS_PER_MESSAGE
+    events, newest message first, so each message stays contiguous with the
+    older end of the events the client already shows. The message with the
+    oldest events is returned.
+    """
+    last_time: dt | None = None
+    message: dict[str, Any] | None = None
+    slice_end = end_day
+    while True:
+        slice_start = max(start_day, slice_end - STREAM_SLICE)
+        chunks: list[list[dict[str, Any]]] = [[]]
+        for event in event_processor.iter_events(slice_start, slice_end):
+            if len(chunks[-1]) == MAX_EVENTS_PER_MESSAGE:
+                chunks.append([])
+            chunks[-1].append(event)
+        if chunks[-1]:
+            if last_time is None:
+                last_time = dt_util.utc_from_timestamp(chunks[-1][-1]["when"])
+            for events in reversed(chunks):
+                if message is not None:
+                    send_message(json_bytes(messages.event_message(msg_id, message)))
+                message = _generate_stream_message(events, start_day, end_day)
+                message["partial"] = True
+        if slice_start == start_day:
+            break
+        slice_end = slice_start
+    if message is None:
+        message = _generate_stream_message([], start_day, end_day)
     if partial:
         # This is a hint to consumers of the api that
         # we are about to send a another block of historical
         # data in case the UI needs to show that historical
         # data is still loading in the future
         message["partial"] = True
+    else:
+        message.pop("partial", None)
     return json_bytes(messages.event_message(msg_id, message)), last_time
 
 
@@ -501,7 +541,7 @@ async def ws_get_events(
     )
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_formatted_get_events,
             msg["id"],
             start_time,
@@ -7,7 +7,7 @@ from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
 from dataclasses import dataclass
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -83,6 +83,7 @@ from .models import (
     PublishPayloadType,
     ReceiveMessage,
 )
+from .topic_trie import TopicTrie
 from .util import EnsureJobAfterCooldown, get_file_path, mqtt_config_entry_enabled
 
 if TYPE_CHECKING:
@@ -266,7 +267,6 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
@@ -378,6 +378,14 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        # The wildcard subscriptions are indexed in a topic trie so a topic
+        # can be matched without testing every wildcard subscription.
+        self._wildcard_subscription_trie: TopicTrie[Subscription] = TopicTrie()
+        # Cache of the subscriptions matching a topic. The cached topics are
+        # indexed in a topic trie as well, so a new or removed wildcard
+        # subscription only invalidates the topics it matches.
+        self._matching_subscriptions_cache: dict[str, list[Subscription]] = {}
+        self._cached_topic_trie: TopicTrie[str] = TopicTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -625,8 +633,9 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or topic in self._wildcard_subscription_trie
         )
 
     async def async_publish(
@@ -745,28 +754,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscription_trie.add(subscription.topic, subscription)
+        self._async_invalidate_matching_subscriptions(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -777,12 +783,31 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscription_trie.remove(topic, subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="mqtt_not_setup_cannot_unsubscribe_twice",
                 translation_placeholders={"topic": topic},
             ) from exc
+        self._async_invalidate_matching_subscriptions(subscription)
+
+    @callback
+    def _async_invalidate_matching_subscriptions(
+        self, subscription: Subscription
+    ) -> None:
+        """Invalidate the cached matches of topics affected by a subscription."""
+        cache = self._matching_subscriptions_cache
+        if not cache:
+            return
+        topic = subscription.topic
+        if subscription.is_simple_match:
+            topics: Iterable[str] = (topic,) if topic in cache else ()
+        else:
+            topics = list(self._cached_topic_trie.match_filter(topic))
+        for cached_topic in topics:
+            del cache[cached_topic]
+            self._cached_topic_trie.remove(cached_topic, cached_topic)
 
     @callback
     def _async_queue_subscriptions(
@@ -847,11 +872,9 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -863,7 +886,6 @@ class MQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -1056,18 +1078,15 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
-        if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        """Return the subscriptions matching a topic."""
+        if (subscriptions := self._matching_subscriptions_cache.get(topic)) is None:
+            subscriptions = []
+            if topic in self._simple_subscriptions:
+                subscriptions.extend(self._simple_subscriptions[topic])
+            subscriptions.extend(self._wildcard_subscription_trie.match_topic(topic))
+            self._matching_subscriptions_cache[topic] = subscriptions
+            self._cached_topic_trie.add(topic, topic)
         return subscriptions
 
     @callback
@@ -1263,13 +1282,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -0,0 +1,169 @@
+"""Topic trie used to match MQTT topics against wildcard subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator
+
+MULTI_LEVEL_WILDCARD = "#"
+SINGLE_LEVEL_WILDCARD = "+"
+
+
+class _TopicTrieNode[_T: Hashable]:
+    """A node in the topic trie, representing one topic level."""
+
+    __slots__ = ("children", "key", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        # The full key stored at this node, if any
+        self.key: str | None = None
+        # Values stored at this node with their insertion sequence
+        self.values: dict[_T, int] = {}
+
+
+class TopicTrie[_T: Hashable]:
+    """A trie keyed by MQTT topic levels.
+
+    The trie is maintained incrementally when keys are added or removed.
+    Keys can either be treated as topic filters with `+` and `#` wildcards
+    (see `match_topic`) or as concrete topics to be matched by a single
+    topic filter (see `match_filter`).
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._sequence = 0
+
+    def __contains__(self, key: str) -> bool:
+        """Return if values are stored for the exact key."""
+        node = self._root
+        for level in key.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def add(self, key: str, value: _T) -> None:
+        """Store a value under a key."""
+        node = self._root
+        for level in key.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.key = key
+        if value not in node.values:
+            self._sequence += 1
+            node.values[value] = self._sequence
+
+    def remove(self, key: str, value: _T) -> None:
+        """Remove a value stored under a key.
+
+        Raises KeyError if the value is not stored under the key.
+        Nodes that are no longer used are pruned.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in key.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        del node.values[value]
+        if node.values:
+            return
+        node.key = None
+        for parent, level in reversed(path):
+            if node.children or node.values:
+                break
+            del parent.children[level]
+            node = parent
+
+    def match_topic(self, topic: str) -> list[_T]:
+        """Return the values of all stored topic filters matching a topic.
+
+        The values are returned in the order they were added.
+        Following the MQTT specification, wildcards on the first level do
+        not match topics starting with `$`.
+        """
+        levels = topic.split("/")
+        matches: list[tuple[int, _T]] = []
+        self._match_topic(self._root, levels, 0, not topic.startswith("$"), matches)
+        if len(matches) > 1:
+            matches.sort(key=_sequence_key)
+        return [value for _, value in matches]
+
+    def _match_topic(
+        self,
+        node: _TopicTrieNode[_T],
+        levels: list[str],
+        index: int,
+        normal: bool,
+        matches: list[tuple[int, _T]],
+    ) -> None:
+        """Collect matching values walking the trie recursively."""
+        children = node.children
+        wildcard_allowed = normal or index > 0
+        if index == len(levels):
+            matches.extend((seq, value) for value, seq in node.values.items())
+        else:
+            if (child := children.get(levels[index])) is not None:
+                self._match_topic(child, levels, index + 1, normal, matches)
+            if (
+                wildcard_allowed
+                and (child := children.get(SINGLE_LEVEL_WILDCARD)) is not None
+            ):
+                self._match_topic(child, levels, index + 1, normal, matches)
+        # A multi level wildcard also matches the parent level
+        if (
+            wildcard_allowed
+            and (child := children.get(MULTI_LEVEL_WILDCARD)) is not None
+        ):
+            matches.extend((seq, value) for value, seq in child.values.items())
+
+    def match_filter(self, topic_filter: str) -> Iterator[str]:
+        """Yield the stored keys which are matched by a topic filter.
+
+        This is the reverse of `match_topic`, the stored keys are treated
+        as concrete topics.
+        """
+        return self._match_filter(self._root, topic_filter.split("/"), 0)
+
+    def _match_filter(
+        self, node: _TopicTrieNode[_T], levels: list[str], index: int
+    ) -> Iterator[str]:
+        """Yield the keys matching a topic filter walking the trie recursively."""
+        if index == len(levels):
+            if node.key is not None:
+                yield node.key
+            return
+        level = levels[index]
+        if level == MULTI_LEVEL_WILDCARD:
+            # A multi level wildcard also matches the parent level
+            if node.key is not None and index > 0:
+                yield node.key
+            yield from self._iter_keys(node, index == 0)
+            return
+        if level == SINGLE_LEVEL_WILDCARD:
+            for child_level, child in node.children.items():
+                if index == 0 and child_level.startswith("$"):
+                    continue
+                yield from self._match_filter(child, levels, index + 1)
+            return
+        if (child := node.children.get(level)) is not None:
+            yield from self._match_filter(child, levels, index + 1)
+
+    def _iter_keys(self, node: _TopicTrieNode[_T], root: bool) -> Iterator[str]:
+        """Yield all keys stored below a node."""
+        for child_level, child in node.children.items():
+            if root and child_level.startswith("$"):
+                continue
+            if child.key is not None:
+                yield child.key
+            yield from self._iter_keys(child, False)
+
+
+def _sequence_key[_T](item: tuple[int, _T]) -> int:
+    """Return the insertion sequence of a match."""
+    return item[0]
@@ -58,6 +58,11 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_HISTORY_CACHE_HOURS = 0
+DEFAULT_HISTORY_CACHE_MAX_MB = 64
+DEFAULT_INCREMENTAL_STATISTICS = False
+DEFAULT_PURGE_BY_DAY = False
+DEFAULT_SPOOL_BACKLOG = 0
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
@@ -68,6 +73,12 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_HISTORY_CACHE_HOURS = "history_cache_hours"
+CONF_HISTORY_CACHE_MAX_MB = "history_cache_max_mb"
+CONF_INCREMENTAL_STATISTICS = "incremental_statistics"
+CONF_PURGE_BY_DAY = "purge_by_day"
+CONF_SPOOL_BACKLOG = "spool_backlog"
+CONF_STATISTICS_KEEP_DAYS = "statistics_keep_days"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -120,6 +131,25 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_HOURS, default=DEFAULT_HISTORY_CACHE_HOURS
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=168)),
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_MAX_MB, default=DEFAULT_HISTORY_CACHE_MAX_MB
+                    ): cv.positive_int,
+                    vol.Optional(
+                        CONF_INCREMENTAL_STATISTICS,
+                        default=DEFAULT_INCREMENTAL_STATISTICS,
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_PURGE_BY_DAY, default=DEFAULT_PURGE_BY_DAY
+                    ): cv.boolean,
+                    vol.Optional(
+                        CONF_SPOOL_BACKLOG, default=DEFAULT_SPOOL_BACKLOG
+                    ): cv.positive_int,
+                    vol.Optional(CONF_STATISTICS_KEEP_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
                 }
             ),
         )
@@ -149,6 +179,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
+    history_cache_hours = conf[CONF_HISTORY_CACHE_HOURS]
+    history_cache_max_mb = conf[CONF_HISTORY_CACHE_MAX_MB]
+    incremental_statistics = conf[CONF_INCREMENTAL_STATISTICS]
+    purge_by_day = conf[CONF_PURGE_BY_DAY]
+    spool_backlog = conf[CONF_SPOOL_BACKLOG]
+    statistics_keep_days = conf.get(CONF_STATISTICS_KEEP_DAYS)
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
@@ -170,6 +206,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        history_cache_window=history_cache_hours * 3600,
+        history_cache_max_memory=history_cache_max_mb * 1024**2,
+        incremental_statistics=incremental_statistics,
+        purge_by_day=purge_by_day,
+        spool_backlog=spool_backlog,
+        statistics_keep_days=statistics_keep_days,
     )
     get_instance.cache_clear()
     instance.async_initialize()
@@ -0,0 +1,193 @@
+"""Bulk insert of recorded states and events."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Insert, Table, insert, text
+from sqlalchemy.orm.session import Session
+
+from .const import SupportedDialect
+from .db_schema import Events, States
+
+# Bulk inserts are chunked to keep the size of the statements bounded
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# InnoDB only assigns consecutive ids to the rows of a multi-row insert
+# with the traditional (0) and consecutive (1) lock modes, the interleaved
+# mode (2) which is the default of MySQL 8 may interleave them with the rows
+# of concurrent inserts.
+# https://dev.mysql.com/doc/refman/8.0/en/innodb-auto-increment-handling.html
+CONTIGUOUS_AUTOINC_LOCK_MODES = (0, 1)
+
+_AUTO_INCREMENT_STEP = "recorder_auto_increment_step"
+
+
+@cache
+def _insert_columns(table: Table) -> tuple[str, ...]:
+    """Return the columns to insert, all columns but the primary key."""
+    return tuple(column.key for column in table.columns if not column.primary_key)
+
+
+@cache
+def _insert_stmt(table: Table) -> Insert:
+    """Return the insert statement of a table."""
+    return insert(table)
+
+
+@cache
+def _insert_returning_stmt(table: Table) -> Insert:
+    """Return the insert statement of a table returning the primary key in order."""
+    return insert(table).returning(
+        *table.primary_key.columns, sort_by_parameter_order=True
+    )
+
+
+def _returns_ids_in_order(session: Session) -> bool:
+    """Return if the database returns the ids of bulk inserted rows in order."""
+    return bool(
+        session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order
+    )
+
+
+def _auto_increment_step(session: Session) -> int | None:
+    """Return the step between the ids of the rows of a multi-row insert.
+
+    None is returned if the ids are not guaranteed to be contiguous. The
+    server variables are read once per connection.
+    """
+    if session.get_bind().dialect.name != SupportedDialect.MYSQL:
+        return None
+    info = session.connection().info
+    if _AUTO_INCREMENT_STEP not in info:
+        lock_mode, increment = session.execute(
+            text("SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment")
+        ).one()
+        info[_AUTO_INCREMENT_STEP] = (
+            int(increment) if int(lock_mode) in CONTIGUOUS_AUTOINC_LOCK_MODES else None
+        )
+    return info[_AUTO_INCREMENT_STEP]
+
+
+def supports_bulk_insert_states(session: Session) -> bool:
+    """Return if the ids of bulk inserted states can be known.
+
+    The ids are either returned in order, or on MariaDB and MySQL derived
+    from the first id of a multi-row insert when InnoDB assigns them
+    contiguously.
+    """
+    return _returns_ids_in_order(session) or _auto_increment_step(session) is not None
+
+
+def _row_params(obj: States | Events, columns: tuple[str, ...]) -> dict[str, Any]:
+    """Return the insert parameters of a row object.
+
+    Reading the instance dict bypasses the attribute instrumentation.
+    """
+    values = obj.__dict__
+    return {column: values.get(column) for column in columns}
+
+
+def _chunks[_T](rows: list[_T]) -> Iterable[list[_T]]:
+    """Split rows into chunks."""
+    for idx in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        yield rows[idx : idx + BULK_INSERT_CHUNK_SIZE]
+
+
+def bulk_insert_events(session: Session, events: list[Events]) -> None:
+    """Insert events with executemany, bypassing the unit of work.
+
+    The EventTypes and EventData rows the events reference must have been
+    flushed so their ids are known.
+    """
+    if not events:
+        return
+    # The class is looked up from the objects since older schemas are
+    # used when testing migrations
+    table = type(events[0]).__table__
+    columns = _insert_columns(table)
+    params: list[dict[str, Any]] = []
+    for dbevent in events:
+        row = _row_params(dbevent, columns)
+        if (event_type := dbevent.event_type_rel) is not None:
+            row["event_type_id"] = event_type.event_type_id
+        if (event_data := dbevent.event_data_rel) is not None:
+            row["data_id"] = event_data.data_id
+        params.append(row)
+    for chunk in _chunks(params):
+        session.execute(_insert_stmt(table), chunk)
+
+
+def bulk_insert_states(session: Session, states: list[States]) -> None:
+    """Insert states with executemany, bypassing the unit of work.
+
+    On MariaDB and MySQL the states are inserted with a multi-row insert
+    instead, the ids are derived from the first id of each statement.
+
+    The StatesMeta and StateAttributes rows the states reference must have
+    been flushed so their ids are known. The state_id of each inserted
+    state is set on the object.
+
+    A state can reference an old state which is inserted in the same batch,
+    those states are inserted in rounds once the state_id of their old state
+    is known.
+    """
+    if not states:
+        return
+    table = type(states[0]).__table__
+    columns = _insert_columns(table)
+    step = None if _returns_ids_in_order(session) else _auto_increment_step(session)
+    remaining = list(states)
+    # Like the save-update cascade of the unit of work, old states which
+    # were not added themselves are inserted as well
+    queued = {id(dbstate) for dbstate in remaining}
+    for dbstate in states:
+        old_state = dbstate.old_state
+        while (
+            old_state is not None
+            and old_state.state_id is None
+            and id(old_state) not in queued
+        ):
+            queued.add(id(old_state))
+            remaining.append(old_state)
+            old_state = old_state.old_state
+    while remaining:
+        deferred: list[States] = []
+        batch: list[States] = []
+        params: list[dict[str, Any]] = []
+        for dbstate in remaining:
+            row = _row_params(dbstate, columns)
+            if (old_state := dbstate.old_state) is not None:
+                if old_state.state_id is None:
+                    deferred.append(dbstate)
+                    continue
+                row["old_state_id"] = old_state.state_id
+            if (states_meta := dbstate.states_meta_rel) is not None:
+                row["metadata_id"] = states_meta.metadata_id
+            if (state_attributes := dbstate.state_attributes) is not None:
+                row["attributes_id"] = state_attributes.attributes_id
+            batch.append(dbstate)
+            params.append(row)
+        for batch_chunk, params_chunk in zip(
+            _chunks(batch), _chunks(params), strict=True
+        ):
+            for dbstate, state_id in zip(
+                batch_chunk,
+                _insert_ids(session, table, params_chunk, step),
+                strict=True,
+            ):
+                dbstate.state_id = state_id
+        remaining = deferred
+
+
+def _insert_ids(
+    session: Session, table: Table, params: list[dict[str, Any]], step: int | None
+) -> Iterable[int]:
+    """Insert rows and return their ids in order."""
+    if step is None:
+        return session.execute(_insert_returning_stmt(table), params).scalars()
+    # The last insert id of a multi-row insert is the id of its first row
+    first_id: int = session.execute(insert(table).values(params)).lastrowid
+    return range(first_id, first_id + len(params) * step, step)
@@ -0,0 +1,66 @@
+"""Schedule the commits of the recorder event session."""
+
+from __future__ import annotations
+
+from collections import deque
+
+
+class CommitScheduler:
+    """Decide when the event session is committed and time the commits.
+
+    A commit is due once max_pending_rows rows are pending, so bursts are
+    written in bounded transactions, or once the oldest pending row has
+    waited max_staleness seconds. No commits are made while idle.
+    """
+
+    def __init__(
+        self, max_pending_rows: int, max_staleness: float, max_samples: int
+    ) -> None:
+        """Init the scheduler."""
+        self.max_pending_rows = max_pending_rows
+        self.max_staleness = max_staleness
+        self.pending_rows = 0
+        self.commits = 0
+        self._first_pending_at: float | None = None
+        self._samples: deque[tuple[int, float]] = deque(maxlen=max_samples)
+
+    def add_pending_row(self, now: float) -> None:
+        """Count a row that will be written by the next commit."""
+        if self._first_pending_at is None:
+            self._first_pending_at = now
+        self.pending_rows += 1
+
+    def commit_due(self, now: float) -> bool:
+        """Return if the pending rows should be committed now."""
+        return self.pending_rows >= self.max_pending_rows or (
+            self._first_pending_at is not None
+            and now - self._first_pending_at >= self.max_staleness
+        )
+
+    def committed(self, duration: float) -> None:
+        """Record a commit of the pending rows which took duration seconds."""
+        self._samples.append((self.pending_rows, duration))
+        self.commits += 1
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the pending rows."""
+        self.pending_rows = 0
+        self._first_pending_at = None
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the number of commits and the size and duration of recent ones.
+
+        The durations are in ms.
+        """
+        if not (samples := list(self._samples)):
+            return {}
+        sizes = [size for size, _ in samples]
+        durations = [duration for _, duration in samples]
+        return {
+            "commits": self.commits,
+            "average_size": sum(sizes) / len(samples),
+            "max_size": max(sizes),
+            "average_duration": sum(durations) / len(samples) * 1000,
+            "max_duration": max(durations) * 1000,
+        }
@@ -30,11 +30,17 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 MAX_QUEUE_BACKLOG_MIN_VALUE = 65000
 MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG = 256 * 1024**2
 
+# The directory in the config directory the events are spooled to
+SPOOL_DIR = "recorder_spool"
+# The number of spooled events processed between reads of the spool
+SPOOL_REPLAY_BATCH_SIZE = 1000
+
 # The maximum number of rows (events) we purge in one delete statement
 
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -48,6 +54,10 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 49
+
+# The number of statistics the rollups are rebuilt for in one task
+STATISTICS_ROLLUPS_REBUILD_BATCH_SIZE = 10
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
@@ -8,6 +8,7 @@ from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -50,7 +51,14 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_insert import (
+    bulk_insert_events,
+    bulk_insert_states,
+    supports_bulk_insert_states,
+)
+from .commit import CommitScheduler
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
@@ -62,6 +70,8 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    SPOOL_DIR,
+    SPOOL_REPLAY_BATCH_SIZE,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -77,9 +87,12 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, DBJobTimings
+from .history.ring_buffer import HistoryRingBuffer
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .spool import EventSpool
+from .statistics_accumulator import StatisticsAccumulators
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -99,7 +112,9 @@ from .tasks import (
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
+    RebuildStatisticsRollupsTask,
     RecorderTask,
+    ReplaySpooledEventsTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -110,6 +125,7 @@ from .tasks import (
 from .util import (
     async_create_backup_failure_issue,
     build_mysqldb_conv,
+    create_read_only_sqlite_engine,
     dburl_to_path,
     end_incomplete_runs,
     is_second_sunday,
@@ -132,6 +148,7 @@ SHUTDOWN_TASK = object()
 
 COMMIT_TASK = CommitTask()
 KEEP_ALIVE_TASK = KeepAliveTask()
+REPLAY_SPOOLED_EVENTS_TASK = ReplaySpooledEventsTask()
 WAIT_TASK = WaitTask()
 ADJUST_LRU_SIZE_TASK = AdjustLRUSizeTask()
 
@@ -146,6 +163,19 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
 
+# SQLite in WAL mode allows concurrent readers, queries of history, logbook
+# and statistics run on read-only connections in a pool sized to the cores
+MAX_DB_READ_EXECUTOR_WORKERS = min(os.cpu_count() or 1, 8)
+# Prepared statements cached by each read-only connection
+READ_ONLY_CACHED_STATEMENTS = 256
+# Number of recent read jobs the timings are calculated from
+READ_JOB_TIMING_SAMPLES = 100
+# Commit early once this many rows are pending, bursts of events are
+# written in bounded transactions instead of waiting for the commit interval
+COMMIT_MAX_PENDING_ROWS = 1000
+# Number of recent commits the commit sizes and durations are calculated from
+COMMIT_TIMING_SAMPLES = 100
+
 
 class Recorder(threading.Thread):
     """A threaded recorder class."""
@@ -164,6 +194,12 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        history_cache_window: float = 0,
+        history_cache_max_memory: int = 0,
+        incremental_statistics: bool = False,
+        purge_by_day: bool = False,
+        spool_backlog: int = 0,
+        statistics_keep_days: int | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -174,6 +210,12 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        # Purge the oldest day of states, events and short term statistics
+        # by ranges of ids instead of by lists of ids
+        self.purge_by_day = purge_by_day
+        # Purge the hourly statistics older than statistics_keep_days once
+        # they are rolled up, None keeps them forever
+        self.statistics_keep_days = statistics_keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
@@ -192,6 +234,13 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
+        # Optional spool the events are written to instead of the queue once
+        # the backlog reaches spool_backlog, they are replayed in order when
+        # the database catches up
+        self.spool_backlog = spool_backlog
+        self.spool: EventSpool | None = (
+            EventSpool(hass.config.path(SPOOL_DIR)) if spool_backlog else None
+        )
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
         # The entity_filter is exposed on the recorder instance so that
@@ -200,9 +249,31 @@ class Recorder(threading.Thread):
         self.entity_filter = entity_filter
         self.exclude_event_types = exclude_event_types
 
+        # Optional in-memory buffer of the recently recorded states which
+        # answers history queries without a database round trip
+        self.history_ring_buffer: HistoryRingBuffer | None = None
+        if history_cache_window:
+            self.history_ring_buffer = HistoryRingBuffer(
+                history_cache_window, history_cache_max_memory
+            )
+
+        # Optional running aggregates of the recorded states which the
+        # statistics are compiled from instead of reading the states back
+        self.statistics_accumulators: StatisticsAccumulators | None = (
+            StatisticsAccumulators() if incremental_statistics else None
+        )
+
         self.schema_version = 0
         self._commits_without_expire = 0
+        # The commit interval is the maximum time a row waits to be committed
+        self.commit_scheduler = CommitScheduler(
+            COMMIT_MAX_PENDING_ROWS, commit_interval, COMMIT_TIMING_SAMPLES
+        )
         self._event_session_has_pending_writes = False
+        # States and events are not added to the session, they are
+        # bulk inserted when the session is committed
+        self._pending_states: list[States] = []
+        self._pending_events: list[Events] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -218,8 +289,14 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_ready = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.read_only_engine: Engine | None = None
+        self._get_read_only_session: Callable[[], Session] | None = None
+        self._read_worker_thread_ids: set[int] = set()
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self.read_job_timings = DBJobTimings(READ_JOB_TIMING_SAMPLES)
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -260,6 +337,11 @@ class Recorder(threading.Thread):
         """Get a new sqlalchemy session."""
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
+        if (
+            self._get_read_only_session is not None
+            and threading.get_ident() in self._read_worker_thread_ids
+        ):
+            return self._get_read_only_session()
         return self._get_session()
 
     def queue_task(self, task: RecorderTask | Event) -> None:
@@ -279,12 +361,24 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        if self.read_only_engine is not None:
+            self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+                self._read_worker_thread_ids,
+                thread_name_prefix=DB_READ_WORKER_PREFIX,
+                max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+                shutdown_hook=self._shutdown_read_only_pool,
+            )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
         if self.engine and hasattr(self.engine.pool, "shutdown"):
             self.engine.pool.shutdown()
 
+    def _shutdown_read_only_pool(self) -> None:
+        """Close the read-only dbpool connections in the current thread."""
+        if self.read_only_engine and hasattr(self.read_only_engine.pool, "shutdown"):
+            self.read_only_engine.pool.shutdown()
+
     @callback
     def async_initialize(self) -> None:
         """Initialize the recorder."""
@@ -292,6 +386,26 @@ class Recorder(threading.Thread):
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
 
+        if (spool := self.spool) is not None:
+            queue_put_nowait = queue_put
+            queue_size = self._queue.qsize
+            spool_backlog = self.spool_backlog
+
+            @callback
+            def queue_put(event: Event) -> None:
+                """Spool the event once the backlog reached spool_backlog."""
+                if not spool.active:
+                    if queue_size() < spool_backlog:
+                        queue_put_nowait(event)
+                        return
+                    _LOGGER.debug("Recorder backlog is spooled to %s", spool.path)
+                    spool.start()
+                    queue_put_nowait(REPLAY_SPOOLED_EVENTS_TASK)
+                if not spool.append(event):
+                    queue_put_nowait(event)
+                elif spool.start_preparing_segment():
+                    self.hass.async_add_executor_job(spool.prepare_segment)
+
         @callback
         def _event_listener(event: Event) -> None:
             """Listen for new events and put them in the process queue."""
@@ -353,6 +467,23 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add an executor job which only reads from the database.
+
+        With SQLite, the job runs in the read-only connection pool. Its queue
+        wait and run time are recorded in read_job_timings.
+        """
+        return self.hass.loop.run_in_executor(
+            self._db_read_executor or self._db_executor,
+            self.read_job_timings.run_job,
+            time.monotonic(),
+            target,
+            *args,
+        )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -360,6 +491,8 @@ class Recorder(threading.Thread):
         The queue grows during migration or if something really goes wrong.
         """
         _LOGGER.debug("Recorder queue size is: %s", self.backlog)
+        if self.spool:
+            _LOGGER.debug("Recorder spool size is: %s", len(self.spool))
         if not self._reached_max_backlog():
             return
         _LOGGER.error(
@@ -542,6 +675,16 @@ class Recorder(threading.Thread):
         start = statistics.get_start_time()
         self.queue_task(StatisticsTask(start, True))
 
+    def queue_statistics_rollups_rebuild(self) -> None:
+        """Stop reading the statistics rollups and rebuild them.
+
+        This method is thread-safe.
+        """
+        if not self.statistics_rollups_ready:
+            return
+        self.statistics_rollups_ready = False
+        self.queue_task(RebuildStatisticsRollupsTask(0))
+
     @callback
     def async_adjust_statistics(
         self,
@@ -685,8 +828,21 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
+        self.commit_scheduler.add_pending_row(time.monotonic())
         session.add(obj)
 
+    def _add_pending_state(self, dbstate: States) -> None:
+        """Add a state to be inserted when the session is committed."""
+        self._event_session_has_pending_writes = True
+        self.commit_scheduler.add_pending_row(time.monotonic())
+        self._pending_states.append(dbstate)
+
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Add an event to be inserted when the session is committed."""
+        self._event_session_has_pending_writes = True
+        self.commit_scheduler.add_pending_row(time.monotonic())
+        self._pending_events.append(dbevent)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -706,6 +862,9 @@ class Recorder(threading.Thread):
         self.thread_id = thread_id
         self.recorder_and_worker_thread_ids.add(thread_id)
 
+        if self.spool is not None:
+            self.spool.recover()
+
         setup_result = self._setup_recorder()
 
         if not setup_result:
@@ -821,6 +980,9 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
+        if self.spool is not None:
+            # The events spooled by the previous run are older than the queue
+            self._replay_recovered_events()
         startup_task_or_events: list[RecorderTask | Event] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
@@ -836,6 +998,20 @@ class Recorder(threading.Thread):
         while not self.stop_requested:
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
+    def _replay_spooled_events(self) -> None:
+        """Process the spooled events until the spool is empty."""
+        assert self.spool is not None
+        while events := self.spool.take(SPOOL_REPLAY_BATCH_SIZE):
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+
+    def _replay_recovered_events(self) -> None:
+        """Process the events spooled by the previous run."""
+        assert self.spool is not None
+        while events := self.spool.take_recovered(SPOOL_REPLAY_BATCH_SIZE):
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
@@ -1030,8 +1206,11 @@ class Recorder(threading.Thread):
             self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
-        # Commit if the commit interval is zero
-        if not self.commit_interval:
+        # Commit if the commit interval is zero, too many rows are pending
+        # or the oldest pending row waited for the commit interval
+        if not self.commit_interval or self.commit_scheduler.commit_due(
+            time.monotonic()
+        ):
             self._commit_event_session_or_retry()
 
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
@@ -1053,7 +1232,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1078,7 +1257,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1159,8 +1338,28 @@ class Recorder(threading.Thread):
             state_attributes_manager.add_pending(dbstate_attributes)
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
+        state_attributes_manager.mark_used(
+            shared_attrs,
+            dbstate.last_updated_ts,  # type: ignore[arg-type]
+        )
+
+        self._add_pending_state(dbstate)
+
+        if self.history_ring_buffer is not None:
+            self.history_ring_buffer.add(
+                entity_id,
+                dbstate.state,
+                shared_attrs,
+                dbstate.last_updated_ts,  # type: ignore[arg-type]
+                dbstate.last_changed_ts or dbstate.last_updated_ts,  # type: ignore[arg-type]
+            )
 
-        self._add_to_session(session, dbstate)
+        if self.statistics_accumulators is not None:
+            self.statistics_accumulators.add_state(
+                entity_id,
+                event.data["new_state"],
+                dbstate.last_updated_ts,  # type: ignore[arg-type]
+            )
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1207,6 +1406,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_started = time.monotonic()
+
+        if self._pending_states or self._pending_events:
+            self._insert_pending_rows(session)
 
         if (
             pending_last_reported
@@ -1226,6 +1429,7 @@ class Recorder(threading.Thread):
         session.commit()
 
         self._event_session_has_pending_writes = False
+        self.commit_scheduler.committed(time.monotonic() - commit_started)
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
         # many selects for matching attributes by loading them
@@ -1243,6 +1447,32 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             session.expire_all()
 
+    def _insert_pending_rows(self, session: Session) -> None:
+        """Insert the pending states and events.
+
+        The states and events are inserted with executemany which avoids
+        the overhead of the unit of work. If the ids of bulk inserted states
+        can't be known, as with the interleaved InnoDB lock mode MySQL 8 uses
+        by default, the states are added to the session instead since their
+        ids are needed.
+        """
+        pending_states = self._pending_states
+        if not (bulk_states := supports_bulk_insert_states(session)):
+            session.add_all(pending_states)
+        # Flush the rows the states and events reference so their ids are known
+        session.flush()
+        try:
+            if bulk_states:
+                bulk_insert_states(session, pending_states)
+            bulk_insert_events(session, self._pending_events)
+        except SQLAlchemyError:
+            # The rows are inserted again when the commit is retried
+            for dbstate in pending_states:
+                dbstate.state_id = None
+            raise
+        self._pending_states = []
+        self._pending_events = []
+
     def _handle_sqlite_corruption(self, setup_run: bool) -> None:
         """Handle the sqlite3 database being corrupt."""
         try:
@@ -1263,6 +1493,16 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_states.clear()
+        self._pending_events.clear()
+        self.commit_scheduler.reset()
+        if self.history_ring_buffer is not None:
+            # Uncommitted states are rolled back
+            self.history_ring_buffer.clear()
+        if self.statistics_accumulators is not None:
+            # The aggregates are rebuilt once the state at the start
+            # of a period is known again
+            self.statistics_accumulators.clear()
 
         if not self.event_session:
             return
@@ -1426,14 +1666,33 @@ class Recorder(threading.Thread):
         migration.pre_migrate_schema(self.engine)
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
+        if self._using_file_sqlite:
+            self._setup_read_only_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_only_connection(self) -> None:
+        """Set up the engine of the read-only connection pool."""
+        assert not self.read_only_engine
+        self.read_only_engine = create_read_only_sqlite_engine(
+            self.db_url,
+            MAX_DB_READ_EXECUTOR_WORKERS,
+            self._read_worker_thread_ids,
+            READ_ONLY_CACHED_STATEMENTS,
+        )
+        self._get_read_only_session = scoped_session(
+            sessionmaker(bind=self.read_only_engine, future=True)
+        )
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
             self.engine.dispose()
             self.engine = None
         self._get_session = None
+        if self.read_only_engine:
+            self.read_only_engine.dispose()
+            self.read_only_engine = None
+        self._get_read_only_session = None
 
     def _setup_run(self) -> None:
         """Log the start of the current run and schedule any needed jobs."""
@@ -1480,13 +1739,20 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
+            executors = [
+                executor
+                for executor in (self._db_executor, self._db_read_executor)
+                if executor
+            ]
+            for executor in executors:
                 # We shutdown the executor without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            if self.spool is not None:
+                self.spool.close()
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
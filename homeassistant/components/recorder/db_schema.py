@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 48
+SCHEMA_VERSION = 49
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,7 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_ROLLUPS = "statistics_rollups"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +117,7 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_ROLLUPS,
 ]
 
 TABLES_TO_CHECK = [
@@ -834,6 +836,51 @@ class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollups(Base):
+    """Long term statistics reduced to days, weeks and months.
+
+    The periods are aligned to the configured time zone.
+    """
+
+    __table_args__ = (
+        # Used for fetching the rollups of a statistic during a period
+        Index(
+            "ix_statistics_rollups_metadata_id_period_start_ts",
+            "metadata_id",
+            "period",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_ROLLUPS
+    id: Mapped[int] = mapped_column(ID_TYPE, Identity(), primary_key=True)
+    metadata_id: Mapped[int | None] = mapped_column(
+        ID_TYPE,
+        ForeignKey(f"{TABLE_STATISTICS_META}.id", ondelete="CASCADE"),
+    )
+    period: Mapped[int] = mapped_column(SmallInteger)  # 0 is day, 1 week, 2 month
+    start_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    end_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    mean: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    # The number of hourly means averaged, to merge the next hour into mean
+    mean_count: Mapped[int | None] = mapped_column(Integer)
+    min: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    max: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    last_reset_ts: Mapped[float | None] = mapped_column(TIMESTAMP_TYPE)
+    state: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+    sum: Mapped[float | None] = mapped_column(DOUBLE_TYPE)
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            "<recorder.StatisticsRollups("
+            f"id={self.id}, metadata_id={self.metadata_id}, "
+            f"period={self.period}, start_ts={self.start_ts}"
+            ")>"
+        )
+
+
 class _StatisticsMeta:
     """Statistics meta data."""
 
@@ -58,6 +58,11 @@ def update_states_metadata(
     new_entity_id: str,
 ) -> None:
     """Update the states metadata table when an entity is renamed."""
+    if (history_ring_buffer := instance.history_ring_buffer) is not None:
+        # The history of the entity moves to the new entity_id in the database
+        history_ring_buffer.remove((entity_id, new_entity_id))
+    if (statistics_accumulators := instance.statistics_accumulators) is not None:
+        statistics_accumulators.remove((entity_id, new_entity_id))
     states_meta_manager = instance.states_meta_manager
     if not states_meta_manager.active:
         _LOGGER.warning(
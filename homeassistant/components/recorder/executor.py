@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
+import time
 from typing import Any
 import weakref
 
@@ -71,3 +73,36 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class DBJobTimings:
+    """Queue wait and run times of the most recent database jobs."""
+
+    def __init__(self, max_samples: int) -> None:
+        """Init the timings."""
+        self._samples: deque[tuple[float, float]] = deque(maxlen=max_samples)
+
+    def run_job[_T](
+        self, queued_at: float, target: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run a job which was queued at queued_at and record its timings."""
+        started_at = time.monotonic()
+        try:
+            return target(*args)
+        finally:
+            self._samples.append(
+                (started_at - queued_at, time.monotonic() - started_at)
+            )
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the average and maximum queue wait and run time in ms."""
+        if not (samples := list(self._samples)):
+            return {}
+        waits = [wait for wait, _ in samples]
+        runs = [run for _, run in samples]
+        return {
+            "average_wait": sum(waits) / len(samples) * 1000,
+            "max_wait": max(waits) * 1000,
+            "average_run": sum(runs) / len(samples) * 1000,
+            "max_run": max(runs) * 1000,
+        }
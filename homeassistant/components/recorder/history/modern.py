@@ -6,6 +6,7 @@ from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
+import time
 from typing import Any, cast
 
 from sqlalchemy import (
@@ -121,6 +122,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -136,6 +138,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -216,6 +219,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -227,6 +231,9 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points limits the number of numeric states returned per entity, see
+    _m4_downsampled_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
@@ -256,6 +263,38 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = start_time.timestamp()
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    buckets: tuple[float, float] | None = None
+    if max_points:
+        # Each bucket returns up to four states, its first, last, minimum
+        # and maximum
+        buckets = (
+            start_time_ts,
+            ((end_time_ts or time.time()) - start_time_ts) / max(max_points // 4, 1),
+        )
+    if (history_ring_buffer := instance.history_ring_buffer) is not None and (
+        buffered := history_ring_buffer.significant_states(
+            [
+                entity_id
+                for entity_id, metadata_id in entity_id_to_metadata_id.items()
+                if metadata_id is not None
+            ],
+            start_time_ts,
+            end_time_ts,
+            significant_changes_only,
+            include_start_time_state,
+            no_attributes,
+        )
+    ) is not None:
+        return _sorted_states_to_dict(
+            buffered.rows,
+            start_time_ts if include_start_time_state else None,
+            entity_ids,
+            buffered.entity_id_to_metadata_id,
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+            buckets=buckets,
+        )
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -286,6 +325,7 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        buckets=buckets,
     )
 
 
@@ -678,6 +718,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    buckets: tuple[float, float] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -689,6 +730,9 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    buckets is the start and the width of the buckets the numeric states
+    are downsampled to, see _m4_downsampled_rows.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -729,6 +773,10 @@ def _sorted_states_to_dict(
     # Append all changes to it
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
+        if buckets:
+            group = _m4_downsampled_rows(
+                group, state_idx, last_updated_ts_idx, *buckets
+            )
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -814,3 +862,55 @@ def _sorted_states_to_dict(
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
+
+
+def _m4_downsampled_rows(
+    rows: Iterator[Row],
+    state_idx: int,
+    last_updated_ts_idx: int,
+    start_time_ts: float,
+    bucket_width: float,
+) -> Iterator[Row]:
+    """Downsample the rows of an entity as they are fetched from the cursor.
+
+    The rows are split into buckets of bucket_width seconds from start_time_ts
+    and only the first, last, minimum and maximum rows of each bucket are
+    yielded, in order (M4). Rows with a non numeric state, like unavailable,
+    are always yielded as they mark a gap in the graph.
+    """
+    bucket: int | None = None
+    # The rows of the bucket by their position in the rows
+    first_row: tuple[int, Row] | None = None
+    last_row = min_row = max_row = (0, None)
+    min_value = max_value = 0.0
+    for pos, row in enumerate(rows):
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            if first_row is not None:
+                yield from _ordered_bucket_rows(first_row, min_row, max_row, last_row)
+                first_row = bucket = None
+            yield row
+            continue
+        row_bucket = int((row[last_updated_ts_idx] - start_time_ts) // bucket_width)
+        if row_bucket != bucket:
+            if first_row is not None:
+                yield from _ordered_bucket_rows(first_row, min_row, max_row, last_row)
+            bucket = row_bucket
+            first_row = last_row = min_row = max_row = (pos, row)
+            min_value = max_value = value
+            continue
+        last_row = (pos, row)
+        if value < min_value:
+            min_row = last_row
+            min_value = value
+        elif value > max_value:
+            max_row = last_row
+            max_value = value
+    if first_row is not None:
+        yield from _ordered_bucket_rows(first_row, min_row, max_row, last_row)
+
+
+def _ordered_bucket_rows(*bucket_rows: tuple[int, Row | None]) -> list[Row]:
+    """Return the distinct rows of a bucket in order."""
+    return [row for _, row in sorted(dict(bucket_rows).items())]  # type: ignore[misc]
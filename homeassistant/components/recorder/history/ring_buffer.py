@@ -0,0 +1,329 @@
+"""In-memory ring buffer of recently recorded states for history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+from collections.abc import Iterable
+from functools import lru_cache
+import logging
+import sys
+import threading
+from typing import Any, NamedTuple
+
+from homeassistant.core import split_entity_id
+
+from .const import SIGNIFICANT_DOMAINS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Estimated size of a row, two doubles in the timestamp arrays plus
+# two pointers in the state and attributes lists
+ROW_SIZE_ESTIMATE = 32
+
+# When the memory cap is reached, the cutoff is advanced by this
+# fraction of the window until the buffer fits again
+EVICTION_STEP = 0.1
+
+# Check the memory cap every this many rows
+EVICTION_CHECK_INTERVAL = 1024
+
+
+@lru_cache
+def _row_type(include_last_changed: bool, include_attributes: bool) -> type[tuple]:
+    """Return a row type with the columns the database query would return.
+
+    LazyState and row_to_compressed_state look up the optional
+    last_changed_ts and attributes columns by name.
+    """
+    fields = ["metadata_id", "state", "last_updated_ts"]
+    if include_last_changed:
+        fields.append("last_changed_ts")
+    if include_attributes:
+        fields.append("attributes")
+    return namedtuple("BufferedStateRow", fields)  # type: ignore[misc]  # noqa: PYI024
+
+
+class BufferedStates(NamedTuple):
+    """Rows of states read from the ring buffer."""
+
+    rows: list[tuple]
+    entity_id_to_metadata_id: dict[str, int | None]
+
+
+class _EntityStates:
+    """Columnar history of the recorded states of an entity."""
+
+    __slots__ = ("attributes", "last_changed_ts", "last_updated_ts", "states")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+        self.attributes: list[str] = []
+
+    def evict(self, count: int) -> None:
+        """Evict the oldest rows."""
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.states[:count]
+        del self.attributes[:count]
+
+
+class HistoryRingBuffer:
+    """Ring buffer of the states written by the recorder.
+
+    The states are kept per entity in columns, identical attributes
+    share one string. Rows older than
+    the window are evicted, as are the oldest rows when the estimated
+    memory use exceeds the cap.
+
+    The buffer is written by the recorder thread and read by the
+    database executor threads.
+    """
+
+    def __init__(self, window: float, max_memory: int) -> None:
+        """Initialize the ring buffer.
+
+        window is the number of seconds of history to keep, max_memory the
+        maximum estimated memory use in bytes.
+        """
+        self.window = window
+        self.max_memory = max_memory
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityStates] = {}
+        # Shared attributes and the number of rows using them
+        self._attributes: dict[str, str] = {}
+        self._attributes_refs: dict[str, int] = {}
+        self._attributes_size = 0
+        self._rows = 0
+        self._rows_since_eviction_check = 0
+        self._cutoff_ts = 0.0
+
+    @property
+    def memory_estimate(self) -> int:
+        """Return the estimated memory use in bytes."""
+        return self._rows * ROW_SIZE_ESTIMATE + self._attributes_size
+
+    def add(
+        self,
+        entity_id: str,
+        state: str | None,
+        shared_attrs: str,
+        last_updated_ts: float,
+        last_changed_ts: float,
+    ) -> None:
+        """Add a recorded state."""
+        with self._lock:
+            if (entity_states := self._entities.get(entity_id)) is None:
+                entity_states = self._entities[entity_id] = _EntityStates()
+            elif (
+                entity_states.last_updated_ts
+                and entity_states.last_updated_ts[-1] > last_updated_ts
+            ):
+                # States are expected in order, an out of order state
+                # means we can no longer answer for this entity
+                self._remove_entity(entity_id)
+                return
+            if (existing_attrs := self._attributes.get(shared_attrs)) is None:
+                self._attributes[shared_attrs] = shared_attrs
+                self._attributes_refs[shared_attrs] = 1
+                self._attributes_size += sys.getsizeof(shared_attrs)
+            else:
+                shared_attrs = existing_attrs
+                self._attributes_refs[shared_attrs] += 1
+            entity_states.last_updated_ts.append(last_updated_ts)
+            entity_states.last_changed_ts.append(last_changed_ts)
+            entity_states.states.append(state)
+            entity_states.attributes.append(shared_attrs)
+            self._rows += 1
+            self._rows_since_eviction_check += 1
+            if self._rows_since_eviction_check >= EVICTION_CHECK_INTERVAL:
+                self._rows_since_eviction_check = 0
+                self._evict(last_updated_ts)
+
+    def entity_ids(self) -> list[str]:
+        """Return the buffered entity ids."""
+        with self._lock:
+            return list(self._entities)
+
+    def remove(self, entity_ids: Iterable[str]) -> None:
+        """Remove entities, for example when they are renamed."""
+        with self._lock:
+            for entity_id in entity_ids:
+                self._remove_entity(entity_id)
+
+    def evict_before(self, cutoff_ts: float) -> None:
+        """Evict all rows older than cutoff_ts, for example when purging."""
+        with self._lock:
+            for entity_id in list(self._entities):
+                entity_states = self._entities[entity_id]
+                self._evict_entity(
+                    entity_id,
+                    entity_states,
+                    bisect_left(entity_states.last_updated_ts, cutoff_ts),
+                )
+
+    def clear(self) -> None:
+        """Clear the buffer."""
+        with self._lock:
+            self._entities.clear()
+            self._attributes.clear()
+            self._attributes_refs.clear()
+            self._attributes_size = 0
+            self._rows = 0
+            self._cutoff_ts = 0.0
+
+    def _remove_entity(self, entity_id: str) -> None:
+        """Remove an entity."""
+        if (entity_states := self._entities.get(entity_id)) is not None:
+            self._evict_entity(entity_id, entity_states, len(entity_states.states))
+
+    def _evict_entity(
+        self, entity_id: str, entity_states: _EntityStates, count: int
+    ) -> None:
+        """Evict the oldest rows of an entity."""
+        if count <= 0:
+            return
+        for shared_attrs in entity_states.attributes[:count]:
+            if (remaining := self._attributes_refs[shared_attrs] - 1) == 0:
+                del self._attributes[shared_attrs]
+                del self._attributes_refs[shared_attrs]
+                self._attributes_size -= sys.getsizeof(shared_attrs)
+            else:
+                self._attributes_refs[shared_attrs] = remaining
+        entity_states.evict(count)
+        self._rows -= count
+        if not entity_states.states:
+            del self._entities[entity_id]
+
+    def _evict(self, now_ts: float) -> None:
+        """Evict rows outside the window or over the memory cap.
+
+        The last row before the cutoff is kept for each entity so the
+        state at the start of a query inside the window is known.
+        """
+        window_cutoff_ts = cutoff_ts = max(self._cutoff_ts, now_ts - self.window)
+        step = self.window * EVICTION_STEP
+        while True:
+            for entity_id in list(self._entities):
+                entity_states = self._entities[entity_id]
+                self._evict_entity(
+                    entity_id,
+                    entity_states,
+                    bisect_left(entity_states.last_updated_ts, cutoff_ts) - 1,
+                )
+            if self.memory_estimate <= self.max_memory or cutoff_ts >= now_ts:
+                break
+            cutoff_ts = min(cutoff_ts + step, now_ts)
+        if cutoff_ts > window_cutoff_ts:
+            _LOGGER.debug(
+                "History ring buffer memory cap of %s bytes reached, "
+                "evicted states older than %s",
+                self.max_memory,
+                cutoff_ts,
+            )
+        self._cutoff_ts = cutoff_ts
+
+    def significant_states(
+        self,
+        entity_ids: list[str],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        no_attributes: bool,
+    ) -> BufferedStates | None:
+        """Return the rows a significant states query would return.
+
+        Returns None if the buffer does not hold all the states of the
+        entities for the period, the database has to be queried instead.
+
+        The rows are ordered by entity and last_updated_ts and use
+        synthetic metadata_ids.
+        """
+        include_last_changed = not significant_changes_only
+        row_type = _row_type(include_last_changed, not no_attributes)
+        rows: list[tuple] = []
+        entity_id_to_metadata_id: dict[str, int | None] = {}
+        with self._lock:
+            if start_time_ts < self._cutoff_ts:
+                return None
+            for metadata_id, entity_id in enumerate(entity_ids):
+                if (entity_states := self._entities.get(entity_id)) is None or not (
+                    entity_states.last_updated_ts[0] < start_time_ts
+                ):
+                    return None
+                entity_id_to_metadata_id[entity_id] = metadata_id
+                rows.extend(
+                    self._entity_rows(
+                        row_type,
+                        metadata_id,
+                        entity_states,
+                        split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS,
+                        start_time_ts,
+                        end_time_ts,
+                        significant_changes_only,
+                        include_start_time_state,
+                        include_last_changed,
+                        no_attributes,
+                    )
+                )
+        return BufferedStates(rows, entity_id_to_metadata_id)
+
+    @staticmethod
+    def _entity_rows(
+        row_type: type[tuple],
+        metadata_id: int,
+        entity_states: _EntityStates,
+        significant_domain: bool,
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+        include_last_changed: bool,
+        no_attributes: bool,
+    ) -> list[tuple]:
+        """Return the rows of an entity for the period."""
+        last_updated = entity_states.last_updated_ts
+        last_changed = entity_states.last_changed_ts
+        states = entity_states.states
+        attributes = entity_states.attributes
+        first = bisect_right(last_updated, start_time_ts)
+        last = (
+            bisect_left(last_updated, end_time_ts) if end_time_ts else len(last_updated)
+        )
+        columns: list[Any]
+        rows: list[tuple] = []
+        if include_start_time_state:
+            # Like the database query, the start state has no timestamps
+            # and the start time is used instead
+            idx = bisect_left(last_updated, start_time_ts) - 1
+            columns = [metadata_id, states[idx], 0]
+            if include_last_changed:
+                columns.append(0)
+            if not no_attributes:
+                columns.append(attributes[idx])
+            rows.append(row_type(*columns))
+        for idx in range(first, last):
+            if (
+                significant_changes_only
+                and not significant_domain
+                and last_changed[idx] != last_updated[idx]
+            ):
+                continue
+            columns = [metadata_id, states[idx], last_updated[idx]]
+            if include_last_changed:
+                # Like the database, last_changed_ts is only set if it
+                # differs from last_updated_ts
+                columns.append(
+                    None
+                    if last_changed[idx] == last_updated[idx]
+                    else last_changed[idx]
+                )
+            if not no_attributes:
+                columns.append(attributes[idx])
+            rows.append(row_type(*columns))
+        return rows
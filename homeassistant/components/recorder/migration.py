@@ -54,6 +54,8 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_REBUILD_BATCH_SIZE,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -77,6 +79,7 @@ from .db_schema import (
     StatesMeta,
     Statistics,
     StatisticsMeta,
+    StatisticsRollups,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -102,7 +105,11 @@ from .queries import (
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import cleanup_statistics_timestamp_migration, get_start_time
+from .statistics import (
+    cleanup_statistics_timestamp_migration,
+    get_start_time,
+    rebuild_statistics_rollups,
+)
 from .tasks import RecorderTask
 from .util import (
     database_job_retry_wrapper,
@@ -1987,6 +1994,13 @@ class _SchemaVersion48Migrator(_SchemaVersionMigrator, target_version=48):
         _migrate_columns_to_timestamp(self.instance, self.session_maker, self.engine)
 
 
+class _SchemaVersion49Migrator(_SchemaVersionMigrator, target_version=49):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # The statistics_rollups table is populated by StatisticsRollupsMigration
+        cast(Table, StatisticsRollups.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2971,6 +2985,52 @@ class EntityIDPostMigration(BaseMigrationWithQuery, BaseOffLineMigration):
         return has_used_states_entity_ids()
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigration):
+    """Migration to compute the rollups of the existing long term statistics."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    max_initial_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION - 1
+    migration_id = "statistics_rollups"
+
+    def __init__(
+        self,
+        *,
+        initial_schema_version: int,
+        start_schema_version: int,
+        migration_changes: dict[str, int],
+    ) -> None:
+        """Initialize a new StatisticsRollupsMigration."""
+        super().__init__(
+            initial_schema_version=initial_schema_version,
+            start_schema_version=start_schema_version,
+            migration_changes=migration_changes,
+        )
+        self._start_metadata_id = 0
+
+    def migrate_data_impl(self, instance: Recorder) -> DataMigrationStatus:
+        """Compute the rollups of some statistics, return True if completed."""
+        _LOGGER.debug("Computing statistics rollups")
+        next_metadata_id = rebuild_statistics_rollups(
+            instance, self._start_metadata_id, STATISTICS_ROLLUPS_REBUILD_BATCH_SIZE
+        )
+        is_done = next_metadata_id is None
+        if next_metadata_id is not None:
+            self._start_metadata_id = next_metadata_id
+        _LOGGER.debug("Computing statistics rollups: done=%s", is_done)
+        return DataMigrationStatus(needs_migrate=not is_done, migration_done=is_done)
+
+    def migration_done(self, instance: Recorder, session: Session) -> None:
+        """Start reading the statistics rollups."""
+        instance.statistics_rollups_ready = True
+
+    def needs_migrate_impl(
+        self, instance: Recorder, session: Session
+    ) -> DataMigrationStatus:
+        """Return if the migration needs to run."""
+        # The rollups can't be checked without computing them
+        return DataMigrationStatus(needs_migrate=True, migration_done=False)
+
+
 NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
     StatesContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
     EventsContextIDMigration,  # Introduced in HA Core 2023.4 by PR #88942
@@ -2981,6 +3041,7 @@ NON_LIVE_DATA_MIGRATORS: tuple[type[BaseOffLineMigration], ...] = (
 
 LIVE_DATA_MIGRATORS: tuple[type[BaseRunTimeMigration], ...] = (
     EventIDPostMigration,  # Introduced in HA Core 2023.4 by PR #89901
+    StatisticsRollupsMigration,
 )
 
 
@@ -46,7 +46,7 @@ class RecorderPool(SingletonThreadPool, NullPool):
         **kw: Any,
     ) -> None:
         """Create the pool."""
-        kw["pool_size"] = POOL_SIZE
+        kw.setdefault("pool_size", POOL_SIZE)
         assert recorder_and_worker_thread_ids is not None, (
             "recorder_and_worker_thread_ids is required"
         )
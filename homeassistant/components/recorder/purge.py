@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import time
 from typing import TYPE_CHECKING
 
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
@@ -22,23 +24,40 @@ from .queries import (
     delete_event_data_rows,
     delete_event_rows,
     delete_event_types_rows,
+    delete_events_range,
     delete_recorder_runs_rows,
+    delete_short_term_statistics_range,
     delete_states_attributes_rows,
     delete_states_meta_rows,
+    delete_states_range,
     delete_states_rows,
+    delete_statistics_rows,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_in_range,
+    find_events_range_end,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_max_event_id,
+    find_max_short_term_statistics_id,
+    find_max_state_id,
+    find_oldest_event,
+    find_oldest_short_term_statistic,
+    find_oldest_state,
+    find_short_term_statistics_in_range,
+    find_short_term_statistics_range_end,
     find_short_term_statistics_to_purge,
+    find_states_in_range,
+    find_states_range_end,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_statistics_to_purge,
 )
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
@@ -51,6 +70,10 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE = 10
+
+# With purge_by_day, the rows of this period are purged as one range of ids
+DAY_RANGE = timedelta(days=1).total_seconds()
 
 
 @retryable_database_job("purge")
@@ -70,6 +93,8 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if (history_ring_buffer := instance.history_ring_buffer) is not None:
+        history_ring_buffer.evict_before(purge_before.timestamp())
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -85,26 +110,59 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+            if instance.purge_by_day:
+                has_more_to_purge |= _purge_states_day_range(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_day_range(
+                    instance, session, events_batch_size, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
         )
-        short_term_statistics = _select_short_term_statistics_to_purge(
-            session, purge_before, instance.max_bind_vars
-        )
+        short_term_statistics: list[int] = []
+        if instance.purge_by_day:
+            has_more_to_purge |= _purge_short_term_statistics_day_range(
+                instance, session, purge_before
+            )
+        else:
+            short_term_statistics = _select_short_term_statistics_to_purge(
+                session, purge_before, instance.max_bind_vars
+            )
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
 
         if short_term_statistics:
             _purge_short_term_statistics(session, short_term_statistics)
 
-        if has_more_to_purge or statistics_runs or short_term_statistics:
+        # The hourly statistics are only purged once they are rolled up,
+        # the daily, weekly and monthly rollups are then kept forever
+        hourly_statistics: list[int] = []
+        if (
+            statistics_keep_days := instance.statistics_keep_days
+        ) is not None and instance.statistics_rollups_ready:
+            hourly_statistics = _select_statistics_to_purge(
+                session,
+                dt_util.utcnow() - timedelta(days=statistics_keep_days),
+                instance.max_bind_vars,
+            )
+        if hourly_statistics:
+            _purge_statistics(session, hourly_statistics)
+
+        if (
+            has_more_to_purge
+            or statistics_runs
+            or short_term_statistics
+            or hourly_statistics
+        ):
             # Return false, as we might not be done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
@@ -203,7 +261,7 @@ def _purge_states_and_attributes_ids(
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
-    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    _purge_unused_attributes_ids(instance, session, attributes_ids_batch, purge_before)
     _LOGGER.debug(
         "After purging states and attributes_ids remaining=%s",
         has_remaining_state_ids_to_purge,
@@ -246,6 +304,198 @@ def _purge_events_and_data_ids(
     return has_remaining_event_ids_to_purge
 
 
+def _find_day_range(
+    session: Session,
+    find_oldest: StatementLambdaElement,
+    find_range_end: Callable[[float], StatementLambdaElement],
+    find_max_id: StatementLambdaElement,
+    purge_before: datetime,
+) -> tuple[int, float] | None:
+    """Return the end id and end timestamp of the oldest day of rows to purge.
+
+    Rows are written in order, so the rows of a day are a range of ids which
+    can be deleted by ranges of ids, like a partition. Returns None if there
+    are no rows to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    oldest_ts = session.execute(find_oldest).scalar()
+    if oldest_ts is None or oldest_ts >= purge_before_ts:
+        return None
+    end_ts = min(oldest_ts + DAY_RANGE, purge_before_ts)
+    if (end_id := session.execute(find_range_end(end_ts)).scalar()) is None:
+        # All rows are older than end_ts
+        end_id = session.execute(find_max_id).scalar() + 1
+    return end_id, end_ts
+
+
+def _purge_states_day_range(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the states of the oldest day and their unused attributes.
+
+    The states are deleted in ranges of up to max_bind_vars state ids with a
+    commit after each range. Returns true if there are more states to purge.
+    """
+    if (
+        day_range := _find_day_range(
+            session,
+            find_oldest_state(),
+            find_states_range_end,
+            find_max_state_id(),
+            purge_before,
+        )
+    ) is None:
+        return False
+    end_state_id, end_ts = day_range
+    attributes_ids_batch: set[int] = set()
+    max_bind_vars = instance.max_bind_vars
+    has_purged_states = False
+    for _ in range(states_batch_size):
+        rows = session.execute(
+            find_states_in_range(end_state_id, end_ts, max_bind_vars)
+        ).all()
+        if not rows:
+            break
+        has_purged_states = True
+        state_ids = {state_id for state_id, _ in rows}
+        attributes_ids_batch |= {
+            attributes_id for _, attributes_id in rows if attributes_id
+        }
+        # See _purge_state_ids for why the states are disconnected first
+        session.execute(disconnect_states_rows(state_ids))
+        # The rows are the first states of the day ordered by state_id, so
+        # the range from the first to the last one holds no other states of
+        # the day
+        first_state_id, last_state_id = rows[0][0], rows[-1][0]
+        deleted_rows = session.execute(
+            delete_states_range(first_state_id, last_state_id, end_ts)
+        ).rowcount
+        _LOGGER.debug(
+            "Deleted %s states from state_id %s to %s",
+            deleted_rows,
+            first_state_id,
+            last_state_id,
+        )
+        instance.states_manager.evict_purged_state_ids(state_ids)
+        session.commit()
+    _purge_unused_attributes_ids(instance, session, attributes_ids_batch, purge_before)
+    if not has_purged_states:
+        # The oldest states were not recorded in order
+        return _purge_states_and_attributes_ids(
+            instance, session, states_batch_size, purge_before
+        )
+    return True
+
+
+def _purge_events_day_range(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the events of the oldest day and their unused data.
+
+    The events are deleted in ranges of up to max_bind_vars event ids with a
+    commit after each range. Returns true if there are more events to purge.
+    """
+    if (
+        day_range := _find_day_range(
+            session,
+            find_oldest_event(),
+            find_events_range_end,
+            find_max_event_id(),
+            purge_before,
+        )
+    ) is None:
+        return False
+    end_event_id, end_ts = day_range
+    data_ids_batch: set[int] = set()
+    max_bind_vars = instance.max_bind_vars
+    has_purged_events = False
+    for _ in range(events_batch_size):
+        rows = session.execute(
+            find_events_in_range(end_event_id, end_ts, max_bind_vars)
+        ).all()
+        if not rows:
+            break
+        has_purged_events = True
+        data_ids_batch |= {data_id for _, data_id in rows if data_id}
+        first_event_id, last_event_id = rows[0][0], rows[-1][0]
+        deleted_rows = session.execute(
+            delete_events_range(first_event_id, last_event_id, end_ts)
+        ).rowcount
+        _LOGGER.debug(
+            "Deleted %s events from event_id %s to %s",
+            deleted_rows,
+            first_event_id,
+            last_event_id,
+        )
+        session.commit()
+    _purge_unused_data_ids(instance, session, data_ids_batch)
+    if not has_purged_events:
+        # The oldest events were not recorded in order
+        return _purge_events_and_data_ids(
+            instance, session, events_batch_size, purge_before
+        )
+    return True
+
+
+def _purge_short_term_statistics_day_range(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> bool:
+    """Purge the short term statistics of the oldest day.
+
+    The short term statistics are deleted in ranges of up to max_bind_vars
+    ids with a commit after each range. Returns true if there are more short
+    term statistics to purge.
+    """
+    if (
+        day_range := _find_day_range(
+            session,
+            find_oldest_short_term_statistic(),
+            find_short_term_statistics_range_end,
+            find_max_short_term_statistics_id(),
+            purge_before,
+        )
+    ) is None:
+        return False
+    end_id, end_ts = day_range
+    max_bind_vars = instance.max_bind_vars
+    has_purged_statistics = False
+    for _ in range(DEFAULT_SHORT_TERM_STATISTICS_BATCHES_PER_PURGE):
+        ids = (
+            session.execute(
+                find_short_term_statistics_in_range(end_id, end_ts, max_bind_vars)
+            )
+            .scalars()
+            .all()
+        )
+        if not ids:
+            break
+        has_purged_statistics = True
+        deleted_rows = session.execute(
+            delete_short_term_statistics_range(ids[0], ids[-1], end_ts)
+        ).rowcount
+        _LOGGER.debug(
+            "Deleted %s short term statistics from id %s to %s",
+            deleted_rows,
+            ids[0],
+            ids[-1],
+        )
+        session.commit()
+    if not has_purged_statistics:
+        # The oldest statistics were not compiled in order
+        if short_term_statistics := _select_short_term_statistics_to_purge(
+            session, purge_before, max_bind_vars
+        ):
+            _purge_short_term_statistics(session, short_term_statistics)
+        return bool(short_term_statistics)
+    return True
+
+
 def _select_state_attributes_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -289,8 +539,22 @@ def _select_unused_attributes_ids(
     session: Session,
     attributes_ids: set[int],
     database_engine: DatabaseEngine,
+    purge_before: datetime | None = None,
 ) -> set[int]:
-    """Return a set of attributes ids that are not used by any states in the db."""
+    """Return a set of attributes ids that are not used by any states in the db.
+
+    When purge_before is passed, attributes ids used by a state recorded
+    since purge_before are known to be used and are not looked up.
+    """
+    if purge_before is not None and attributes_ids:
+        still_used = instance.state_attributes_manager.select_used_after(
+            attributes_ids, purge_before.timestamp()
+        )
+        _LOGGER.debug(
+            "Skipped looking up %s shared attributes still used by recent states",
+            len(still_used),
+        )
+        attributes_ids = attributes_ids - still_used
     if not attributes_ids:
         return set()
 
@@ -320,12 +584,13 @@ def _purge_unused_attributes_ids(
     instance: Recorder,
     session: Session,
     attributes_ids_batch: set[int],
+    purge_before: datetime | None = None,
 ) -> None:
     """Purge unused attributes ids."""
     database_engine = instance.database_engine
     assert database_engine is not None
     if unused_attribute_ids_set := _select_unused_attributes_ids(
-        instance, session, attributes_ids_batch, database_engine
+        instance, session, attributes_ids_batch, database_engine, purge_before
     ):
         _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
 
@@ -399,6 +664,17 @@ def _select_short_term_statistics_to_purge(
     return [statistic_id for (statistic_id,) in statistics]
 
 
+def _select_statistics_to_purge(
+    session: Session, purge_before: datetime, max_bind_vars: int
+) -> list[int]:
+    """Return a list of hourly statistics to purge."""
+    statistics = session.execute(
+        find_statistics_to_purge(purge_before, max_bind_vars)
+    ).all()
+    _LOGGER.debug("Selected %s hourly statistics to remove", len(statistics))
+    return [statistic_id for (statistic_id,) in statistics]
+
+
 def _select_legacy_detached_state_and_attributes_and_data_ids_to_purge(
     session: Session, purge_before: datetime, max_bind_vars: int
 ) -> tuple[set[int], set[int]]:
@@ -515,6 +791,12 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
+def _purge_statistics(session: Session, statistics: list[int]) -> None:
+    """Delete by id."""
+    deleted_rows = session.execute(delete_statistics_rows(statistics))
+    _LOGGER.debug("Deleted %s hourly statistics", deleted_rows)
+
+
 def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
@@ -720,6 +1002,12 @@ def purge_entity_data(
     database_engine = instance.database_engine
     assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
+    if entity_filter and (history_ring_buffer := instance.history_ring_buffer):
+        history_ring_buffer.remove(
+            entity_id
+            for entity_id in history_ring_buffer.entity_ids()
+            if entity_filter(entity_id)
+        )
     with session_scope(session=instance.get_session()) as session:
         selected_metadata_ids: list[str] = [
             metadata_id
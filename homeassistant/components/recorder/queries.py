@@ -223,6 +223,17 @@ def delete_statistics_short_term_rows(
     )
 
 
+def delete_statistics_rows(
+    statistics: Iterable[int],
+) -> StatementLambdaElement:
+    """Delete statistics rows."""
+    return lambda_stmt(
+        lambda: delete(Statistics)
+        .where(Statistics.id.in_(statistics))
+        .execution_options(synchronize_session=False)
+    )
+
+
 def delete_event_rows(
     event_ids: Iterable[int],
 ) -> StatementLambdaElement:
@@ -290,6 +301,159 @@ def find_short_term_statistics_to_purge(
     )
 
 
+def find_statistics_to_purge(
+    purge_before: datetime, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find hourly statistics to purge."""
+    purge_before_ts = purge_before.timestamp()
+    return lambda_stmt(
+        lambda: select(Statistics.id)
+        .filter(Statistics.start_ts < purge_before_ts)
+        .limit(max_bind_vars)
+    )
+
+
+def find_oldest_event() -> StatementLambdaElement:
+    """Find the time_fired_ts of the oldest event."""
+    return lambda_stmt(
+        lambda: select(Events.time_fired_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def find_oldest_short_term_statistic() -> StatementLambdaElement:
+    """Find the start_ts of the oldest short term statistic."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.start_ts)
+        .order_by(StatisticsShortTerm.start_ts.asc())
+        .limit(1)
+    )
+
+
+def find_states_range_end(end_ts: float) -> StatementLambdaElement:
+    """Find the state_id of the first state at or after end_ts."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.last_updated_ts >= end_ts)
+        .order_by(States.last_updated_ts.asc())
+        .limit(1)
+    )
+
+
+def find_events_range_end(end_ts: float) -> StatementLambdaElement:
+    """Find the event_id of the first event at or after end_ts."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.time_fired_ts >= end_ts)
+        .order_by(Events.time_fired_ts.asc())
+        .limit(1)
+    )
+
+
+def find_short_term_statistics_range_end(end_ts: float) -> StatementLambdaElement:
+    """Find the id of the first short term statistic at or after end_ts."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.start_ts >= end_ts)
+        .order_by(StatisticsShortTerm.start_ts.asc())
+        .limit(1)
+    )
+
+
+def find_max_state_id() -> StatementLambdaElement:
+    """Find the highest state_id."""
+    return lambda_stmt(lambda: select(func.max(States.state_id)))
+
+
+def find_max_event_id() -> StatementLambdaElement:
+    """Find the highest event_id."""
+    return lambda_stmt(lambda: select(func.max(Events.event_id)))
+
+
+def find_max_short_term_statistics_id() -> StatementLambdaElement:
+    """Find the highest short term statistics id."""
+    return lambda_stmt(lambda: select(func.max(StatisticsShortTerm.id)))
+
+
+def find_states_in_range(
+    end_state_id: int, end_ts: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the first states before end_state_id and end_ts."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.attributes_id)
+        .filter(States.state_id < end_state_id)
+        .filter(States.last_updated_ts < end_ts)
+        .order_by(States.state_id.asc())
+        .limit(max_bind_vars)
+    )
+
+
+def find_events_in_range(
+    end_event_id: int, end_ts: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the first events before end_event_id and end_ts."""
+    return lambda_stmt(
+        lambda: select(Events.event_id, Events.data_id)
+        .filter(Events.event_id < end_event_id)
+        .filter(Events.time_fired_ts < end_ts)
+        .order_by(Events.event_id.asc())
+        .limit(max_bind_vars)
+    )
+
+
+def find_short_term_statistics_in_range(
+    end_id: int, end_ts: float, max_bind_vars: int
+) -> StatementLambdaElement:
+    """Find the first short term statistics before end_id and end_ts."""
+    return lambda_stmt(
+        lambda: select(StatisticsShortTerm.id)
+        .filter(StatisticsShortTerm.id < end_id)
+        .filter(StatisticsShortTerm.start_ts < end_ts)
+        .order_by(StatisticsShortTerm.id.asc())
+        .limit(max_bind_vars)
+    )
+
+
+def delete_states_range(
+    first_state_id: int, last_state_id: int, end_ts: float
+) -> StatementLambdaElement:
+    """Delete the states from first_state_id to last_state_id before end_ts."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= first_state_id)
+        .where(States.state_id <= last_state_id)
+        .where(States.last_updated_ts < end_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_events_range(
+    first_event_id: int, last_event_id: int, end_ts: float
+) -> StatementLambdaElement:
+    """Delete the events from first_event_id to last_event_id before end_ts."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= first_event_id)
+        .where(Events.event_id <= last_event_id)
+        .where(Events.time_fired_ts < end_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_short_term_statistics_range(
+    first_id: int, last_id: int, end_ts: float
+) -> StatementLambdaElement:
+    """Delete the short term statistics from first_id to last_id before end_ts."""
+    return lambda_stmt(
+        lambda: delete(StatisticsShortTerm)
+        .where(StatisticsShortTerm.id >= first_id)
+        .where(StatisticsShortTerm.id <= last_id)
+        .where(StatisticsShortTerm.start_ts < end_ts)
+        .execution_options(synchronize_session=False)
+    )
+
+
 def find_statistics_runs_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
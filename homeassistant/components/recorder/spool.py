@@ -0,0 +1,498 @@
+"""Spool events to disk while the recorder backlog is too large."""
+
+from __future__ import annotations
+
+from collections import deque
+import contextlib
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Any, cast
+
+from homeassistant.core import Context, Event, EventOrigin, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS, json_loads
+
+_LOGGER = logging.getLogger(__name__)
+
+SPOOL_SEGMENT_SIZE = 16 * 1024**2
+
+SEGMENT_SUFFIX = ".spool"
+
+# Records are a little endian length followed by the serialised event. The
+# length is written after the event, a zero length marks the end of the
+# records of a segment
+_LENGTH = struct.Struct("<I")
+# Set in the length of the records which were taken
+_TAKEN = 1 << 31
+
+# Populate the page tables when a segment is mapped so appending an event
+# from the event loop does not fault in the pages of the segment
+_MAP_FLAGS = mmap.MAP_SHARED | getattr(mmap, "MAP_POPULATE", 0)
+
+
+def _state_to_list(state: State) -> list[Any]:
+    """Serialise a state with its full context."""
+    context = state.context
+    return [
+        state.entity_id,
+        state.state,
+        state.attributes,
+        state.last_changed_timestamp,
+        state.last_updated_timestamp,
+        state.last_reported_timestamp,
+        context.id,
+        context.user_id,
+        context.parent_id,
+    ]
+
+
+def _state_from_list(data: list[Any], event_context: Context) -> State:
+    """Deserialise a state."""
+    (
+        entity_id,
+        state,
+        attributes,
+        last_changed_timestamp,
+        last_updated_timestamp,
+        last_reported_timestamp,
+        context_id,
+        user_id,
+        parent_id,
+    ) = data
+    if context_id == event_context.id:
+        context = event_context
+    else:
+        context = Context(user_id=user_id, parent_id=parent_id, id=context_id)
+    return State(
+        entity_id,
+        state,
+        attributes,
+        last_changed=dt_util.utc_from_timestamp(last_changed_timestamp),
+        last_reported=dt_util.utc_from_timestamp(last_reported_timestamp),
+        last_updated=dt_util.utc_from_timestamp(last_updated_timestamp),
+        context=context,
+        validate_entity_id=False,
+        last_updated_timestamp=last_updated_timestamp,
+    )
+
+
+def _event_to_bytes(event: Event) -> bytes:
+    """Serialise an event."""
+    context = event.context
+    event_data = event.data
+    states = {
+        key: _state_to_list(value)
+        for key, value in event_data.items()
+        if type(value) is State
+    }
+    if states:
+        event_data = {
+            key: value for key, value in event_data.items() if key not in states
+        }
+    record = [
+        event.event_type,
+        event_data,
+        states,
+        event.origin.value,
+        event.time_fired_timestamp,
+        context.id,
+        context.user_id,
+        context.parent_id,
+    ]
+    try:
+        return json_bytes(record)
+    except JSON_ENCODE_EXCEPTIONS as ex:
+        _LOGGER.warning("Event is not JSON serializable: %s: %s", event, ex)
+    # Drop the data which can't be serialised, the recorder does the same
+    # for the event data and state attributes of events which are not spooled
+    if not _is_serializable(event_data):
+        record[1] = {}
+    for state in states.values():
+        if not _is_serializable(state[2]):
+            state[2] = {}
+    return json_bytes(record)
+
+
+def _is_serializable(data: Any) -> bool:
+    """Return True if the data can be serialised."""
+    try:
+        json_bytes(data)
+    except JSON_ENCODE_EXCEPTIONS:
+        return False
+    return True
+
+
+def _event_from_bytes(data: bytes) -> Event:
+    """Deserialise an event."""
+    (
+        event_type,
+        event_data,
+        states,
+        origin,
+        time_fired_timestamp,
+        context_id,
+        user_id,
+        parent_id,
+    ) = cast(list[Any], json_loads(data))
+    context = Context(user_id=user_id, parent_id=parent_id, id=context_id)
+    for key, state in states.items():
+        event_data[key] = _state_from_list(state, context)
+    return Event(
+        event_type,
+        event_data,
+        EventOrigin(origin),
+        time_fired_timestamp,
+        context,
+    )
+
+
+class _Segment:
+    """A memory-mapped file of records."""
+
+    __slots__ = ("mmap", "path", "read_offset", "size", "write_offset")
+
+    def __init__(self, path: str, mapped: mmap.mmap) -> None:
+        """Initialize the segment."""
+        self.path = path
+        self.mmap = mapped
+        self.size = len(mapped)
+        self.read_offset = 0
+        self.write_offset = 0
+
+    @classmethod
+    def create(cls, path: str, size: int) -> _Segment:
+        """Create the segment file and map it.
+
+        This method does blocking I/O and must not run in the event loop.
+        """
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            # Allocate the blocks up front, writing to the pages of a sparse
+            # file raises SIGBUS instead of an error once the disk is full
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+            mapped = mmap.mmap(fd, size, flags=_MAP_FLAGS)
+        except OSError:
+            os.unlink(path)
+            raise
+        finally:
+            os.close(fd)
+        return cls(path, mapped)
+
+    @classmethod
+    def recover(cls, path: str) -> _Segment:
+        """Map the segment file of a previous run.
+
+        This method does blocking I/O and must not run in the event loop.
+        """
+        fd = os.open(path, os.O_RDWR)
+        try:
+            segment = cls(path, mmap.mmap(fd, 0, flags=_MAP_FLAGS))
+        finally:
+            os.close(fd)
+        mapped = segment.mmap
+        offset = 0
+        while offset + _LENGTH.size <= segment.size:
+            (length,) = _LENGTH.unpack_from(mapped, offset)
+            end = offset + _LENGTH.size + (length & ~_TAKEN)
+            if not length or end > segment.size:
+                break
+            offset = end
+            if length & _TAKEN:
+                segment.read_offset = offset
+        segment.write_offset = offset
+        return segment
+
+    def append(self, record: bytes) -> bool:
+        """Append a record, return False if the segment is full."""
+        start = self.write_offset + _LENGTH.size
+        end = start + len(record)
+        if end > self.size:
+            return False
+        self.mmap[start:end] = record
+        _LENGTH.pack_into(self.mmap, self.write_offset, len(record))
+        self.write_offset = end
+        return True
+
+    def read(self) -> bytes | None:
+        """Return the next record or None if all were read."""
+        if (offset := self.read_offset) == self.write_offset:
+            return None
+        (length,) = _LENGTH.unpack_from(self.mmap, offset)
+        start = offset + _LENGTH.size
+        self.read_offset = start + length
+        # Mark the record as taken so it is not recovered after a restart
+        _LENGTH.pack_into(self.mmap, offset, length | _TAKEN)
+        return self.mmap[start : self.read_offset]
+
+    def close(self, remove: bool) -> None:
+        """Unmap the segment and optionally remove its file."""
+        if not remove:
+            self.mmap.flush()
+        self.mmap.close()
+        if remove:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+
+def _read_records(
+    segments: deque[_Segment], records: list[bytes], max_events: int
+) -> list[_Segment]:
+    """Read up to max_events records and return the segments which were read."""
+    read: list[_Segment] = []
+    while segments and len(records) < max_events:
+        if (record := segments[0].read()) is not None:
+            records.append(record)
+        else:
+            read.append(segments.popleft())
+    return read
+
+
+class EventSpool:
+    """Append-only spool of events in memory-mapped segment files.
+
+    Events are appended from the event loop while the spool is active and
+    taken in the order they were appended by the recorder thread, which
+    deactivates the spool once it has taken all of them.
+
+    The event loop only copies the events into segments which are already
+    mapped. The segments are created by prepare_segment in the executor,
+    the events appended while no segment is available are held in memory
+    until the next segment is ready. Segments are removed once they have
+    been read. The segments with events which were not taken when the
+    recorder stops are kept, they are recovered at the next start.
+    """
+
+    def __init__(self, path: str, segment_size: int = SPOOL_SEGMENT_SIZE) -> None:
+        """Init the spool."""
+        self.path = path
+        self.active = False
+        self._segment_size = segment_size
+        self._segments: deque[_Segment] = deque()
+        # Records appended while the segments were full
+        self._pending: deque[bytes] = deque()
+        # Empty segment to continue with once the last segment is full
+        self._spare: _Segment | None = None
+        self._recovered: deque[_Segment] = deque()
+        self._next_segment_id = 0
+        self._events = 0
+        self._ready = False
+        self._preparing = False
+        self._failed = False
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of events in the spool."""
+        return self._events
+
+    def start(self) -> None:
+        """Spool the events appended from now on."""
+        self._failed = False
+        self.active = True
+
+    def append(self, event: Event[Any]) -> bool:
+        """Append an event, return False if it was not spooled.
+
+        The event is only copied to a mapped segment or held in memory,
+        so this method is safe to call from the event loop.
+        """
+        record = _event_to_bytes(event)
+        with self._lock:
+            if not self.active or self._failed:
+                return False
+            pending = self._pending
+            segments = self._segments
+            if pending or not (segments and segments[-1].append(record)):
+                if not pending and (spare := self._spare) and spare.append(record):
+                    self._spare = None
+                    segments.append(spare)
+                else:
+                    pending.append(record)
+            self._events += 1
+        return True
+
+    def start_preparing_segment(self) -> bool:
+        """Return True if the caller needs to run prepare_segment.
+
+        A segment is prepared when the spare segment was used or events
+        are held in memory.
+        """
+        with self._lock:
+            if (
+                not self._ready
+                or self._preparing
+                or self._failed
+                or (self._spare is not None and not self._pending)
+            ):
+                return False
+            self._preparing = True
+            return True
+
+    def prepare_segment(self) -> None:
+        """Create the segments for the events held in memory and a spare segment.
+
+        This method does blocking I/O and must not run in the event loop.
+        """
+        try:
+            self._prepare_segment()
+        finally:
+            with self._lock:
+                self._preparing = False
+
+    def _prepare_segment(self) -> None:
+        """Create the segments for the events held in memory and a spare segment."""
+        pending = self._pending
+        while True:
+            with self._lock:
+                if self._closed or (self._spare is not None and not pending):
+                    return
+                size = self._segment_size
+                if pending:
+                    size = max(size, *(len(record) for record in pending))
+                    size += _LENGTH.size
+                path = self._next_segment_path()
+            try:
+                segment = _Segment.create(path, size)
+            except OSError as err:
+                _LOGGER.error(
+                    "Error creating a spool segment in %s, the events are "
+                    "queued in memory: %s",
+                    self.path,
+                    err,
+                )
+                with self._lock:
+                    self._failed = True
+                return
+            with self._lock:
+                if self._closed:
+                    segment.close(remove=True)
+                    return
+                while pending and segment.append(pending[0]):
+                    pending.popleft()
+                if segment.write_offset:
+                    self._segments.append(segment)
+                elif self._spare is None:
+                    self._spare = segment
+                else:
+                    segment.close(remove=True)
+
+    def take(self, max_events: int) -> list[Event[Any]]:
+        """Take up to max_events events in the order they were appended.
+
+        Once all events are taken the spool is no longer active and the
+        events are queued again.
+        """
+        records: list[bytes] = []
+        with self._lock:
+            read = _read_records(self._segments, records, max_events)
+            pending = self._pending
+            if not self._segments:
+                while pending and len(records) < max_events:
+                    records.append(pending.popleft())
+            if not self._segments and not pending:
+                # Everything was taken, the next events are queued again
+                self.active = False
+            self._events -= len(records)
+        for segment in read:
+            segment.close(remove=True)
+        return [_event_from_bytes(record) for record in records]
+
+    def recover(self) -> None:
+        """Map the segments left behind by a previous run and prepare a spare.
+
+        The events of the previous run are taken with take_recovered.
+
+        This method does blocking I/O and must not run in the event loop.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        segment_ids = sorted(
+            int(segment_id)
+            for name in os.listdir(self.path)
+            if (segment_id := name.removesuffix(SEGMENT_SUFFIX)) != name
+            and segment_id.isdigit()
+        )
+        recovered: list[_Segment] = []
+        for segment_id in segment_ids:
+            path = os.path.join(self.path, f"{segment_id}{SEGMENT_SUFFIX}")
+            try:
+                segment = _Segment.recover(path)
+            except (OSError, ValueError) as err:
+                _LOGGER.warning("Unable to recover spool segment %s: %s", path, err)
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+                continue
+            if segment.read_offset == segment.write_offset:
+                segment.close(remove=True)
+            else:
+                _LOGGER.debug("Recovered spool segment %s", path)
+                recovered.append(segment)
+        with self._lock:
+            self._recovered.extend(recovered)
+            if segment_ids:
+                self._next_segment_id = segment_ids[-1] + 1
+            self._ready = True
+            self._preparing = True
+        self.prepare_segment()
+
+    def take_recovered(self, max_events: int) -> list[Event[Any]]:
+        """Take up to max_events events spooled by the previous run."""
+        records: list[bytes] = []
+        with self._lock:
+            read = _read_records(self._recovered, records, max_events)
+        for segment in read:
+            segment.close(remove=True)
+        return [_event_from_bytes(record) for record in records]
+
+    def close(self) -> None:
+        """Unmap the segments and keep the ones with events which were not taken.
+
+        This method does blocking I/O and must not run in the event loop.
+        """
+        with self._lock:
+            self.active = False
+            self._closed = True
+            segments = [*self._recovered, *self._segments]
+            self._recovered.clear()
+            self._segments.clear()
+            if self._spare is not None:
+                segments.append(self._spare)
+                self._spare = None
+            records = list(self._pending)
+            self._pending.clear()
+            self._events = 0
+            path = self._next_segment_path()
+        for segment in segments:
+            segment.close(remove=segment.read_offset == segment.write_offset)
+        if not records:
+            return
+        try:
+            segment = _Segment.create(
+                path, sum(len(record) + _LENGTH.size for record in records)
+            )
+        except OSError as err:
+            _LOGGER.error(
+                "Error creating a spool segment in %s, %s events were not recorded: %s",
+                self.path,
+                len(records),
+                err,
+            )
+            return
+        for record in records:
+            segment.append(record)
+        segment.close(remove=False)
+
+    def _next_segment_path(self) -> str:
+        """Return the path of the next segment.
+
+        Must be called with the lock held.
+        """
+        path = os.path.join(self.path, f"{self._next_segment_id}{SEGMENT_SUFFIX}")
+        self._next_segment_id += 1
+        return path
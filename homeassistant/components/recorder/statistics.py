@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
@@ -14,7 +15,7 @@ import re
 from time import time as time_time
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
 
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from sqlalchemy import Select, and_, bindparam, delete, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -27,6 +28,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.singleton import singleton
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.unit_conversion import (
     AreaConverter,
     BaseUnitConverter,
@@ -64,6 +66,7 @@ from .db_schema import (
     Statistics,
     StatisticsBase,
     StatisticsMeta,
+    StatisticsRollups,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -130,7 +133,6 @@ QUERY_STATISTICS_SUMMARY_SUM = (
     .label("rownum"),
 )
 
-
 STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
     **{unit: AreaConverter for unit in AreaConverter.VALID_UNITS},
     **{
@@ -397,13 +399,41 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session,
+    start: datetime,
+    max_bind_vars: int,
+    summary: dict[int, StatisticDataTimestamp] | None = None,
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If the summary was accumulated while compiling the 5-minute statistics,
+    it is inserted without querying the database. The daily, weekly and
+    monthly rollups of the compiled statistics are updated afterwards.
     """
+    if summary is None:
+        summary = _query_hourly_statistics_summary(session, start)
+
+    # Insert compiled hourly statistics in the database
+    now_timestamp = time_time()
+    session.add_all(
+        Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
+        for metadata_id, summary_item in summary.items()
+    )
+    if summary:
+        _update_statistics_rollups(
+            session, summary, start.replace(minute=0).timestamp(), max_bind_vars
+        )
+
+
+def _query_hourly_statistics_summary(
+    session: Session, start: datetime
+) -> dict[int, StatisticDataTimestamp]:
+    """Summarize the 5-minute statistics of an hour with database queries."""
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
@@ -447,12 +477,7 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
                     "sum": _sum,
                 }
 
-    # Insert compiled hourly statistics in the database
-    now_timestamp = time_time()
-    session.add_all(
-        Statistics.from_stats_ts(metadata_id, summary_item, now_timestamp)
-        for metadata_id, summary_item in summary.items()
-    )
+    return summary
 
 
 @retryable_database_job("compile missing statistics")
@@ -606,9 +631,23 @@ def _compile_statistics(
                 continue
             platform_update_issues(instance.hass, session)
 
+    if (statistics_accumulators := instance.statistics_accumulators) is not None:
+        statistics_accumulators.add_short_term_statistics(
+            start.timestamp(), new_short_term_stats
+        )
+
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(
+            session,
+            start,
+            instance.max_bind_vars,
+            statistics_accumulators.pop_hourly_summary(
+                start.replace(minute=0).timestamp()
+            )
+            if statistics_accumulators is not None
+            else None,
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -662,6 +701,24 @@ def _adjust_sum_statistics(
         )
 
 
+def _adjust_sum_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_time: datetime,
+    keep_before_ts: float,
+    adj: float,
+) -> None:
+    """Adjust the rollups which are not rebuilt from the hourly statistics."""
+    start_time_ts = start_time.timestamp()
+    session.query(StatisticsRollups).filter_by(metadata_id=metadata_id).filter(
+        StatisticsRollups.end_ts > start_time_ts,
+        StatisticsRollups.start_ts < keep_before_ts,
+    ).update(
+        {StatisticsRollups.sum: StatisticsRollups.sum + adj},
+        synchronize_session=False,
+    )
+
+
 def _insert_statistics(
     session: Session,
     table: type[StatisticsBase],
@@ -752,8 +809,15 @@ def get_metadata(
         )
 
 
+def _invalidate_hourly_summary(instance: Recorder) -> None:
+    """Invalidate the accumulated hourly summary when 5-minute statistics change."""
+    if (statistics_accumulators := instance.statistics_accumulators) is not None:
+        statistics_accumulators.invalidate_hourly_summary()
+
+
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    _invalidate_hourly_summary(instance)
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -1116,6 +1180,331 @@ def _reduce_statistics_per_month(
     )
 
 
+# The reductions materialized in the statistics_rollups table, mapping
+# the period to the id stored in the period column, the factory of the
+# time zone aware period functions and the maximum length of the period
+_ROLLUP_PERIODS: dict[
+    str,
+    tuple[
+        int,
+        Callable[
+            [],
+            tuple[
+                Callable[[float, float], bool],
+                Callable[[float], tuple[float, float]],
+            ],
+        ],
+        timedelta,
+    ],
+] = {
+    "day": (0, reduce_day_ts_factory, timedelta(days=1)),
+    "week": (1, reduce_week_ts_factory, timedelta(days=7)),
+    "month": (2, reduce_month_ts_factory, timedelta(days=31)),
+}
+_ROLLUP_TYPES: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+    "last_reset",
+    "max",
+    "mean",
+    "min",
+    "state",
+    "sum",
+}
+
+
+class _StatisticsRollupsMisalignedError(Exception):
+    """Raised when the rollups were computed in another time zone."""
+
+
+def _statistics_rollups_of_period_stmt(
+    period_id: int, start_time_ts: float, metadata_ids: list[int]
+) -> StatementLambdaElement:
+    """Generate the statement for the rollups of a period starting at start_time_ts."""
+    return lambda_stmt(
+        lambda: select(StatisticsRollups)
+        .filter(StatisticsRollups.metadata_id.in_(metadata_ids))
+        .filter(StatisticsRollups.period == period_id)
+        .filter(StatisticsRollups.start_ts == start_time_ts)
+    )
+
+
+def _update_statistics_rollups(
+    session: Session,
+    summary: dict[int, StatisticDataTimestamp],
+    start_ts: float,
+    max_bind_vars: int,
+) -> None:
+    """Update the rollups of the periods containing an hour of statistics.
+
+    The compiled hour of statistics is merged into the rollups of the day,
+    week and month the hour starting at start_ts belongs to. The hours are
+    compiled in order, so the state and sum of the hour are the last ones of
+    the periods.
+    """
+    for metadata_ids_chunk in chunked_or_all(summary, max_bind_vars):
+        chunk = list(metadata_ids_chunk)
+        for period_id, period_factory, _ in _ROLLUP_PERIODS.values():
+            _, period_start_end = period_factory()
+            period_start_ts, period_end_ts = period_start_end(start_ts)
+            rollups: dict[int, StatisticsRollups] = {
+                rollup.metadata_id: rollup
+                for rollup in session.execute(
+                    _statistics_rollups_of_period_stmt(
+                        period_id, period_start_ts, chunk
+                    )
+                ).scalars()
+            }
+            for metadata_id in chunk:
+                stat = summary[metadata_id]
+                if (rollup := rollups.get(metadata_id)) is None:
+                    rollup = StatisticsRollups(
+                        metadata_id=metadata_id,
+                        period=period_id,
+                        start_ts=period_start_ts,
+                        end_ts=period_end_ts,
+                        mean_count=0,
+                    )
+                    session.add(rollup)
+                _merge_statistics_rollup(rollup, stat)
+
+
+def _merge_statistics_rollup(
+    rollup: StatisticsRollups, stat: StatisticDataTimestamp
+) -> None:
+    """Merge the next hour of statistics into a rollup."""
+    if (_mean := stat.get("mean")) is not None:
+        mean_count = rollup.mean_count or 0
+        if rollup.mean is None or not mean_count:
+            rollup.mean = _mean
+        else:
+            rollup.mean = (rollup.mean * mean_count + _mean) / (mean_count + 1)
+        rollup.mean_count = mean_count + 1
+    if (_min := stat.get("min")) is not None and (
+        rollup.min is None or _min < rollup.min
+    ):
+        rollup.min = _min
+    if (_max := stat.get("max")) is not None and (
+        rollup.max is None or _max > rollup.max
+    ):
+        rollup.max = _max
+    rollup.last_reset_ts = stat.get("last_reset_ts")
+    rollup.state = stat.get("state")
+    rollup.sum = stat.get("sum")
+
+
+def _hourly_statistics_of_metadata_id_stmt(
+    metadata_id: int, start_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement for the hourly statistics of a statistic."""
+    return lambda_stmt(
+        lambda: select(*QUERY_STATISTICS[1:])
+        .filter(Statistics.metadata_id == metadata_id)
+        .filter(Statistics.start_ts >= start_time_ts)
+        .order_by(Statistics.start_ts)
+    )
+
+
+def _find_oldest_statistic_stmt() -> StatementLambdaElement:
+    """Generate the statement for the start of the oldest hourly statistic."""
+    return lambda_stmt(
+        lambda: select(Statistics.start_ts).order_by(Statistics.start_ts.asc()).limit(1)
+    )
+
+
+def _statistics_rollups_keep_before_ts(
+    instance: Recorder, session: Session
+) -> float | None:
+    """Return the start of the hourly statistics the rollups are rebuilt from.
+
+    With statistics_keep_days, the hourly statistics are purged once they are
+    rolled up. The rollups of the periods starting before the retained hourly
+    statistics, or before the oldest hourly statistic if keep_days was raised,
+    are then the only record of them and are kept as they are.
+    """
+    if (keep_days := instance.statistics_keep_days) is None:
+        return None
+    oldest_ts: float | None = session.execute(_find_oldest_statistic_stmt()).scalar()
+    return max(
+        oldest_ts or 0, (dt_util.utcnow() - timedelta(days=keep_days)).timestamp()
+    )
+
+
+def _rebuild_statistics_rollups(
+    session: Session,
+    metadata_id: int,
+    start_ts: float | None = None,
+    keep_before_ts: float | None = None,
+) -> None:
+    """Rebuild the rollups of a statistic from its hourly statistics.
+
+    Only the periods containing start_ts and the periods after it are rebuilt,
+    all periods are rebuilt if start_ts is None. The periods starting before
+    keep_before_ts are never rebuilt.
+    """
+    session.flush()  # the hourly statistics must be visible to the queries
+    periods = []
+    for period_id, period_factory, period in _ROLLUP_PERIODS.values():
+        same_period, period_start_end = period_factory()
+        from_ts = period_start_end(start_ts)[0] if start_ts is not None else 0
+        if keep_before_ts is not None:
+            keep_start_ts, keep_end_ts = period_start_end(keep_before_ts)
+            from_ts = max(
+                from_ts,
+                keep_start_ts if keep_start_ts == keep_before_ts else keep_end_ts,
+            )
+        periods.append((period_id, same_period, period_start_end, period, from_ts))
+    stats: list[StatisticsRow] = [
+        {
+            "start": start,
+            "mean": _mean,
+            "min": _min,
+            "max": _max,
+            "last_reset": last_reset_ts,
+            "state": state,
+            "sum": _sum,
+        }
+        for start, _mean, _min, _max, last_reset_ts, state, _sum in (
+            execute_stmt_lambda_element(
+                session,
+                _hourly_statistics_of_metadata_id_stmt(
+                    metadata_id, min(period[-1] for period in periods)
+                ),
+                orm_rows=False,
+            )
+        )
+    ]
+    for period_id, same_period, period_start_end, period, from_ts in periods:
+        session.execute(
+            delete(StatisticsRollups)
+            .where(StatisticsRollups.metadata_id == metadata_id)
+            .where(StatisticsRollups.period == period_id)
+            .where(StatisticsRollups.start_ts >= from_ts)
+        )
+        if not (period_stats := [stat for stat in stats if stat["start"] >= from_ts]):
+            continue
+        mean_starts = [
+            stat["start"] for stat in period_stats if stat["mean"] is not None
+        ]
+        session.add_all(
+            StatisticsRollups(
+                metadata_id=metadata_id,
+                period=period_id,
+                start_ts=row["start"],
+                end_ts=row["end"],
+                mean=row["mean"],
+                mean_count=bisect_left(mean_starts, row["end"])
+                - bisect_left(mean_starts, row["start"]),
+                min=row["min"],
+                max=row["max"],
+                last_reset_ts=row["last_reset"],
+                state=row["state"],
+                sum=row["sum"],
+            )
+            for row in _reduce_statistics(
+                {"": period_stats},
+                same_period,
+                period_start_end,
+                period,
+                _ROLLUP_TYPES,
+            )[""]
+        )
+
+
+def rebuild_statistics_rollups(
+    instance: Recorder, start_metadata_id: int, max_statistics: int
+) -> int | None:
+    """Rebuild the rollups of up to max_statistics statistics.
+
+    The statistics are rebuilt in the order of their metadata ids, starting
+    with start_metadata_id. Returns the metadata id to continue with, or None
+    if the rollups of all statistics have been rebuilt.
+    """
+    with session_scope(session=instance.get_session()) as session:
+        metadata_ids = [
+            metadata_id
+            for (metadata_id,) in execute_stmt_lambda_element(
+                session,
+                _find_metadata_ids_to_rebuild_rollups_stmt(
+                    start_metadata_id, max_statistics + 1
+                ),
+                orm_rows=False,
+            )
+        ]
+        keep_before_ts = _statistics_rollups_keep_before_ts(instance, session)
+        for metadata_id in metadata_ids[:max_statistics]:
+            _rebuild_statistics_rollups(
+                session, metadata_id, keep_before_ts=keep_before_ts
+            )
+    if len(metadata_ids) > max_statistics:
+        return metadata_ids[max_statistics]
+    return None
+
+
+def _find_metadata_ids_to_rebuild_rollups_stmt(
+    start_metadata_id: int, limit: int
+) -> StatementLambdaElement:
+    """Create a statement to find the statistics to rebuild the rollups for."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.id)
+        .filter(StatisticsMeta.id >= start_metadata_id)
+        .order_by(StatisticsMeta.id)
+        .limit(limit)
+    )
+
+
+def _statistics_rollups_to_periods(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    keep_before_ts: float | None,
+) -> dict[str, list[StatisticsRow]]:
+    """Set the end of statistics rollups read from the database.
+
+    Raises _StatisticsRollupsMisalignedError if a rollup does not start at
+    the start of a period in the current time zone, unless the rollup starts
+    before keep_before_ts and can't be rebuilt. Those keep the periods of the
+    time zone they were computed in.
+    """
+    for stat_list in stats.values():
+        for row in stat_list:
+            start, end = period_start_end(row["start"])
+            if start != row["start"]:
+                if keep_before_ts is None or row["start"] >= keep_before_ts:
+                    raise _StatisticsRollupsMisalignedError
+                end = row["start"] + end - start
+            row["end"] = end
+    return stats
+
+
+def _generate_statistics_rollups_during_period_stmt(
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    period_id: int,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> StatementLambdaElement:
+    """Prepare a database query for statistics rollups during a given period."""
+    start_time_ts = start_time.timestamp()
+    columns = select(StatisticsRollups.metadata_id, StatisticsRollups.start_ts)
+    track_on: list[str | None] = [StatisticsRollups.__tablename__]
+    for key, column in _type_column_mapping.items():
+        if key in types:
+            columns = columns.add_columns(getattr(StatisticsRollups, column))
+            track_on.append(column)
+        else:
+            track_on.append(None)
+    stmt = lambda_stmt(lambda: columns, track_on=track_on)
+    stmt += lambda q: q.filter(StatisticsRollups.period == period_id)
+    stmt += lambda q: q.filter(StatisticsRollups.start_ts >= start_time_ts)
+    if end_time is not None:
+        end_time_ts = end_time.timestamp()
+        stmt += lambda q: q.filter(StatisticsRollups.start_ts < end_time_ts)
+    if metadata_ids:
+        stmt += lambda q: q.filter(StatisticsRollups.metadata_id.in_(metadata_ids))
+    stmt += lambda q: q.order_by(
+        StatisticsRollups.metadata_id, StatisticsRollups.start_ts
+    )
+    return stmt
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1701,6 +2090,57 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period(
+    hass: HomeAssistant,
+    instance: Recorder,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    metadata_ids: list[int] | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: str,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return the daily, weekly or monthly statistics from the rollups.
+
+    Returns None if start_time or end_time is not the start of a period, the
+    rollups only hold whole periods. Returns None if the rollups were computed
+    in another time zone, the rollups are then rebuilt in the background.
+    """
+    period_id, period_factory, _ = _ROLLUP_PERIODS[period]
+    _, period_start_end = period_factory()
+    for boundary in (start_time, end_time):
+        if boundary is not None and (
+            period_start_end(boundary_ts := boundary.timestamp())[0] != boundary_ts
+        ):
+            return None
+    stmt = _generate_statistics_rollups_during_period_stmt(
+        start_time, end_time, metadata_ids, period_id, types
+    )
+    try:
+        return _sorted_statistics_to_dict(
+            hass,
+            execute_stmt_lambda_element(session, stmt, orm_rows=False),
+            statistic_ids,
+            metadata,
+            True,
+            Statistics,
+            units,
+            types,
+            partial(
+                _statistics_rollups_to_periods,
+                period_start_end=period_start_end,
+                keep_before_ts=_statistics_rollups_keep_before_ts(instance, session),
+            ),
+        )
+    except _StatisticsRollupsMisalignedError:
+        _LOGGER.debug("Statistics rollups are not aligned with the time zone")
+        instance.queue_statistics_rollups_rebuild()
+        return None
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1771,35 +2211,58 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+    result: dict[str, list[StatisticsRow]] | None = None
+    if (
+        period in _ROLLUP_PERIODS
+        and (instance := get_instance(hass)).statistics_rollups_ready
+    ):
+        result = _statistics_rollups_during_period(
+            hass,
+            instance,
+            session,
+            start_time,
+            end_time,
+            metadata_ids,
+            statistic_ids,
+            metadata,
+            period,
+            units,
+            types,
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+    if result is None:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        reduce_statistics: (
+            Callable[[dict[str, list[StatisticsRow]]], dict[str, list[StatisticsRow]]]
+            | None
+        ) = None
+        if period == "day":
+            reduce_statistics = partial(_reduce_statistics_per_day, types=types)
+        elif period == "week":
+            reduce_statistics = partial(_reduce_statistics_per_week, types=types)
+        elif period == "month":
+            reduce_statistics = partial(_reduce_statistics_per_month, types=types)
+
+        # Long periods are fetched with yield_per and each statistic is
+        # reduced before the rows of the next statistic are converted
+        result = _sorted_statistics_to_dict(
+            hass,
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+            reduce_statistics,
+        )
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+    if not result:
+        return {}
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2150,37 +2613,41 @@ def _build_converted_stats(
 
 def _sorted_statistics_to_dict(
     hass: HomeAssistant,
-    stats: Sequence[Row[Any]],
+    stats: Iterable[Row[Any]],
     statistic_ids: set[str] | None,
     _metadata: dict[str, tuple[int, StatisticMetaData]],
     convert_units: bool,
     table: type[StatisticsBase],
     units: dict[str, str] | None,
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    reduce_statistics: (
+        Callable[[dict[str, list[StatisticsRow]]], dict[str, list[StatisticsRow]]]
+        | None
+    ) = None,
 ) -> dict[str, list[StatisticsRow]]:
-    """Convert SQL results into JSON friendly data structure."""
-    assert stats, "stats must not be empty"  # Guard against implementation error
+    """Convert SQL results into JSON friendly data structure.
+
+    The rows are converted one statistic at a time as they are consumed.
+    If reduce_statistics is passed, the statistics of each statistic_id
+    are reduced before the rows of the next one are converted.
+    """
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    rows = iter(stats)
+    if (first_row := next(rows, None)) is None:
+        return result
     metadata = dict(_metadata.values())
     # Identify metadata IDs for which no data was available at the requested start time
-    field_map: dict[str, int] = {key: idx for idx, key in enumerate(stats[0]._fields)}
+    field_map: dict[str, int] = {key: idx for idx, key in enumerate(first_row._fields)}
     metadata_id_idx = field_map["metadata_id"]
     start_ts_idx = field_map["start_ts"]
-    stats_by_meta_id: dict[int, list[Row]] = {}
-    seen_statistic_ids: set[str] = set()
     key_func = itemgetter(metadata_id_idx)
-    for meta_id, group in groupby(stats, key_func):
-        stats_by_meta_id[meta_id] = list(group)
-        seen_statistic_ids.add(metadata[meta_id]["statistic_id"])
 
-    # Set all statistic IDs to empty lists in result set to maintain the order
+    # Set all statistic IDs to empty lists in result set to maintain the order,
+    # the statistic IDs that are not in the data are removed at the end
     if statistic_ids is not None:
         for stat_id in statistic_ids:
-            # Only set the statistic ID if it is in the data to
-            # avoid having to do a second loop to remove the
-            # statistic IDs that are not in the data at the end
-            if stat_id in seen_statistic_ids:
-                result[stat_id] = []
+            result[stat_id] = []
+    seen_statistic_ids: set[str] = set()
 
     # Figure out which fields we need to extract from the SQL result
     # and which indices they have in the result so we can avoid the overhead
@@ -2192,9 +2659,11 @@ def _sorted_statistics_to_dict(
     row_mapping = tuple((key, field_map[key]) for key in types if key in field_map)
     # Append all statistic entries, and optionally do unit conversion
     table_duration_seconds = table.duration.total_seconds()
-    for meta_id, db_rows in stats_by_meta_id.items():
+    for meta_id, group in groupby(chain((first_row,), rows), key_func):
+        db_rows = list(group)
         metadata_by_id = metadata[meta_id]
         statistic_id = metadata_by_id["statistic_id"]
+        seen_statistic_ids.add(statistic_id)
         if convert_units:
             state_unit = unit = metadata_by_id["unit_of_measurement"]
             if state := hass.states.get(statistic_id):
@@ -2222,8 +2691,14 @@ def _sorted_statistics_to_dict(
         else:
             _stats = _build_stats(*build_args, row_mapping)
 
+        if reduce_statistics is not None:
+            _stats = reduce_statistics({statistic_id: _stats})[statistic_id]
         result[statistic_id] = _stats
 
+    if statistic_ids is not None and len(seen_statistic_ids) != len(result):
+        for stat_id in statistic_ids - seen_statistic_ids:
+            del result[stat_id]
+
     return result
 
 
@@ -2440,17 +2915,38 @@ def import_statistics(
     table: type[StatisticsBase],
 ) -> bool:
     """Process an import_statistics job."""
+    if table == StatisticsShortTerm:
+        _invalidate_hourly_summary(instance)
+    else:
+        # The rollups are rebuilt from the first imported statistic
+        statistics = list(statistics)
 
+    imported = False
     with session_scope(
         session=instance.get_session(),
         exception_filter=filter_unique_constraint_integrity_error(
             instance, "statistic"
         ),
     ) as session:
-        return _import_statistics_with_session(
+        imported = _import_statistics_with_session(
             instance, session, metadata, statistics, table
         )
 
+    if imported and table != StatisticsShortTerm and statistics:
+        # The rollups are rebuilt once the import is committed, a duplicated
+        # statistic must not fail the import before the session is committed
+        with session_scope(session=instance.get_session()) as session:
+            if metadata_id := instance.statistics_meta_manager.get(
+                session, metadata["statistic_id"]
+            ):
+                _rebuild_statistics_rollups(
+                    session,
+                    metadata_id[0],
+                    min(stat["start"] for stat in statistics).timestamp(),
+                    _statistics_rollups_keep_before_ts(instance, session),
+                )
+    return imported
+
 
 @retryable_database_job("adjust_statistics")
 def adjust_statistics(
@@ -2461,6 +2957,7 @@ def adjust_statistics(
     adjustment_unit: str,
 ) -> bool:
     """Process an add_statistics job."""
+    _invalidate_hourly_summary(instance)
 
     with session_scope(session=instance.get_session()) as session:
         metadata = instance.statistics_meta_manager.get_many(
@@ -2490,13 +2987,28 @@ def adjust_statistics(
             start_time.replace(minute=0),
             sum_adjustment,
         )
+        keep_before_ts = _statistics_rollups_keep_before_ts(instance, session)
+        if keep_before_ts is not None:
+            _adjust_sum_statistics_rollups(
+                session,
+                metadata[statistic_id][0],
+                start_time.replace(minute=0),
+                keep_before_ts,
+                sum_adjustment,
+            )
+        _rebuild_statistics_rollups(
+            session,
+            metadata[statistic_id][0],
+            start_time.replace(minute=0).timestamp(),
+            keep_before_ts,
+        )
 
     return True
 
 
 def _change_statistics_unit_for_table(
     session: Session,
-    table: type[StatisticsBase],
+    table: type[StatisticsBase | StatisticsRollups],
     metadata_id: int,
     convert: Callable[[float | None], float | None],
 ) -> None:
@@ -2552,8 +3064,16 @@ def change_statistics_unit(
             Statistics,
             StatisticsShortTerm,
         )
+        _invalidate_hourly_summary(instance)
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
+        keep_before_ts = _statistics_rollups_keep_before_ts(instance, session)
+        if keep_before_ts is not None:
+            # The rollups which are not rebuilt are converted instead
+            _change_statistics_unit_for_table(
+                session, StatisticsRollups, metadata_id, convert
+            )
+        _rebuild_statistics_rollups(session, metadata_id, keep_before_ts=keep_before_ts)
 
         statistics_meta_manager.update_unit_of_measurement(
             session, statistic_id, new_unit
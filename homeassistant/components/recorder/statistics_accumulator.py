@@ -0,0 +1,330 @@
+"""Running aggregates of recorded states used to compile statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import math
+
+from homeassistant.components.sensor import ATTR_STATE_CLASS, SensorStateClass
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+
+from .db_schema import Statistics, StatisticsBase, StatisticsShortTerm
+from .models import StatisticDataTimestamp
+
+SHORT_TERM_PERIOD = StatisticsShortTerm.duration.total_seconds()
+HOURLY_PERIOD = Statistics.duration.total_seconds()
+
+# Closed windows are kept this many periods for a compile which runs late
+MAX_CLOSED_WINDOWS = 2
+
+SENSOR_DOMAIN = "sensor"
+
+
+@dataclass(slots=True)
+class StateAggregate:
+    """Aggregated states of an entity during a 5-minute period.
+
+    mean, min and max are None if there were no numeric states. float_states
+    holds the numeric states of sensors which compile a sum, the sum can only
+    be calculated from the ordered states since it has to detect resets.
+    """
+
+    state_class: str
+    unit: str | None
+    mixed_units: bool
+    mean: float | None
+    min: float | None
+    max: float | None
+    last_state: State | None
+    float_states: list[tuple[float, State]] | None
+
+
+def _float_value(state: State | None) -> float | None:
+    """Return the finite float value of a state or None."""
+    if state is None:
+        return None
+    try:
+        value = float(state.state)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+class _EntityWindow:
+    """Running aggregate of the states of an entity during a period."""
+
+    __slots__ = (
+        "area",
+        "complete",
+        "float_states",
+        "last_state",
+        "last_ts",
+        "max",
+        "min",
+        "mixed_units",
+        "start_ts",
+        "state_class",
+        "unit",
+        "value",
+        "value_start_ts",
+        "value_ts",
+    )
+
+    def __init__(self, start_ts: float, state_class: str, complete: bool) -> None:
+        """Initialize an empty window."""
+        self.start_ts = start_ts
+        self.state_class = state_class
+        # A window is complete if the state at its start is known, the first
+        # window after a restart is not and has to be compiled from the database
+        self.complete = complete
+        self.area = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.value: float | None = None
+        self.value_ts = start_ts
+        self.value_start_ts: float | None = None
+        self.last_state: State | None = None
+        self.last_ts = start_ts
+        self.unit: str | None = None
+        self.mixed_units = False
+        self.float_states: list[tuple[float, State]] | None = (
+            None if state_class == SensorStateClass.MEASUREMENT else []
+        )
+
+    def add(self, value: float | None, state: State | None, timestamp: float) -> None:
+        """Add a state to the window.
+
+        Like the statistics compiled from the database, states which are not
+        numeric are ignored and the previous value is used until the next
+        numeric state.
+        """
+        self.last_ts = timestamp
+        if value is None:
+            return
+        assert state is not None
+        if self.value is None:
+            self.value_start_ts = timestamp
+        else:
+            self.area += self.value * (timestamp - self.value_ts)
+        self.value = value
+        self.value_ts = timestamp
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self.last_state is None:
+            self.unit = unit
+        elif unit != self.unit:
+            self.mixed_units = True
+        self.last_state = state
+        if self.float_states is not None:
+            self.float_states.append((value, state))
+
+    def aggregate(self, end_ts: float) -> StateAggregate:
+        """Return the aggregate of the window ending at end_ts."""
+        mean: float | None = None
+        if self.value is not None:
+            assert self.value_start_ts is not None
+            area = self.area + self.value * (end_ts - self.value_ts)
+            duration = end_ts - self.value_start_ts
+            mean = area / duration if duration else 0.0
+        return StateAggregate(
+            self.state_class,
+            self.unit,
+            self.mixed_units,
+            mean,
+            None if self.value is None else self.min,
+            None if self.value is None else self.max,
+            self.last_state,
+            self.float_states,
+        )
+
+    def next_window(self, start_ts: float, last_value: float | None) -> _EntityWindow:
+        """Return the following window, starting with the current value."""
+        window = _EntityWindow(start_ts, self.state_class, True)
+        window.add(last_value, self.last_state, start_ts)
+        return window
+
+
+class _EntityAccumulator:
+    """Current and recently closed windows of an entity."""
+
+    __slots__ = ("closed", "last_value", "window")
+
+    def __init__(self, window: _EntityWindow) -> None:
+        """Initialize the accumulator."""
+        self.window = window
+        # The value of the last recorded state, None if it was not numeric
+        self.last_value: float | None = None
+        self.closed: dict[float, StateAggregate] = {}
+
+    def roll(self, start_ts: float) -> None:
+        """Close the current window and start a new window at start_ts.
+
+        Periods without states in between are closed as well, they keep
+        the last value during the whole period.
+        """
+        oldest_ts = start_ts - MAX_CLOSED_WINDOWS * SHORT_TERM_PERIOD
+        window = self.window
+        while window.start_ts < start_ts:
+            end_ts = window.start_ts + SHORT_TERM_PERIOD
+            if window.complete and window.start_ts >= oldest_ts:
+                self.closed[window.start_ts] = window.aggregate(end_ts)
+            window = window.next_window(max(end_ts, oldest_ts), self.last_value)
+        for closed_ts in [ts for ts in self.closed if ts < oldest_ts]:
+            del self.closed[closed_ts]
+        self.window = window
+
+
+class StatisticsAccumulators:
+    """Running aggregates used to compile statistics without reading states.
+
+    The recorder feeds the states of sensors with a state class as they are
+    written. When the 5-minute statistics are compiled, the aggregate of a
+    period is handed out if the state at the start of the period is known,
+    otherwise the statistics are compiled from the database. After a restart,
+    the accumulators thus take over from the database from the second period
+    on.
+
+    The compiled 5-minute statistics are summarized to hourly statistics in
+    the same way, if all periods of the hour were compiled in sequence.
+
+    The accumulators are only accessed from the recorder thread.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the accumulators."""
+        self._entities: dict[str, _EntityAccumulator] = {}
+        self._hour_start_ts: float | None = None
+        self._hour_next_ts: float | None = None
+        self._hour_summary: dict[int, StatisticDataTimestamp] = {}
+        self._hour_means: dict[int, list[float]] = {}
+
+    def add_state(self, entity_id: str, state: State | None, timestamp: float) -> None:
+        """Add a recorded state, state is None if the entity was removed."""
+        if state is None:
+            self._entities.pop(entity_id, None)
+            return
+        if state.domain != SENSOR_DOMAIN or not (
+            state_class := state.attributes.get(ATTR_STATE_CLASS)
+        ):
+            self._entities.pop(entity_id, None)
+            return
+        window_start_ts = timestamp - timestamp % SHORT_TERM_PERIOD
+        if (accumulator := self._entities.get(entity_id)) is None:
+            accumulator = self._entities[entity_id] = _EntityAccumulator(
+                _EntityWindow(window_start_ts, state_class, False)
+            )
+        elif timestamp < accumulator.window.last_ts:
+            # States are expected in order
+            del self._entities[entity_id]
+            return
+        elif window_start_ts > accumulator.window.start_ts:
+            accumulator.roll(window_start_ts)
+        window = accumulator.window
+        if window.state_class != state_class:
+            window.state_class = state_class
+            window.complete = False
+        value = accumulator.last_value = _float_value(state)
+        window.add(value, state, timestamp)
+
+    def pop_aggregates(
+        self, entity_ids: Iterable[str], start_ts: float
+    ) -> dict[str, StateAggregate]:
+        """Return the aggregates of the 5-minute period starting at start_ts.
+
+        Entities without a complete aggregate for the period are not included,
+        their statistics have to be compiled from the database.
+        """
+        aggregates: dict[str, StateAggregate] = {}
+        end_ts = start_ts + SHORT_TERM_PERIOD
+        for entity_id in entity_ids:
+            if (accumulator := self._entities.get(entity_id)) is None:
+                continue
+            if accumulator.window.start_ts < end_ts:
+                # No states have been recorded since the end of the period
+                accumulator.roll(end_ts)
+            if (aggregate := accumulator.closed.pop(start_ts, None)) is not None:
+                aggregates[entity_id] = aggregate
+        return aggregates
+
+    def add_short_term_statistics(
+        self, start_ts: float, short_term_stats: Iterable[StatisticsBase]
+    ) -> None:
+        """Add the compiled 5-minute statistics of a period to the hourly summary."""
+        hour_start_ts = start_ts - start_ts % HOURLY_PERIOD
+        if start_ts == hour_start_ts:
+            self._reset_hour(hour_start_ts)
+        elif start_ts != self._hour_next_ts:
+            # A period was missed or compiled twice
+            self._reset_hour(None)
+            return
+        self._hour_next_ts = start_ts + SHORT_TERM_PERIOD
+        summary = self._hour_summary
+        for stat in short_term_stats:
+            metadata_id = stat.metadata_id
+            assert metadata_id is not None
+            if (item := summary.get(metadata_id)) is None:
+                item = summary[metadata_id] = {
+                    "start_ts": hour_start_ts,
+                    "mean": None,
+                    "min": None,
+                    "max": None,
+                }
+                self._hour_means[metadata_id] = []
+            if stat.mean is not None:
+                self._hour_means[metadata_id].append(stat.mean)
+            if stat.min is not None:
+                item["min"] = (
+                    stat.min if item["min"] is None else min(item["min"], stat.min)
+                )
+            if stat.max is not None:
+                item["max"] = (
+                    stat.max if item["max"] is None else max(item["max"], stat.max)
+                )
+            # Like the database query, sum and state are taken from the
+            # last 5-minute statistics of the hour
+            item["last_reset_ts"] = stat.last_reset_ts
+            item["state"] = stat.state
+            item["sum"] = stat.sum
+
+    def pop_hourly_summary(
+        self, start_ts: float
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly summary of the hour starting at start_ts.
+
+        Returns None if not all 5-minute periods of the hour were added, the
+        summary has to be compiled from the database instead.
+        """
+        summary: dict[int, StatisticDataTimestamp] | None = None
+        if (
+            self._hour_start_ts == start_ts
+            and self._hour_next_ts == start_ts + HOURLY_PERIOD
+        ):
+            summary = self._hour_summary
+            for metadata_id, means in self._hour_means.items():
+                if means:
+                    summary[metadata_id]["mean"] = math.fsum(means) / len(means)
+        self._reset_hour(None)
+        return summary
+
+    def invalidate_hourly_summary(self) -> None:
+        """Invalidate the hourly summary, the 5-minute statistics were modified."""
+        self._reset_hour(None)
+
+    def remove(self, entity_ids: Iterable[str]) -> None:
+        """Remove entities, for example when they are renamed."""
+        for entity_id in entity_ids:
+            self._entities.pop(entity_id, None)
+
+    def clear(self) -> None:
+        """Clear the running aggregates of the states."""
+        self._entities.clear()
+
+    def _reset_hour(self, hour_start_ts: float | None) -> None:
+        """Start a new hourly summary."""
+        self._hour_start_ts = hour_start_ts
+        self._hour_next_ts = hour_start_ts
+        self._hour_summary = {}
+        self._hour_means = {}
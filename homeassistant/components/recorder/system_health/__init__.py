@@ -44,6 +44,33 @@ def _get_db_stats(instance: Recorder, database_name: str) -> dict[str, Any]:
     return db_stats
 
 
+@callback
+def _async_get_read_job_info(instance: Recorder) -> dict[str, Any]:
+    """Get the timings of recent read queries."""
+    if not (timings := instance.read_job_timings.as_dict()):
+        return {}
+    return {
+        "read_query_time": f"{timings['average_run']:.1f} / {timings['max_run']:.1f}",
+        "read_query_queue_wait": (
+            f"{timings['average_wait']:.1f} / {timings['max_wait']:.1f}"
+        ),
+    }
+
+
+@callback
+def _async_get_commit_info(instance: Recorder) -> dict[str, Any]:
+    """Get the number, sizes and durations of recent commits."""
+    if not (stats := instance.commit_scheduler.as_dict()):
+        return {}
+    return {
+        "commits": stats["commits"],
+        "commit_size": f"{stats['average_size']:.1f} / {stats['max_size']}",
+        "commit_time": (
+            f"{stats['average_duration']:.1f} / {stats['max_duration']:.1f}"
+        ),
+    }
+
+
 @callback
 def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     """Get database engine info."""
@@ -72,4 +99,10 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return (
+        db_runs
+        | db_stats
+        | db_engine_info
+        | _async_get_read_job_info(instance)
+        | _async_get_commit_info(instance)
+    )
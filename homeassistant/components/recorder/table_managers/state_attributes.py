@@ -6,6 +6,7 @@ from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from lru import LRU
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -28,6 +29,12 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of attribute ids to remember the last use of
+#
+# Purging uses it to skip checking the states table for attributes
+# that are still used by recent states.
+LAST_USED_CACHE_SIZE = 16384
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +44,9 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # attributes_id -> last_updated_ts of the newest state recorded with it
+        self._last_used: LRU[int, float] = LRU(LAST_USED_CACHE_SIZE)
+        self._pending_last_used: dict[str, float] = {}
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -132,9 +142,53 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        last_used = self._last_used
         for shared_attrs, db_state_attributes in self._pending.items():
-            self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            attributes_id = db_state_attributes.attributes_id
+            self._id_map[shared_attrs] = attributes_id
+            if (timestamp := self._pending_last_used.get(shared_attrs)) is not None:
+                last_used[attributes_id] = timestamp
         self._pending.clear()
+        self._pending_last_used.clear()
+
+    def mark_used(self, shared_attrs: str, timestamp: float) -> None:
+        """Remember that a state recorded at timestamp uses the shared_attrs.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if shared_attrs in self._pending:
+            self._pending_last_used[shared_attrs] = timestamp
+        elif (attributes_id := self._id_map.get(shared_attrs)) is not None:
+            self._last_used[attributes_id] = timestamp
+
+    def select_used_after(self, attributes_ids: set[int], timestamp: float) -> set[int]:
+        """Return the attributes_ids used by a state recorded at or after timestamp.
+
+        These attributes_ids are still referenced when the states older than
+        timestamp are purged, so the states table does not have to be checked
+        for them. Unknown attributes_ids are not returned.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        last_used = self._last_used
+        return {
+            attributes_id
+            for attributes_id in attributes_ids
+            if (last_used_ts := last_used.get(attributes_id)) is not None
+            and last_used_ts >= timestamp
+        }
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._last_used.clear()
+        self._pending_last_used.clear()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -143,6 +197,9 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         id_map = self._id_map
+        last_used = self._last_used
+        for purged_attributes_id in attributes_ids:
+            last_used.pop(purged_attributes_id, None)
         state_attributes_ids_reversed = {
             attributes_id: shared_attrs
             for shared_attrs, attributes_id in id_map.items()
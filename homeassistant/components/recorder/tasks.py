@@ -15,7 +15,7 @@ from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
 from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from .const import DOMAIN, STATISTICS_ROLLUPS_REBUILD_BATCH_SIZE
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -205,6 +205,24 @@ class ImportStatisticsTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild the statistics rollups."""
+
+    start_metadata_id: int
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics rollups rebuild task."""
+        next_metadata_id = statistics.rebuild_statistics_rollups(
+            instance, self.start_metadata_id, STATISTICS_ROLLUPS_REBUILD_BATCH_SIZE
+        )
+        if next_metadata_id is None:
+            instance.statistics_rollups_ready = True
+            return
+        # Schedule a new task to rebuild the rollups of the next statistics
+        instance.queue_task(RebuildStatisticsRollupsTask(next_metadata_id))
+
+
 @dataclass(slots=True)
 class AdjustStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an adjust statistics task."""
@@ -284,6 +302,17 @@ class KeepAliveTask(RecorderTask):
         instance._send_keep_alive()  # noqa: SLF001
 
 
+@dataclass(slots=True)
+class ReplaySpooledEventsTask(RecorderTask):
+    """Process the events spooled to disk."""
+
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_spooled_events()  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class CommitTask(RecorderTask):
     """Commit the event session."""
@@ -11,6 +11,7 @@ import logging
 import os
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, NoReturn
+from urllib.parse import quote
 
 from awesomeversion import (
     AwesomeVersion,
@@ -18,8 +19,8 @@ from awesomeversion import (
     AwesomeVersionStrategy,
 )
 import ciso8601
-from sqlalchemy import inspect, text
-from sqlalchemy.engine import Result, Row
+from sqlalchemy import create_engine, event as sqlalchemy_event, inspect, make_url, text
+from sqlalchemy.engine import URL, Engine, Result, Row
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import OperationalError, SQLAlchemyError, StatementError
 from sqlalchemy.orm.query import Query
@@ -50,6 +51,7 @@ from .models import (
     UnsupportedDialect,
     process_timestamp,
 )
+from .pool import RecorderPool
 
 if TYPE_CHECKING:
     from sqlite3.dbapi2 import Cursor as SQLiteCursor
@@ -221,6 +223,16 @@ def dburl_to_path(dburl: str) -> str:
     return dburl.removeprefix(SQLITE_URL_PREFIX)
 
 
+def sqlite_read_only_url(dburl: str) -> URL:
+    """Convert a SQLite db url into a url which opens the database read-only."""
+    url = make_url(dburl)
+    assert url.database is not None
+    return url.set(
+        database=f"file:{quote(url.database)}",
+        query={**url.query, "mode": "ro", "uri": "true"},
+    )
+
+
 def last_run_was_recently_clean(cursor: SQLiteCursor) -> bool:
     """Verify the last recorder run was recently clean."""
 
@@ -455,6 +467,38 @@ def async_create_backup_failure_issue(
     )
 
 
+def _setup_read_only_sqlite_connection(
+    dbapi_connection: DBAPIConnection, connection_record: Any
+) -> None:
+    """Execute statements needed for a read-only SQLite connection."""
+    execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
+    # The upper bound on the cache size is approximately 16MiB of memory
+    execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+
+
+def create_read_only_sqlite_engine(
+    dburl: str,
+    pool_size: int,
+    worker_thread_ids: set[int],
+    cached_statements: int,
+) -> Engine:
+    """Create an engine with a pool of read-only connections to a SQLite database.
+
+    Each worker thread reuses its connection, which caches up to
+    cached_statements prepared statements.
+    """
+    engine = create_engine(
+        sqlite_read_only_url(dburl),
+        poolclass=RecorderPool,
+        pool_size=pool_size,
+        recorder_and_worker_thread_ids=worker_thread_ids,
+        connect_args={"cached_statements": cached_statements},
+        future=True,
+    )
+    sqlalchemy_event.listen(engine, "connect", _setup_read_only_sqlite_connection)
+    return engine
+
+
 def setup_connection_for_dialect(
     instance: Recorder,
     dialect_name: str,
@@ -24,6 +24,7 @@ from homeassistant.components.recorder.models import (
     StatisticMetaData,
     StatisticResult,
 )
+from homeassistant.components.recorder.statistics_accumulator import StateAggregate
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     REVOLUTIONS_PER_MINUTE,
@@ -402,6 +403,63 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _get_aggregates(
+    hass: HomeAssistant,
+    session: Session,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+) -> dict[str, StateAggregate]:
+    """Get the aggregated states of the period if the recorder accumulates them.
+
+    Aggregates which can't be used as they are, because the state class changed
+    or the mean, min and max need unit conversion, are dropped and those
+    statistics are compiled from the database.
+    """
+    instance = get_instance(hass)
+    if (statistics_accumulators := instance.statistics_accumulators) is None:
+        return {}
+    aggregates = statistics_accumulators.pop_aggregates(
+        [state.entity_id for state in sensor_states], start.timestamp()
+    )
+    for _state in sensor_states:
+        entity_id = _state.entity_id
+        if (aggregate := aggregates.get(entity_id)) is None:
+            continue
+        state_class_changed = (
+            aggregate.state_class != _state.attributes[ATTR_STATE_CLASS]
+        )
+        # The states are only kept for sensors which compile a sum
+        kept_states = aggregate.float_states is not None
+        compiles_sum = "sum" in wanted_statistics[entity_id]
+        mean_of_mixed_units = (
+            not kept_states and aggregate.mean is not None and aggregate.mixed_units
+        )
+        if state_class_changed or kept_states != compiles_sum or mean_of_mixed_units:
+            del aggregates[entity_id]
+    if not (
+        mean_entity_ids := {
+            entity_id
+            for entity_id, aggregate in aggregates.items()
+            if aggregate.float_states is None and aggregate.mean is not None
+        }
+    ):
+        return aggregates
+    metadatas = statistics.get_metadata_with_session(
+        instance, session, statistic_ids=mean_entity_ids
+    )
+    for entity_id in mean_entity_ids:
+        if entity_id not in metadatas:
+            continue
+        statistics_unit = metadatas[entity_id][1]["unit_of_measurement"]
+        if (
+            statistics_unit in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER
+            and aggregates[entity_id].unit != statistics_unit
+        ):
+            del aggregates[entity_id]
+    return aggregates
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,9 +471,12 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    aggregates = _get_aggregates(hass, session, sensor_states, wanted_statistics, start)
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in aggregates
     ]
     history_list: dict[str, list[State]] = {}
     if entities_full_history:
@@ -430,7 +491,7 @@ def compile_statistics(  # noqa: C901
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
-        if "sum" not in wanted_statistics[i.entity_id]
+        if "sum" not in wanted_statistics[i.entity_id] and i.entity_id not in aggregates
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -445,6 +506,17 @@ def compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if (aggregate := aggregates.get(entity_id)) is not None:
+            if aggregate.float_states is not None:
+                float_states = aggregate.float_states
+            elif aggregate.mean is not None:
+                assert aggregate.last_state is not None
+                float_states = [(aggregate.mean, aggregate.last_state)]
+            else:
+                float_states = []
+            if float_states:
+                entities_with_float_states[entity_id] = float_states
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -460,22 +532,34 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[
+        tuple[str, str | None, str, list[tuple[float, State]], StateAggregate | None]
+    ] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
         if not (maybe_float_states := entities_with_float_states.get(entity_id)):
             continue
-        statistics_unit, valid_float_states = _normalize_states(
-            hass,
-            old_metadatas,
-            maybe_float_states,
-            entity_id,
-        )
+        if (
+            aggregate := aggregates.get(entity_id)
+        ) is not None and aggregate.float_states is None:
+            # The mean, min and max were aggregated in the unit of the statistics
+            statistics_unit = aggregate.unit
+            valid_float_states = maybe_float_states
+        else:
+            aggregate = None
+            statistics_unit, valid_float_states = _normalize_states(
+                hass,
+                old_metadatas,
+                maybe_float_states,
+                entity_id,
+            )
         if not valid_float_states:
             continue
         state_class: str = _state.attributes[ATTR_STATE_CLASS]
-        to_process.append((entity_id, statistics_unit, state_class, valid_float_states))
+        to_process.append(
+            (entity_id, statistics_unit, state_class, valid_float_states, aggregate)
+        )
         if "sum" in wanted_statistics[entity_id]:
             to_query.add(entity_id)
 
@@ -487,6 +571,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit,
         state_class,
         valid_float_states,
+        aggregate,
     ) in to_process:
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -525,17 +610,23 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
+        if aggregate is not None:
+            assert aggregate.max is not None and aggregate.min is not None
+            stat["max"] = aggregate.max
+            stat["min"] = aggregate.min
+            stat["mean"] = aggregate.mean
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(zip(*valid_float_states, strict=False), 1)
+                )
 
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
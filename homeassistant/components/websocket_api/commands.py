@@ -14,6 +14,8 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
@@ -64,6 +66,7 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import async_get_entity_subscriptions
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
@@ -89,6 +92,7 @@ def async_register_commands(
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -367,31 +371,18 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+def _entity_filter_key(msg: dict[str, Any]) -> tuple:
+    """Return a hashable key of the include and exclude filter of a message."""
+    return tuple(
+        (
+            filter_type,
+            tuple(
+                sorted((key, tuple(values)) for key, values in msg[filter_type].items())
+            ),
+        )
+        for filter_type in (CONF_INCLUDE, CONF_EXCLUDE)
+        if filter_type in msg
+    )
 
 
 @callback
@@ -415,16 +406,15 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
+    connection.subscriptions[msg_id] = async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(
+        connection.send_message,
+        message_id_as_bytes,
+        connection.user,
+        entity_ids,
+        entity_filter,
+        _entity_filter_key(msg),
     )
     connection.send_result(msg_id)
 
@@ -579,6 +569,37 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "template/render_stats",
+        vol.Optional("limit"): cv.positive_int,
+    }
+)
+@decorators.require_admin
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command.
+
+    The templates are sorted by the total time spent rendering them.
+    """
+    render_stats = sorted(
+        template.async_get_render_stats(hass).items(),
+        key=lambda item: item[1].total_time,
+        reverse=True,
+    )
+    if (limit := msg.get("limit")) is not None:
+        render_stats = render_stats[:limit]
+    connection.send_result(
+        msg["id"],
+        [
+            {"template": template_str, **stats.as_dict()}
+            for template_str, stats in render_stats
+        ],
+    )
+
+
 @lru_cache
 def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
     """Return a cached template."""
@@ -58,3 +58,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSED_MESSAGES = "compressed_messages"
+
+# Messages of at least this size are sent zlib compressed in a binary frame
+# to clients supporting compressed messages, unless the websocket already
+# compresses with permessage-deflate
+COMPRESSED_MESSAGE_MIN_SIZE: Final = 16 * 1024
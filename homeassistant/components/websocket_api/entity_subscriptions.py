@@ -0,0 +1,202 @@
+"""Shared fan-out of state changes to subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from functools import partial
+import logging
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptions] = HassKey(
+    f"{DOMAIN}_entity_subscriptions"
+)
+
+
+class _EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "entity_ids",
+        "filter_key",
+        "message_id_as_bytes",
+        "send_message",
+        "user",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+        user: User,
+        entity_ids: set[str] | None,
+        filter_key: Hashable | None,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.message_id_as_bytes = message_id_as_bytes
+        self.user = user
+        self.entity_ids = entity_ids
+        self.filter_key = filter_key
+
+
+class EntitySubscriptions:
+    """Forward state changes to all subscribe_entities subscriptions.
+
+    A single state_changed listener serves all connections. Subscriptions
+    for specific entities are indexed by entity_id so a state change only
+    visits the subscriptions interested in it. Subscriptions with the same
+    entity filter share it, and the filter and the permissions of a user
+    are checked once per state change. The diff message is serialized once
+    and only the message id differs per subscription.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the subscriptions."""
+        self.hass = hass
+        self._by_entity_id: dict[str, dict[_EntitySubscription, None]] = {}
+        self._all_entities: dict[_EntitySubscription, None] = {}
+        # Entity filters shared by subscriptions and their number of users
+        self._filters: dict[Hashable, tuple[Callable[[str], bool], int]] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        message_id_as_bytes: bytes,
+        user: User,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        filter_key: Hashable,
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes, returns a callback to unsubscribe.
+
+        filter_key identifies the configuration of entity_filter, the filter
+        of the first subscription with the same key is shared.
+        """
+        if entity_filter is None:
+            shared_key: Hashable | None = None
+        else:
+            shared_key = filter_key
+            shared_filter, users = self._filters.get(shared_key, (entity_filter, 0))
+            self._filters[shared_key] = (shared_filter, users + 1)
+        subscription = _EntitySubscription(
+            send_message, message_id_as_bytes, user, entity_ids, shared_key
+        )
+        if entity_ids:
+            for entity_id in entity_ids:
+                self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        else:
+            self._all_entities[subscription] = None
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_state_changed
+            )
+        return partial(self._async_unsubscribe, subscription)
+
+    @callback
+    def _async_unsubscribe(self, subscription: _EntitySubscription) -> None:
+        """Remove a subscription."""
+        if entity_ids := subscription.entity_ids:
+            for entity_id in entity_ids:
+                subscriptions = self._by_entity_id[entity_id]
+                del subscriptions[subscription]
+                if not subscriptions:
+                    del self._by_entity_id[entity_id]
+        else:
+            del self._all_entities[subscription]
+        if (filter_key := subscription.filter_key) is not None:
+            shared_filter, users = self._filters[filter_key]
+            if users == 1:
+                del self._filters[filter_key]
+            else:
+                self._filters[filter_key] = (shared_filter, users - 1)
+        if (
+            not self._by_entity_id
+            and not self._all_entities
+            and self._unsub_state_changed is not None
+        ):
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @callback
+    def _async_forward_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the subscriptions interested in it."""
+        entity_id = event.data["entity_id"]
+        by_entity_id = self._by_entity_id.get(entity_id)
+        if not by_entity_id and not self._all_entities:
+            return
+        filter_results: dict[Hashable, bool] = {}
+        read_permissions: dict[str, bool] = {}
+        partial_message: bytes | None = None
+        for subscriptions in (by_entity_id, self._all_entities):
+            if not subscriptions:
+                continue
+            for subscription in subscriptions:
+                if (filter_key := subscription.filter_key) is not None:
+                    if (included := filter_results.get(filter_key)) is None:
+                        included = filter_results[filter_key] = self._filters[
+                            filter_key
+                        ][0](entity_id)
+                    if not included:
+                        continue
+                # We have to lookup the permissions again because the user
+                # might have changed since the subscription was created.
+                user = subscription.user
+                if (can_read := read_permissions.get(user.id)) is None:
+                    can_read = read_permissions[user.id] = _can_read_entity(
+                        user, entity_id
+                    )
+                if not can_read:
+                    continue
+                if partial_message is None:
+                    partial_message = messages.partial_state_diff_message(event)
+                # A failing subscription must not stop the others
+                try:
+                    subscription.send_message(
+                        messages.state_diff_message(
+                            partial_message, subscription.message_id_as_bytes
+                        )
+                    )
+                except Exception:
+                    _LOGGER.exception(
+                        "Error sending the state change of %s to a subscription",
+                        entity_id,
+                    )
+
+
+def _can_read_entity(user: User, entity_id: str) -> bool:
+    """Return if the user may read the state of an entity."""
+    permissions = user.permissions
+    return (
+        user.is_admin
+        or permissions.access_all_entities(POLICY_READ)
+        or permissions.check_entity(entity_id, POLICY_READ)
+    )
+
+
+@callback
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the shared entity subscriptions."""
+    if (entity_subscriptions := hass.data.get(DATA_ENTITY_SUBSCRIPTIONS)) is None:
+        entity_subscriptions = hass.data[DATA_ENTITY_SUBSCRIPTIONS] = (
+            EntitySubscriptions(hass)
+        )
+    return entity_subscriptions
@@ -9,6 +9,7 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
 from aiohttp.http_websocket import WebSocketWriter
@@ -23,6 +24,7 @@ from homeassistant.util.json import json_loads
 
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    COMPRESSED_MESSAGE_MIN_SIZE,
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
@@ -130,6 +132,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -140,6 +143,9 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        can_compress = False
+        # Compressing again is pointless if permessage-deflate was negotiated
+        transport_compressed = bool(wsock.compress)
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
@@ -155,18 +161,23 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if not can_compress:
+                    # compression may be enabled later in the connection
+                    can_compress = connection.can_compress and not transport_compressed
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
-                    if is_debug_log_enabled():
-                        debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
-                    continue
-
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
-                message_queue.clear()
+                else:
+                    message = b"".join((b"[", b",".join(message_queue), b"]"))
+                    message_queue.clear()
                 if is_debug_log_enabled():
-                    debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                    debug("%s: Sending %s", self.description, message)
+                if can_compress and len(message) >= COMPRESSED_MESSAGE_MIN_SIZE:
+                    await send_bytes_binary(
+                        await self._hass.async_add_executor_job(zlib.compress, message)
+                    )
+                else:
+                    await send_bytes_text(message)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -331,6 +342,7 @@ class WebSocketHandler:
             assert writer is not None
 
         send_bytes_text = partial(writer.send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(writer.send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -338,7 +350,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection)
         except asyncio.CancelledError:
@@ -373,6 +387,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -403,7 +418,9 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
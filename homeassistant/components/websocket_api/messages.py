@@ -141,34 +141,13 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
-def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
-) -> bytes:
-    """Return an event message.
+def state_diff_message(partial_message: bytes, message_id_as_bytes: bytes) -> bytes:
+    """Return a state diff message from the message without id."""
+    return b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
 
-    Serialize to json once per message.
 
-    Since we can have many clients connected that are
-    all getting many of the same events (mostly state changed)
-    we can avoid serializing the same data for each connection.
-    """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
-    )
-
-
-@lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
-    """Cache and serialize the event to json.
-
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
-    """
+def partial_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+    """Serialize the state diff of the event to json without the message id."""
     return (
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
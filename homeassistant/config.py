@@ -6,6 +6,7 @@ import asyncio
 from collections import OrderedDict
 from collections.abc import Callable, Hashable, Iterable, Sequence
 from contextlib import suppress
+from copy import copy
 from dataclasses import dataclass
 from enum import StrEnum
 from functools import partial, reduce
@@ -28,13 +29,16 @@ from .core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant, callback
 from .core_config import _PACKAGE_DEFINITION_SCHEMA, _PACKAGES_CONFIG_SCHEMA
 from .exceptions import ConfigValidationError, HomeAssistantError
 from .helpers import config_validation as cv
+from .helpers.storage import STORAGE_DIR
 from .helpers.translation import async_get_exception_message
 from .helpers.typing import ConfigType
 from .loader import ComponentProtocol, Integration, IntegrationNotFound
 from .requirements import RequirementsNotFound, async_get_integration_with_requirements
 from .util.async_ import create_eager_task
+from .util.hass_dict import HassKey
 from .util.package import is_docker_env
 from .util.yaml import SECRET_YAML, Secrets, YamlTypeError, load_yaml_dict
+from .util.yaml.cache import YamlCache
 from .util.yaml.objects import NodeStrClass
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,6 +46,11 @@ _LOGGER = logging.getLogger(__name__)
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
+YAML_CACHE_FILE = "core.yaml_cache"
+DATA_YAML_CACHE: HassKey[YamlCache] = HassKey("yaml_cache")
+DATA_VALIDATED_PLATFORM_CONFIGS: HassKey[dict[str, dict[str, ConfigType]]] = HassKey(
+    "validated_platform_configs"
+)
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 
@@ -206,6 +215,18 @@ def _write_default_config(config_dir: str) -> bool:
     return True
 
 
+@callback
+def async_enable_yaml_cache(hass: HomeAssistant) -> None:
+    """Cache the parsed YAML configuration files between runs.
+
+    Only the files with a changed content are parsed when the configuration
+    is loaded.
+    """
+    hass.data[DATA_YAML_CACHE] = YamlCache(
+        hass.config.path(STORAGE_DIR, YAML_CACHE_FILE)
+    )
+
+
 async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     """Load YAML from a Home Assistant configuration file.
 
@@ -213,6 +234,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
     configuration by itself. Include package merge.
     """
     secrets = Secrets(Path(hass.config.config_dir))
+    cache = hass.data.get(DATA_YAML_CACHE)
 
     # Not using async_add_executor_job because this is an internal method.
     try:
@@ -221,6 +243,7 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
             load_yaml_config_file,
             hass.config.path(YAML_CONFIG_FILE),
             secrets,
+            cache,
         )
     except HomeAssistantError as exc:
         if not (base_exc := exc.__cause__) or not isinstance(base_exc, MarkedYAMLError):
@@ -264,16 +287,18 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> dict:
 
 
 def load_yaml_config_file(
-    config_path: str, secrets: Secrets | None = None
+    config_path: str, secrets: Secrets | None = None, cache: YamlCache | None = None
 ) -> dict[Any, Any]:
     """Parse a YAML configuration file.
 
+    The files which are not parsed are removed from the cache, if one is passed.
+
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
     try:
-        conf_dict = load_yaml_dict(config_path, secrets)
+        conf_dict = load_yaml_dict(config_path, secrets, cache)
     except YamlTypeError as exc:
         msg = (
             f"The configuration file {os.path.basename(config_path)} "
@@ -282,6 +307,9 @@ def load_yaml_config_file(
         _LOGGER.error(msg)
         raise HomeAssistantError(msg) from exc
 
+    if cache is not None:
+        cache.save()
+
     # Convert values to dictionaries if they are None
     for key, value in conf_dict.items():
         conf_dict[key] = value or {}
@@ -1042,6 +1070,29 @@ class _PlatformIntegration:
     integration: Integration  # <Integration filter>
     config: ConfigType  # un-validated config
     validated_config: ConfigType  # component validated config
+    key: str  # key of the un-validated config in the validated platform configs
+
+
+def _copy_validated_config(value: Any) -> Any:
+    """Copy the dicts, lists and sets of a validated config.
+
+    The cached validated configs are reused across reloads, so the nested
+    containers must not be shared with the configs handed to the platforms.
+    Other values, like templates which reference hass, are not copied.
+    """
+    if isinstance(value, dict):
+        copied_dict = copy(value)
+        for key, item in copied_dict.items():
+            copied_dict[key] = _copy_validated_config(item)
+        return copied_dict
+    if isinstance(value, list):
+        copied_list = copy(value)
+        for idx, item in enumerate(copied_list):
+            copied_list[idx] = _copy_validated_config(item)
+        return copied_list
+    if isinstance(value, set):
+        return copy(value)
+    return value
 
 
 async def _async_load_and_validate_platform_integration(
@@ -1210,9 +1261,24 @@ async def async_process_component_config(
     if component_platform_schema is None:
         return IntegrationConfigInfo(config, [])
 
+    # Platform configs which did not change since they were last validated
+    # are not validated again, so reloading a large configuration only
+    # validates the changed platform configs
+    validated_platform_configs = hass.data.setdefault(
+        DATA_VALIDATED_PLATFORM_CONFIGS, {}
+    )
+    previously_validated = validated_platform_configs.get(domain, {})
+    validated: dict[str, ConfigType] = {}
+
     platform_integrations_to_load: list[_PlatformIntegration] = []
     platforms: list[ConfigType] = []
     for p_name, p_config in config_per_platform(config, domain):
+        p_key = repr(p_config)
+        if (p_previously_validated := previously_validated.get(p_key)) is not None:
+            validated[p_key] = p_previously_validated
+            platforms.append(_copy_validated_config(p_previously_validated))
+            continue
+
         # Validate component specific platform schema
         platform_path = f"{p_name}.{domain}"
         try:
@@ -1244,7 +1310,8 @@ async def async_process_component_config(
         # So if p_name is None we are not going to validate platform
         # (the automation component is one of them)
         if p_name is None:
-            platforms.append(p_validated)
+            validated[p_key] = p_validated
+            platforms.append(_copy_validated_config(p_validated))
             continue
 
         try:
@@ -1261,7 +1328,7 @@ async def async_process_component_config(
             continue
 
         platform_integration = _PlatformIntegration(
-            platform_path, p_name, p_integration, p_config, p_validated
+            platform_path, p_name, p_integration, p_config, p_validated, p_key
         )
         platform_integrations_to_load.append(platform_integration)
 
@@ -1288,18 +1355,23 @@ async def async_process_component_config(
             integration_docs,
             config_exceptions,
         )
-        platforms.extend(
-            validated_config
-            for validated_config in await asyncio.gather(
+        for p_integration, validated_config in zip(
+            platform_integrations_to_load,
+            await asyncio.gather(
                 *(
                     create_eager_task(
                         async_load_and_validate(p_integration), loop=hass.loop
                     )
                     for p_integration in platform_integrations_to_load
                 )
-            )
-            if validated_config is not None
-        )
+            ),
+            strict=True,
+        ):
+            if validated_config is not None:
+                validated[p_integration.key] = validated_config
+                platforms.append(_copy_validated_config(validated_config))
+
+    validated_platform_configs[domain] = validated
 
     # Create a copy of the configuration with all config for current
     # component removed and add validated config back in.
@@ -12,6 +12,7 @@ from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Hashable,
     Iterable,
     KeysView,
     Mapping,
@@ -33,12 +34,14 @@ from typing import (
     Any,
     Final,
     Generic,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
     cast,
     overload,
 )
+from weakref import WeakValueDictionary
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -200,6 +203,10 @@ EVENTS_EXCLUDED_FROM_MATCH_ALL = {
 
 _LOGGER = logging.getLogger(__name__)
 
+# Attribute values of these types are never interned since equal
+# containers may hold values of different types, like 1 and 1.0
+_NOT_INTERNED_ATTRIBUTE_TYPES = (tuple, frozenset)
+
 
 @functools.lru_cache(MAX_EXPECTED_ENTITY_IDS)
 def split_entity_id(entity_id: str) -> tuple[str, str]:
@@ -1449,6 +1456,52 @@ class _OneTimeListener(Generic[_DataT]):
 EMPTY_LIST: list[Any] = []
 
 
+class EventDispatchStats(TypedDict):
+    """Dispatch cost counters of an event type."""
+
+    fired: int  # number of times the event was fired
+    evaluated: int  # number of listeners considered
+    dispatched: int  # number of listeners run
+
+
+def _event_value_allowed(value: Any, allowed: frozenset[Hashable]) -> bool:
+    """Return if an event data value is one of the allowed values.
+
+    A list value is allowed if any of its items is allowed.
+    """
+    if type(value) is list:
+        return any(_hashable_value_allowed(item, allowed) for item in value)
+    return _hashable_value_allowed(value, allowed)
+
+
+def _hashable_value_allowed(value: Any, allowed: frozenset[Hashable]) -> bool:
+    """Return if a value is one of the allowed values."""
+    try:
+        is_allowed = value in allowed
+    except TypeError:
+        # Unhashable values are never allowed
+        return False
+    return is_allowed
+
+
+def _keyed_event_filter[_EventDataT: Mapping[str, Any]](
+    event_keys: Iterable[tuple[str, frozenset[Hashable]]],
+    event_filter: Callable[[_EventDataT], bool] | None,
+) -> Callable[[_EventDataT], bool]:
+    """Return an event filter for the keys which are not indexed by the bus."""
+    event_keys = tuple(event_keys)
+
+    @callback
+    def _async_keyed_event_filter(event_data: _EventDataT) -> bool:
+        """Filter events on the keys not indexed by the bus."""
+        for key, allowed in event_keys:
+            if not _event_value_allowed(event_data.get(key), allowed):
+                return False
+        return event_filter is None or event_filter(event_data)
+
+    return _async_keyed_event_filter
+
+
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
     """Verify the length of the event type and raise if too long."""
@@ -1459,7 +1512,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch_stats",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1528,16 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners with an event_keys filter are indexed by
+        # event type, then the key in the event data, then the allowed value
+        self._keyed_listeners: dict[
+            EventType[Any] | str,
+            dict[str, dict[Hashable, list[_FilterableJobType[Any]]]],
+        ] = {}
+        # Counters of fired, evaluated and dispatched listeners per event type
+        self._dispatch_stats: defaultdict[EventType[Any] | str, list[int]] = (
+            defaultdict(lambda: [0, 0, 0])
+        )
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1483,7 +1553,32 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(
+                {
+                    id(filterable_job)
+                    for listeners_by_value in keyed_listeners.values()
+                    for jobs in listeners_by_value.values()
+                    for filterable_job in jobs
+                }
+            )
+        return listeners
+
+    @callback
+    def async_dispatch_stats(self) -> dict[EventType[Any] | str, EventDispatchStats]:
+        """Return the dispatch cost counters per event type.
+
+        This method must be run in the event loop.
+        """
+        return {
+            event_type: EventDispatchStats(
+                fired=fired, evaluated=evaluated, dispatched=dispatched
+            )
+            for event_type, (fired, evaluated, dispatched) in (
+                self._dispatch_stats.items()
+            )
+        }
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1553,9 +1648,23 @@ class EventBus:
             match_all_listeners = self._match_all_listeners
         else:
             match_all_listeners = EMPTY_LIST
+        if event_data is not None and (
+            keyed_listeners := self._keyed_listeners.get(event_type)
+        ):
+            jobs = (
+                listeners
+                + self._async_match_keyed_listeners(keyed_listeners, event_data)
+                + match_all_listeners
+            )
+        else:
+            jobs = listeners + match_all_listeners
+
+        stats = self._dispatch_stats[event_type]
+        stats[0] += 1
+        stats[1] += len(jobs)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in jobs:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1564,6 +1673,7 @@ class EventBus:
                     _LOGGER.exception("Error in event filter")
                     continue
 
+            stats[2] += 1
             if not event:
                 event = Event(
                     event_type,
@@ -1578,6 +1688,35 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+    @staticmethod
+    def _async_match_keyed_listeners(
+        keyed_listeners: dict[str, dict[Hashable, list[_FilterableJobType[Any]]]],
+        event_data: Mapping[str, Any],
+    ) -> list[_FilterableJobType[Any]]:
+        """Return the keyed listeners indexed under the values of the event data."""
+        matches: list[_FilterableJobType[Any]] = []
+        for key, listeners_by_value in keyed_listeners.items():
+            if (value := event_data.get(key)) is None:
+                continue
+            if type(value) is not list:
+                try:
+                    if (jobs := listeners_by_value.get(value)) is not None:
+                        matches.extend(jobs)
+                except TypeError:
+                    # Unhashable values can't match any listener
+                    pass
+                continue
+            # A listener may be indexed under more than one of the items
+            list_matches: dict[_FilterableJobType[Any], None] = {}
+            for item in value:
+                try:
+                    if (jobs := listeners_by_value.get(item)) is not None:
+                        list_matches.update(dict.fromkeys(jobs))
+                except TypeError:
+                    continue
+            matches.extend(list_matches)
+        return matches
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1605,6 +1744,8 @@ class EventBus:
         listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
         event_filter: Callable[[_DataT], bool] | None = None,
         run_immediately: bool | object = _SENTINEL,
+        *,
+        event_keys: Mapping[str, Iterable[Hashable]] | None = None,
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
 
@@ -1615,6 +1756,16 @@ class EventBus:
         @callback that returns a boolean value, determines if the
         listener callable should run.
 
+        An optional event_keys mapping of event data keys to the allowed
+        values determines if the listener callable should run. The listener
+        only runs if the values of all the keys are allowed, a list value
+        is allowed if any of its items is allowed. Unlike the event_filter,
+        the event bus indexes the event_keys so firing an event only touches
+        the listeners whose keys match. event_keys can be combined with an
+        event_filter, which is then only called for matching events.
+        Listeners with event_keys run after the other listeners of the
+        event type and before the listeners of all events.
+
         If run_immediately is passed:
           - callbacks will be run right away instead of using call_soon.
           - coroutine functions will be scheduled eagerly.
@@ -1633,13 +1784,86 @@ class EventBus:
 
         if event_filter is not None and not is_callback_check_partial(event_filter):
             raise HomeAssistantError(f"Event filter {event_filter} is not a callback")
-        filterable_job = (HassJob(listener, f"listen {event_type}"), event_filter)
         if event_type == EVENT_STATE_REPORTED:
-            if not event_filter:
+            if not event_filter and not event_keys:
                 raise HomeAssistantError(
                     f"Event filter is required for event {event_type}"
                 )
-        return self._async_listen_filterable_job(event_type, filterable_job)
+        job = HassJob(listener, f"listen {event_type}")
+        if event_keys:
+            if event_type == MATCH_ALL:
+                # Events of all types can't be indexed by key
+                event_filter = _keyed_event_filter(
+                    ((key, frozenset(values)) for key, values in event_keys.items()),
+                    event_filter,
+                )
+            else:
+                return self._async_listen_keyed_job(
+                    event_type, job, event_keys, event_filter
+                )
+        return self._async_listen_filterable_job(event_type, (job, event_filter))
+
+    @callback
+    def _async_listen_keyed_job(
+        self,
+        event_type: EventType[_DataT] | str,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+        event_keys: Mapping[str, Iterable[Hashable]],
+        event_filter: Callable[[_DataT], bool] | None,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with matching event keys.
+
+        The listener is indexed under the allowed values of the first key,
+        the other keys are checked by the event filter of the listener.
+        """
+        (key, allowed), *other_keys = (
+            (key, frozenset(values)) for key, values in event_keys.items()
+        )
+        if other_keys:
+            event_filter = _keyed_event_filter(other_keys, event_filter)
+        filterable_job: _FilterableJobType[_DataT] = (job, event_filter)
+        listeners_by_value = self._keyed_listeners.setdefault(
+            event_type, {}
+        ).setdefault(key, {})
+        for value in allowed:
+            listeners_by_value.setdefault(value, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            key,
+            allowed,
+            filterable_job,
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        key: str,
+        allowed: frozenset[Hashable],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            listeners_by_value = keyed_listeners[key]
+            for value in allowed:
+                jobs = listeners_by_value[value]
+                jobs.remove(filterable_job)
+                if not jobs:
+                    del listeners_by_value[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+            return
+        if not listeners_by_value:
+            del keyed_listeners[key]
+            if not keyed_listeners:
+                del self._keyed_listeners[event_type]
 
     @callback
     def _async_listen_filterable_job(
@@ -2063,10 +2287,29 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class StateUpdate(NamedTuple):
+    """A state to set with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    # If not set, the context shared by all updates is used
+    context: Context | None = None
+    state_info: StateInfo | None = None
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_interned_attributes",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2077,6 +2320,11 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        # Equal attributes of states share one ReadOnlyDict, keyed by
+        # the attribute items in order
+        self._interned_attributes: WeakValueDictionary[
+            tuple[tuple[str, type, Any], ...], ReadOnlyDict[str, Any]
+        ] = WeakValueDictionary()
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2282,6 +2530,45 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[StateUpdate],
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the states of multiple entities at once.
+
+        All updates share one timestamp and, unless an update has its own
+        context, one context. A state_changed (or state_reported) event is
+        fired for each update. If a state is invalid, InvalidStateError is
+        raised and the updates after it are not set.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+        set_internal = self.async_set_internal
+        for (
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            update_context,
+            state_info,
+        ) in updates:
+            set_internal(
+                entity_id.lower(),
+                str(new_state),
+                attributes or {},
+                force_update,
+                update_context or context,
+                state_info,
+                timestamp,
+            )
+
     @callback
     def async_set_internal(
         self,
@@ -2316,7 +2603,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Attributes are interned, callers which pass on the attributes
+            # of a state take the identity check
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2357,6 +2648,8 @@ class StateMachine:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        elif attributes:
+            attributes = self._async_intern_attributes(attributes)
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2387,6 +2680,41 @@ class StateMachine:
             time_fired=timestamp,
         )
 
+    @callback
+    def _async_intern_attributes(
+        self, attributes: Mapping[str, Any]
+    ) -> ReadOnlyDict[str, Any]:
+        """Return a shared ReadOnlyDict equal to attributes.
+
+        Many entities have identical attributes, like the unit, device class
+        and state class of sensors. Attributes with values which can not be
+        hashed, or which are containers, are not shared.
+        """
+        key: tuple[tuple[str, type, Any], ...] | None = None
+        if not any(
+            isinstance(value, _NOT_INTERNED_ATTRIBUTE_TYPES)
+            for value in attributes.values()
+        ):
+            # The order of the attributes is kept as it is visible to the
+            # consumers of the state
+            key = tuple(
+                [(name, type(value), value) for name, value in attributes.items()]
+            )
+            try:
+                interned = self._interned_attributes.get(key)
+            except TypeError:
+                key = None
+            else:
+                if interned is not None:
+                    return interned
+        # A ReadOnlyDict can be shared as is, anything else may still be
+        # modified by the caller
+        if type(attributes) is not ReadOnlyDict:
+            attributes = ReadOnlyDict(attributes)
+        if key is not None:
+            self._interned_attributes[key] = attributes
+        return attributes
+
 
 class SupportsResponse(enum.StrEnum):
     """Service call response configuration."""
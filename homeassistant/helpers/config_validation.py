@@ -1337,6 +1337,64 @@ TARGET_SERVICE_FIELDS = {
 }
 
 
+@functools.lru_cache(1024)
+def _static_entity_ids(value: str) -> str | tuple[str, ...]:
+    """Validate a string of static entity IDs or all/none and cache the result."""
+    if (lower_value := value.lower()) in (ENTITY_MATCH_ALL, ENTITY_MATCH_NONE):
+        return lower_value
+    return tuple(entity_ids(value))
+
+
+def _compile_entity_ids_field(validator: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Compile the validator of the entity ID field of an entity service.
+
+    Static entity IDs, which service calls pass almost always, are validated
+    without trying each alternative of validator in turn. Anything else,
+    like templates or invalid entity IDs, is validated by validator.
+    """
+
+    def validate(value: Any) -> Any:
+        try:
+            if isinstance(value, str):
+                result = _static_entity_ids(value)
+                return result if isinstance(result, str) else list(result)
+            if isinstance(value, list):
+                return entity_ids(value)
+        except vol.Invalid:
+            pass
+        return validator(value)
+
+    return validate
+
+
+def _compile_target_ids_field(validator: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Compile the validator of a device, area, floor or label ID field.
+
+    Static IDs are returned as a list, anything else is validated by validator.
+    """
+
+    def validate(value: Any) -> Any:
+        if isinstance(value, str):
+            if value != ENTITY_MATCH_NONE and "{" not in value:
+                return [value]
+        elif type(value) is list and all(
+            isinstance(item, str) and "{" not in item for item in value
+        ):
+            return list(value)
+        return validator(value)
+
+    return validate
+
+
+_COMPILED_ENTITY_SERVICE_FIELDS: VolDictType = {
+    key: (
+        _compile_entity_ids_field(validator)
+        if key == ATTR_ENTITY_ID
+        else _compile_target_ids_field(validator)
+    )
+    for key, validator in ENTITY_SERVICE_FIELDS.items()
+}
+
 _HAS_ENTITY_SERVICE_FIELD = has_at_least_one_key(*ENTITY_SERVICE_FIELDS)
 
 
@@ -1367,14 +1425,16 @@ def _make_entity_service_schema(schema: dict, extra: int) -> VolSchemaType:
                 # The frontend stores data here. Don't use in core.
                 vol.Remove("metadata"): dict,
                 **schema,
-                **ENTITY_SERVICE_FIELDS,
+                **_COMPILED_ENTITY_SERVICE_FIELDS,
             },
             extra=extra,
         ),
         _HAS_ENTITY_SERVICE_FIELD,
     )
     setattr(validator, "_entity_service_schema", True)
-    return validator
+    # Calling vol.All compiles its validators on each call, the schema compiles
+    # them once
+    return vol.Schema(validator)
 
 
 BASE_ENTITY_SCHEMA = _make_entity_service_schema({}, vol.PREVENT_EXTRA)
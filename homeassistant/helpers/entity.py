@@ -1224,15 +1224,7 @@ class Entity(
             self._context_set = None
 
         try:
-            hass.states.async_set_internal(
-                entity_id,
-                state,
-                attr,
-                self.force_update,
-                self._context,
-                self._state_info,
-                time_now,
-            )
+            self._async_set_state(state, attr, time_now)
         except InvalidStateError:
             _LOGGER.exception(
                 "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
@@ -1241,6 +1233,21 @@ class Entity(
                 entity_id, STATE_UNKNOWN, {}, self.force_update, self._context
             )
 
+    @callback
+    def _async_set_state(
+        self, state: str, attr: dict[str, Any], timestamp: float
+    ) -> None:
+        """Set the calculated state of the entity in the state machine."""
+        self.hass.states.async_set_internal(
+            self.entity_id,
+            state,
+            attr,
+            self.force_update,
+            self._context,
+            self._state_info,
+            timestamp,
+        )
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
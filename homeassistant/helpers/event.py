@@ -1131,9 +1131,13 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        use_cached: bool = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
+        If use_cached is True, the render is skipped when the states the
+        template read have not changed since the last render.
+
         Returns False if the template was not re-rendered.
 
         Returns True if the template re-rendered and did not
@@ -1169,6 +1173,18 @@ class TrackTemplateResultInfo:
                 event,
             )
 
+        if (
+            use_cached
+            and (info := self._info.get(template)) is not None
+            and info.async_is_current()
+            # The last render may not have been applied yet, for example
+            # when the same template is tracked twice
+            and template in self._last_result
+            and self._last_result[template] == info.result()
+        ):
+            template.async_add_cached_render()
+            return True
+
         self._rate_limit.async_triggered(template, now)
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
@@ -1238,6 +1254,9 @@ class TrackTemplateResultInfo:
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired_timestamp if not replayed and event else time.time()
+        # A forced refresh always re-renders, the result of a template may
+        # depend on more than the states it read
+        use_cached = event is not None
 
         block_updates = False
         super_template = self._track_templates[0] if self._has_super_template else None
@@ -1246,7 +1265,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, use_cached
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1277,7 +1298,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, use_cached
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -22,6 +22,7 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import (
     TYPE_CHECKING,
@@ -114,6 +115,7 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_RENDER_STATS: HassKey[LRU[str, TemplateRenderStats]] = HassKey("template.render_stats")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -135,6 +137,7 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "object_id",
     "name",
 }
+_STATE_METADATA_ATTRIBUTES = {"last_updated", "context"}
 
 ALL_STATES_RATE_LIMIT = 60  # seconds
 DOMAIN_STATES_RATE_LIMIT = 1  # seconds
@@ -164,6 +167,9 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# The render statistics are kept for the most recently rendered templates
+MAX_RENDER_STATS = 1024
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
@@ -399,6 +405,8 @@ class RenderInfo:
         "entities",
         "rate_limit",
         "has_time",
+        "has_state_metadata",
+        "_state_versions",
     )
 
     def __init__(self, template: Template) -> None:
@@ -417,6 +425,10 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        # Set if last_updated, last_reported or context of a state was read,
+        # these change on every write of the state
+        self.has_state_metadata = False
+        self._state_versions: tuple[Any, ...] | None = None
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -463,6 +475,52 @@ class RenderInfo:
             raise self.exception
         return cast(str, self._result)
 
+    def _async_state_versions(self) -> tuple[Any, ...] | None:
+        """Return the versions of the states the template read.
+
+        Returns None if the result may depend on more than the
+        states of the collected entities.
+        """
+        if (
+            self.exception
+            or self.has_time
+            or self.all_states
+            or self.all_states_lifecycle
+            or self.domains
+            or self.domains_lifecycle
+        ):
+            return None
+        assert self.template.hass is not None
+        get_state = self.template.hass.states.get
+        if self.has_state_metadata:
+            return tuple(
+                None
+                if (state := get_state(entity_id)) is None
+                else (
+                    state.state,
+                    state.attributes,
+                    state.last_updated,
+                    state.last_reported,
+                    state.context,
+                )
+                for entity_id in self.entities
+            )
+        # last_changed only changes together with the state, and the
+        # attributes are reused when they are unchanged
+        return tuple(
+            None
+            if (state := get_state(entity_id)) is None
+            else (state.state, state.attributes)
+            for entity_id in self.entities
+        )
+
+    def async_is_current(self) -> bool:
+        """Return if the states the template read are unchanged since the render."""
+        return (
+            self._state_versions is not None
+            and self._async_state_versions() == self._state_versions
+        )
+
     def _freeze_static(self) -> None:
         self.is_static = True
         self._freeze_sets()
@@ -502,6 +560,45 @@ class RenderInfo:
             self.filter = _false
 
 
+class TemplateRenderStats:
+    """Render statistics of a template."""
+
+    __slots__ = ("cached", "max_time", "renders", "total_time")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.renders = 0
+        self.cached = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def async_add_render(self, duration: float) -> None:
+        """Add a render which took duration seconds."""
+        self.renders += 1
+        self.total_time += duration
+        self.max_time = max(duration, self.max_time)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        return {
+            "renders": self.renders,
+            "cached": self.cached,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+        }
+
+
+@callback
+def async_get_render_stats(
+    hass: HomeAssistant,
+) -> collections.abc.Mapping[str, TemplateRenderStats]:
+    """Return the render statistics of the templates rendered to info.
+
+    Only the MAX_RENDER_STATS most recently rendered templates are kept.
+    """
+    return hass.data.get(_RENDER_STATS, {})
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -755,6 +852,7 @@ class Template:
             render_info._freeze_static()  # noqa: SLF001
             return render_info
 
+        start = perf_counter()
         token = _render_info.set(render_info)
         try:
             render_info._result = self.async_render(  # noqa: SLF001
@@ -764,10 +862,26 @@ class Template:
             render_info.exception = ex
         finally:
             _render_info.reset(token)
+        self._async_render_stats().async_add_render(perf_counter() - start)
 
         render_info._freeze()  # noqa: SLF001
+        render_info._state_versions = render_info._async_state_versions()  # noqa: SLF001
         return render_info
 
+    @callback
+    def async_add_cached_render(self) -> None:
+        """Count a render skipped because its RenderInfo was current."""
+        self._async_render_stats().cached += 1
+
+    def _async_render_stats(self) -> TemplateRenderStats:
+        """Return the render statistics of the template."""
+        assert self.hass is not None
+        if (render_stats := self.hass.data.get(_RENDER_STATS)) is None:
+            render_stats = self.hass.data[_RENDER_STATS] = LRU(MAX_RENDER_STATS)
+        if (stats := render_stats.get(self.template)) is None:
+            stats = render_stats[self.template] = TemplateRenderStats()
+        return stats
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -1055,6 +1169,11 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_metadata(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.has_state_metadata = True
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
@@ -1063,6 +1182,8 @@ class TemplateStateBase(State):
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
                 render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                if item in _STATE_METADATA_ATTRIBUTES:
+                    render_info.has_state_metadata = True
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1099,19 +1220,19 @@ class TemplateStateBase(State):
     @property
     def last_reported(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_reported."""
-        self._collect_state()
+        self._collect_state_metadata()
         return self._state.last_reported
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state_metadata()
         return self._state.last_updated
 
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state_metadata()
         return self._state.context
 
     @property
@@ -1157,7 +1278,7 @@ class TemplateStateBase(State):
 
     def __eq__(self, other: object) -> bool:
         """Ensure we collect on equality check."""
-        self._collect_state()
+        self._collect_state_metadata()
         return self._state.__eq__(other)
 
 
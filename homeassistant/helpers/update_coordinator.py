@@ -19,7 +19,14 @@ from typing_extensions import TypeVar
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HomeAssistant,
+    StateUpdate,
+    callback,
+    validate_state,
+)
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -110,6 +117,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        # The states written by the coordinator entities while the listeners
+        # are updated, see async_update_listeners
+        self._state_updates: list[StateUpdate] | None = None
         self._unsub_refresh: CALLBACK_TYPE | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
@@ -172,9 +182,38 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update all registered listeners.
+
+        The states written by the coordinator entities are collected and set
+        with async_set_many once all listeners are updated, so they share one
+        timestamp and context. The states are not in hass.states until then,
+        a listener reading the state of another coordinator entity gets the
+        state of the previous update.
+        """
+        if self._state_updates is not None:
+            # The listeners are updated again by a listener
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+        self._state_updates = state_updates = []
+        try:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+        except BaseException:
+            self._state_updates = None
+            # Set the states written before the listener failed without
+            # hiding its exception
+            if state_updates:
+                try:
+                    self.hass.states.async_set_many(state_updates)
+                except Exception:
+                    self.logger.exception(
+                        "Error setting the states of the listeners of %s", self.name
+                    )
+            raise
+        self._state_updates = None
+        if state_updates:
+            self.hass.states.async_set_many(state_updates)
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -584,6 +623,31 @@ class CoordinatorEntity(BaseCoordinatorEntity[_DataUpdateCoordinatorT]):
         """Return if entity is available."""
         return self.coordinator.last_update_success
 
+    @callback
+    def _async_set_state(
+        self, state: str, attr: dict[str, Any], timestamp: float
+    ) -> None:
+        """Set the calculated state of the entity in the state machine.
+
+        While the coordinator updates its listeners the state is collected
+        and set together with the states of the other coordinator entities.
+        """
+        if (state_updates := self.coordinator._state_updates) is None:  # noqa: SLF001
+            super()._async_set_state(state, attr, timestamp)
+            return
+        # Raise InvalidStateError now so the entity falls back to unknown
+        validate_state(state)
+        state_updates.append(
+            StateUpdate(
+                self.entity_id,
+                state,
+                attr,
+                self.force_update,
+                self._context,
+                self._state_info,
+            )
+        )
+
     async def async_update(self) -> None:
         """Update the entity.
 
@@ -133,6 +133,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_IMPORT_TIMINGS: HassKey[dict[str, float]] = HassKey("import_timings")
+DATA_INTEGRATION_SNAPSHOT: HassKey[dict[str, dict[str, Any]]] = HassKey(
+    "integration_snapshot"
+)
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -271,6 +275,7 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_INTEGRATIONS] = {}
     hass.data[DATA_MISSING_PLATFORMS] = {}
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
+    hass.data[DATA_IMPORT_TIMINGS] = {}
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -334,6 +339,38 @@ async def async_get_custom_components(
     return comps_or_future
 
 
+@callback
+def async_get_import_timings(hass: HomeAssistant) -> dict[str, float]:
+    """Return how long the import of each integration and platform module took.
+
+    The time includes the modules imported by the module for the first time.
+    """
+    return hass.data[DATA_IMPORT_TIMINGS]
+
+
+@callback
+def async_set_integration_snapshot(
+    hass: HomeAssistant, snapshot: dict[str, dict[str, Any]]
+) -> None:
+    """Set the snapshot of the built-in integrations resolved by a previous start.
+
+    The integrations in the snapshot are created without reading their
+    manifest and with their dependencies already resolved.
+    """
+    hass.data[DATA_INTEGRATION_SNAPSHOT] = snapshot
+
+
+@callback
+def async_get_integration_snapshot(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return a snapshot of the resolved built-in integrations."""
+    return {
+        domain: int_or_fut.as_snapshot()
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        # Integration is never subclassed, so we can check for type
+        if type(int_or_fut) is Integration and int_or_fut.is_built_in
+    }
+
+
 async def async_get_config_flows(
     hass: HomeAssistant,
     type_filter: Literal["device", "helper", "hub", "service"] | None = None,
@@ -742,6 +779,23 @@ class Integration:
 
         return None
 
+    @classmethod
+    def from_snapshot(
+        cls, hass: HomeAssistant, snapshot: dict[str, Any]
+    ) -> Integration:
+        """Create an integration from its snapshot."""
+        integration = cls(
+            hass,
+            snapshot["pkg_path"],
+            pathlib.Path(snapshot["file_path"]),
+            snapshot["manifest"],
+            set(snapshot["top_level_files"]),
+        )
+        if (all_dependencies := snapshot["all_dependencies"]) is not None:
+            integration._all_dependencies = set(all_dependencies)  # noqa: SLF001
+            integration._all_dependencies_resolved = True  # noqa: SLF001
+        return integration
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -768,11 +822,26 @@ class Integration:
         self._platforms_to_preload = hass.data[DATA_PRELOAD_PLATFORMS]
         self._component_future: asyncio.Future[ComponentProtocol] | None = None
         self._import_futures: dict[str, asyncio.Future[ModuleType]] = {}
+        # The futures of the imports which do not log unexpected exceptions
+        self._unlogged_import_futures: set[asyncio.Future[Any]] = set()
         self._cache = hass.data[DATA_COMPONENTS]
         self._missing_platforms_cache = hass.data[DATA_MISSING_PLATFORMS]
+        self._import_timings = hass.data[DATA_IMPORT_TIMINGS]
         self._top_level_files = top_level_files or set()
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
+    def as_snapshot(self) -> dict[str, Any]:
+        """Return the manifest, files and resolved dependencies as a snapshot."""
+        return {
+            "pkg_path": self.pkg_path,
+            "file_path": str(self.file_path),
+            "manifest": self.manifest,
+            "top_level_files": sorted(self._top_level_files),
+            "all_dependencies": sorted(self._all_dependencies)
+            if self._all_dependencies_resolved
+            else None,
+        }
+
     @cached_property
     def manifest_json_fragment(self) -> json_fragment:
         """Return manifest as a JSON fragment."""
@@ -976,19 +1045,31 @@ class Integration:
 
         return self._all_dependencies_resolved
 
-    async def async_get_component(self) -> ComponentProtocol:
+    async def async_get_component(
+        self, log_import_errors: bool = True
+    ) -> ComponentProtocol:
         """Return the component.
 
         This method will load the component if it's not already loaded
         and will check if import_executor is set and load it in the executor,
         otherwise it will load it in the event loop.
+
+        If log_import_errors is False, unexpected exceptions raised by the
+        import are not logged, they are still raised as ImportError. A caller
+        which logs them and joins such an import imports again if it fails.
         """
         domain = self.domain
         if domain in (cache := self._cache):
             return cache[domain]
 
-        if self._component_future:
-            return await self._component_future
+        if future := self._component_future:
+            if not log_import_errors or future not in self._unlogged_import_futures:
+                return await future
+            try:
+                return await future
+            except ImportError:
+                # Import again so the unexpected exceptions are logged
+                return await self.async_get_component()
 
         if debug := _LOGGER.isEnabledFor(logging.DEBUG):
             start = time.perf_counter()
@@ -1000,7 +1081,7 @@ class Integration:
             or (self.config_flow and f"{self.pkg_path}.config_flow" not in sys.modules)
         )
         if not load_executor:
-            comp = self._get_component()
+            comp = self._get_component(log_import_errors=log_import_errors)
             if debug:
                 _LOGGER.debug(
                     "Component %s import took %.3f seconds (loaded_executor=False)",
@@ -1010,10 +1091,12 @@ class Integration:
             return comp
 
         self._component_future = self.hass.loop.create_future()
+        if not log_import_errors:
+            self._unlogged_import_futures.add(self._component_future)
         try:
             try:
                 comp = await self.hass.async_add_import_executor_job(
-                    self._get_component, True
+                    self._get_component, True, log_import_errors
                 )
             except ModuleNotFoundError:
                 raise
@@ -1024,7 +1107,7 @@ class Integration:
                 )
                 # If importing in the executor deadlocks because there is a circular
                 # dependency, we fall back to the event loop.
-                comp = self._get_component()
+                comp = self._get_component(log_import_errors=log_import_errors)
             self._component_future.set_result(comp)
         except BaseException as ex:
             self._component_future.set_exception(ex)
@@ -1035,6 +1118,7 @@ class Integration:
                 self._component_future.result()
             raise
         finally:
+            self._unlogged_import_futures.discard(self._component_future)
             self._component_future = None
 
         if debug:
@@ -1066,10 +1150,13 @@ class Integration:
             return cache[domain]
         return self._get_component()
 
-    def _get_component(self, preload_platforms: bool = False) -> ComponentProtocol:
+    def _get_component(
+        self, preload_platforms: bool = False, log_import_errors: bool = True
+    ) -> ComponentProtocol:
         """Return the component."""
         cache = self._cache
         domain = self.domain
+        start = time.perf_counter()
         try:
             cache[domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -1080,22 +1167,34 @@ class Integration:
             # _DeadlockError inherits from RuntimeError
             raise ImportError(f"RuntimeError importing {self.pkg_path}: {err}") from err
         except Exception as err:
-            _LOGGER.exception(
-                "Unexpected exception importing component %s", self.pkg_path
-            )
+            if log_import_errors:
+                _LOGGER.exception(
+                    "Unexpected exception importing component %s", self.pkg_path
+                )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
+        self._import_timings[self.pkg_path] = time.perf_counter() - start
 
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
                 with suppress(ImportError):
-                    self.get_platform(platform_name)
+                    if log_import_errors:
+                        self.get_platform(platform_name)
+                    elif not self._get_platform_cached_or_raise(platform_name):
+                        self._load_platform(platform_name, log_import_errors=False)
 
         return cache[domain]
 
-    def _load_platforms(self, platform_names: Iterable[str]) -> dict[str, ModuleType]:
+    def _load_platforms(
+        self, platform_names: Iterable[str], log_import_errors: bool = True
+    ) -> dict[str, ModuleType]:
         """Load platforms for an integration."""
+        load_platform = (
+            self._load_platform
+            if log_import_errors
+            else ft.partial(self._load_platform, log_import_errors=False)
+        )
         return {
-            platform_name: self._load_platform(platform_name)
+            platform_name: load_platform(platform_name)
             for platform_name in platform_names
         }
 
@@ -1109,15 +1208,25 @@ class Integration:
         return platforms[platform_name]
 
     async def async_get_platforms(
-        self, platform_names: Iterable[Platform | str]
+        self,
+        platform_names: Iterable[Platform | str],
+        log_import_errors: bool = True,
     ) -> dict[str, ModuleType]:
-        """Return a platforms for an integration."""
+        """Return a platforms for an integration.
+
+        If log_import_errors is False, unexpected exceptions raised by the
+        imports are not logged, they are still raised as ImportError. A caller
+        which logs them and joins such an import imports again if it fails.
+        """
         domain = self.domain
         platforms: dict[str, ModuleType] = {}
 
         load_executor_platforms: list[str] = []
         load_event_loop_platforms: list[str] = []
         in_progress_imports: dict[str, asyncio.Future[ModuleType]] = {}
+        # The joined imports which do not log, looked up before awaiting
+        # since their futures are forgotten once they are done
+        unlogged_imports: set[str] = set()
         import_futures: list[tuple[str, asyncio.Future[ModuleType]]] = []
 
         for platform_name in platform_names:
@@ -1128,6 +1237,8 @@ class Integration:
             # Another call to async_get_platforms is already importing this platform
             if future := self._import_futures.get(platform_name):
                 in_progress_imports[platform_name] = future
+                if future in self._unlogged_import_futures:
+                    unlogged_imports.add(platform_name)
                 continue
 
             full_name = f"{domain}.{platform_name}"
@@ -1142,6 +1253,8 @@ class Integration:
 
             import_future = self.hass.loop.create_future()
             self._import_futures[platform_name] = import_future
+            if not log_import_errors:
+                self._unlogged_import_futures.add(import_future)
             import_futures.append((platform_name, import_future))
 
         if load_executor_platforms or load_event_loop_platforms:
@@ -1153,7 +1266,7 @@ class Integration:
                     try:
                         platforms.update(
                             await self.hass.async_add_import_executor_job(
-                                self._load_platforms, platform_names
+                                self._load_platforms, platform_names, log_import_errors
                             )
                         )
                     except ModuleNotFoundError:
@@ -1170,7 +1283,9 @@ class Integration:
                         load_event_loop_platforms.extend(load_executor_platforms)
 
                 if load_event_loop_platforms:
-                    platforms.update(self._load_platforms(platform_names))
+                    platforms.update(
+                        self._load_platforms(platform_names, log_import_errors)
+                    )
 
                 for platform_name, import_future in import_futures:
                     import_future.set_result(platforms[platform_name])
@@ -1186,8 +1301,9 @@ class Integration:
                 raise
 
             finally:
-                for platform_name, _ in import_futures:
+                for platform_name, import_future in import_futures:
                     self._import_futures.pop(platform_name)
+                    self._unlogged_import_futures.discard(import_future)
 
                 if debug:
                     _LOGGER.debug(
@@ -1200,7 +1316,16 @@ class Integration:
 
         if in_progress_imports:
             for platform_name, future in in_progress_imports.items():
-                platforms[platform_name] = await future
+                if not log_import_errors or platform_name not in unlogged_imports:
+                    platforms[platform_name] = await future
+                    continue
+                try:
+                    platforms[platform_name] = await future
+                except ImportError:
+                    # Import again so the unexpected exceptions are logged
+                    platforms[platform_name] = await self.async_get_platform(
+                        platform_name
+                    )
 
         return platforms
 
@@ -1256,7 +1381,9 @@ class Integration:
 
         return existing_platforms
 
-    def _load_platform(self, platform_name: str) -> ModuleType:
+    def _load_platform(
+        self, platform_name: str, log_import_errors: bool = True
+    ) -> ModuleType:
         """Load a platform for an integration.
 
         This method must be thread-safe as it's called from the executor
@@ -1268,6 +1395,7 @@ class Integration:
         """
         full_name = f"{self.domain}.{platform_name}"
         cache = self.hass.data[DATA_COMPONENTS]
+        start = time.perf_counter()
         try:
             cache[full_name] = self._import_platform(platform_name)
         except ModuleNotFoundError:
@@ -1284,14 +1412,18 @@ class Integration:
                 f"RuntimeError importing {self.pkg_path}.{platform_name}: {err}"
             ) from err
         except Exception as err:
-            _LOGGER.exception(
-                "Unexpected exception importing platform %s.%s",
-                self.pkg_path,
-                platform_name,
-            )
+            if log_import_errors:
+                _LOGGER.exception(
+                    "Unexpected exception importing platform %s.%s",
+                    self.pkg_path,
+                    platform_name,
+                )
             raise ImportError(
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
+        self._import_timings[f"{self.pkg_path}.{platform_name}"] = (
+            time.perf_counter() - start
+        )
 
         return cast(ModuleType, cache[full_name])
 
@@ -1411,6 +1543,19 @@ async def async_get_integrations(
         if domain in needed:
             del needed[domain]
 
+    # Then for integrations resolved by a previous start
+    if needed and (snapshot := hass.data.get(DATA_INTEGRATION_SNAPSHOT)):
+        for domain, future in needed.items():
+            if integration_snapshot := snapshot.pop(domain, None):
+                results[domain] = cache[domain] = Integration.from_snapshot(
+                    hass, integration_snapshot
+                )
+                future.set_result(None)
+
+        for domain in results:
+            if domain in needed:
+                del needed[domain]
+
     # Now the rest use resolve_from_root
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
@@ -7,10 +7,14 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
+import voluptuous as vol
+
 from homeassistant import core
 from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
@@ -116,6 +120,36 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_keyed_listeners(hass):
+    """Fire 100k events with 1000 keyed listeners of which one matches."""
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen(
+            event_name, listener, event_keys={"device_id": (f"device_{idx}",)}
+        )
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(event_name, {"device_id": f"device_{idx % 1000}"})
+
+    start = timer()
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -308,3 +342,182 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_wildcard_subscriptions(hass):
+    """Match 100k unique topics against 10k wildcard MQTT subscriptions."""
+    # Importing the mqtt integration is only needed by this benchmark
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    subscriptions: TopicTrie[str] = TopicTrie()
+    for i in range(2500):
+        for topic_filter in (
+            f"zigbee2mqtt/device_{i}/+",
+            f"zigbee2mqtt/device_{i}/availability/#",
+            f"tasmota/discovery/{i}/+/config",
+            f"homeassistant/+/node_{i}/#",
+        ):
+            subscriptions.add(topic_filter, topic_filter)
+
+    topics = [f"zigbee2mqtt/device_{i % 2500}/availability/{i}" for i in range(10**5)]
+
+    start = timer()
+    for topic in topics:
+        subscriptions.match_topic(topic)
+    return timer() - start
+
+
+def _recorder_insert_states(bulk: bool) -> float:
+    """Insert 100k states in commits of 1000 states into a SQLite database."""
+    # SQLAlchemy is only installed with the recorder
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_insert import bulk_insert_states
+    from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+    # pylint: enable=import-outside-toplevel
+
+    with TemporaryDirectory() as tmpdir:
+        engine = create_engine(f"sqlite:///{tmpdir}/benchmark.db")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            states_meta = [
+                StatesMeta(entity_id=f"sensor.power_{i}") for i in range(200)
+            ]
+            session.add_all(states_meta)
+            session.commit()
+            metadata_ids = [meta.metadata_id for meta in states_meta]
+
+            last_state_ids: dict[int, int] = {}
+            start = timer()
+            for commit in range(100):
+                pending: dict[int, States] = {}
+                states: list[States] = []
+                # 200 entities changing 5 times between commits
+                for i in range(1000):
+                    metadata_id = metadata_ids[i % 200]
+                    dbstate = States(
+                        state=str(i),
+                        metadata_id=metadata_id,
+                        last_updated_ts=commit * 1000 + i,
+                        origin_idx=0,
+                    )
+                    if (old_state := pending.get(metadata_id)) is not None:
+                        dbstate.old_state = old_state
+                    else:
+                        dbstate.old_state_id = last_state_ids.get(metadata_id)
+                    pending[metadata_id] = dbstate
+                    states.append(dbstate)
+                if bulk:
+                    bulk_insert_states(session, states)
+                else:
+                    session.add_all(states)
+                session.commit()
+                for metadata_id, dbstate in pending.items():
+                    last_state_ids[metadata_id] = dbstate.state_id
+            runtime = timer() - start
+        engine.dispose()
+    return runtime
+
+
+@benchmark
+async def recorder_insert_states(hass):
+    """Insert 100k states with the unit of work of the ORM."""
+    return await hass.async_add_executor_job(_recorder_insert_states, False)
+
+
+@benchmark
+async def recorder_bulk_insert_states(hass):
+    """Insert 100k states with the recorder bulk insert."""
+    return await hass.async_add_executor_job(_recorder_insert_states, True)
+
+
+def _validate_entity_service_calls(make_schema: Callable[[dict], Callable]) -> float:
+    """Validate 100k service calls against common entity service schemas."""
+    schemas = [
+        make_schema(fields)
+        for fields in (
+            {},
+            {
+                vol.Optional("brightness"): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=255)
+                ),
+                vol.Optional("color_temp_kelvin"): cv.positive_int,
+                vol.Optional("rgb_color"): vol.All(
+                    vol.Coerce(tuple), vol.ExactSequence((cv.byte,) * 3)
+                ),
+                vol.Optional("transition"): cv.positive_float,
+            },
+            {
+                vol.Optional("temperature"): vol.Coerce(float),
+                vol.Optional("hvac_mode"): cv.string,
+            },
+            {vol.Required("position"): vol.All(vol.Coerce(int), vol.Range(0, 100))},
+            {vol.Required("volume_level"): cv.small_float},
+            {vol.Required("percentage"): vol.All(vol.Coerce(int), vol.Range(0, 100))},
+            {vol.Required("value"): vol.Coerce(float)},
+            {vol.Required("option"): cv.string},
+            {
+                vol.Required("media_content_id"): cv.string,
+                vol.Required("media_content_type"): cv.string,
+            },
+            {vol.Optional("code"): cv.string},
+        )
+    ]
+    calls = [
+        (schemas[0], {"entity_id": "light.kitchen"}),
+        (schemas[0], {"entity_id": ["switch.desk_lamp", "switch.tv", "switch.fan"]}),
+        (schemas[0], {"area_id": "living_room"}),
+        (schemas[1], {"entity_id": "light.kitchen", "brightness": 100}),
+        (
+            schemas[1],
+            {"area_id": ["kitchen", "hall"], "rgb_color": [255, 0, 0], "transition": 2},
+        ),
+        (schemas[2], {"entity_id": "climate.hall", "temperature": 21.5}),
+        (schemas[3], {"device_id": "8f3b2a9c1d", "position": 50}),
+        (schemas[4], {"entity_id": "media_player.tv", "volume_level": 0.4}),
+        (schemas[5], {"entity_id": "fan.bedroom", "percentage": 33}),
+        (schemas[6], {"entity_id": "input_number.target", "value": 3}),
+        (schemas[7], {"entity_id": "select.mode", "option": "eco"}),
+        (
+            schemas[8],
+            {
+                "entity_id": "media_player.kitchen",
+                "media_content_id": "radio",
+                "media_content_type": "music",
+            },
+        ),
+        (schemas[9], {"entity_id": "lock.front_door"}),
+    ]
+    size = len(calls)
+
+    start = timer()
+    for i in range(10**5):
+        schema, data = calls[i % size]
+        schema(data)
+    return timer() - start
+
+
+def _make_uncompiled_entity_service_schema(fields: dict) -> Callable:
+    """Make an entity service schema without the compiled entity service fields."""
+    return vol.All(
+        vol.Schema(
+            {vol.Remove("metadata"): dict, **fields, **cv.ENTITY_SERVICE_FIELDS}
+        ),
+        cv.has_at_least_one_key(*cv.ENTITY_SERVICE_FIELDS),
+    )
+
+
+@benchmark
+async def validate_entity_service_calls(hass):
+    """Validate 100k service calls against compiled entity service schemas."""
+    return _validate_entity_service_calls(cv.make_entity_service_schema)
+
+
+@benchmark
+async def validate_entity_service_calls_uncompiled(hass):
+    """Validate 100k service calls against uncompiled entity service schemas."""
+    return _validate_entity_service_calls(_make_uncompiled_entity_service_schema)
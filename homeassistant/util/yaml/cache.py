@@ -0,0 +1,286 @@
+"""Cache of parsed YAML files."""
+
+from __future__ import annotations
+
+from functools import cached_property
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from typing import Any, TextIO
+
+import yaml
+
+from homeassistant.const import __version__
+
+from .loader import JSON_TYPE, FastSafeLoader, Secrets, parse_yaml
+from .objects import NodeDictClass, NodeListClass, NodeStrClass
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Tags which are resolved each time a file is loaded, their result depends on
+# other files or the environment
+RESOLVED_TAGS = (
+    "!env_var",
+    "!include",
+    "!include_dir_list",
+    "!include_dir_merge_list",
+    "!include_dir_merge_named",
+    "!include_dir_named",
+    "!input",
+    "!secret",
+)
+
+# Types of the encoded nodes, scalars other than strings are stored as is
+_DICT = 0
+_LIST = 1
+_STR = 2
+_TAG = 3
+
+
+class _Uncacheable(Exception):
+    """Raised when a parsed file can not be stored in the cache."""
+
+
+class _Tag:
+    """Placeholder of a tag which is resolved when the file is loaded."""
+
+    __slots__ = ("column", "line", "tag", "value")
+
+    def __init__(self, tag: str, value: Any, line: int, column: int) -> None:
+        """Initialize the placeholder."""
+        self.tag = tag
+        self.value = value
+        self.line = line
+        self.column = column
+
+
+class _RawLoader(FastSafeLoader):
+    """Loader which keeps the tags in RESOLVED_TAGS as placeholders."""
+
+    def __init__(self, stream: Any, name: str) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        self.name = name
+
+    @cached_property
+    def get_stream_name(self) -> str:
+        """Get the name of the file, the stream is its content."""
+        return self.name
+
+
+def _construct_tag(loader: _RawLoader, node: yaml.nodes.Node) -> _Tag:
+    """Construct the placeholder of a tag."""
+    if not isinstance(node, yaml.ScalarNode):
+        raise yaml.constructor.ConstructorError(
+            None, None, f"{node.tag} needs a scalar argument", node.start_mark
+        )
+    return _Tag(node.tag, node.value, node.start_mark.line, node.start_mark.column)
+
+
+for _tag in RESOLVED_TAGS:
+    _RawLoader.add_constructor(_tag, _construct_tag)
+
+
+class _TagContext:
+    """Stand-in for the loader when the tags of a file are resolved."""
+
+    def __init__(self, name: str, secrets: Secrets | None, cache: YamlCache) -> None:
+        """Initialize the context."""
+        self.name = self.get_name = self.get_stream_name = name
+        self.secrets = secrets
+        self.cache = cache
+
+    def resolve(self, tag: _Tag) -> Any:
+        """Resolve a tag with the constructor of the loader."""
+        node = yaml.ScalarNode(
+            tag.tag,
+            tag.value,
+            yaml.Mark(self.name, 0, tag.line, tag.column, None, None),  # type: ignore[arg-type]
+        )
+        return FastSafeLoader.yaml_constructors[tag.tag](self, node)
+
+
+def _parse_raw(content: str, name: str) -> tuple[Any, bool]:
+    """Parse YAML keeping the tags as placeholders.
+
+    Return the parsed content and if it contains duplicate keys.
+    """
+    loader = _RawLoader(content, name)
+    try:
+        return loader.get_single_data(), loader.has_duplicate_keys
+    finally:
+        loader.dispose()
+
+
+def _encode(obj: Any) -> Any:
+    """Encode parsed YAML to types supported by marshal."""
+    obj_type = type(obj)
+    if obj_type is NodeDictClass:
+        if any(type(key) is _Tag for key in obj):
+            raise _Uncacheable("Tag used as key")
+        return (
+            _DICT,
+            obj.__line__,
+            tuple((_encode(key), _encode(value)) for key, value in obj.items()),
+        )
+    if obj_type is NodeListClass:
+        return (_LIST, obj.__line__, tuple(_encode(item) for item in obj))
+    if obj_type is NodeStrClass:
+        return (_STR, obj.__line__, str(obj))
+    if obj_type is _Tag:
+        return (_TAG, obj.tag, obj.value, obj.line, obj.column)
+    if obj is None or obj_type in (bool, int, float, str):
+        return obj
+    raise _Uncacheable(f"Unsupported type {obj_type.__name__}")
+
+
+def _decode(data: Any, context: _TagContext) -> Any:
+    """Decode a cached file and resolve its tags."""
+    if type(data) is not tuple:
+        return data
+    obj: NodeDictClass | NodeListClass | NodeStrClass
+    kind = data[0]
+    if kind == _STR:
+        obj = NodeStrClass(data[2])
+    elif kind == _DICT:
+        obj = NodeDictClass(
+            {_decode(key, context): _decode(value, context) for key, value in data[2]}
+        )
+    elif kind == _LIST:
+        obj = NodeListClass([_decode(item, context) for item in data[2]])
+    else:
+        return context.resolve(_Tag(*data[1:]))
+    obj.__config_file__ = context.name
+    obj.__line__ = data[1]
+    return obj
+
+
+def _resolve(obj: Any, context: _TagContext, seen: set[int]) -> Any:
+    """Resolve the tags of a parsed file in place."""
+    if type(obj) is _Tag:
+        return context.resolve(obj)
+    if not isinstance(obj, (dict, list)) or id(obj) in seen:
+        return obj
+    # Aliases refer to the same object
+    seen.add(id(obj))
+    if isinstance(obj, dict):
+        if any(type(key) is _Tag for key in obj):
+            raise _Uncacheable("Tag used as key")
+        for key, value in obj.items():
+            obj[key] = _resolve(value, context, seen)
+    else:
+        for idx, item in enumerate(obj):
+            obj[idx] = _resolve(item, context, seen)
+    return obj
+
+
+class YamlCache:
+    """Cache of parsed YAML files which is stored between runs.
+
+    The files are parsed with the tags which load other files, secrets or
+    environment variables kept as placeholders and stored by path with the
+    hash of their content. The placeholders are resolved each time a file
+    is loaded, so only files with a changed content are parsed again.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._entries: dict[str, tuple[bytes, Any]] | None = None
+        self._used: set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def parse(self, stream: TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
+        """Parse a YAML file, using the cached result if its content is unchanged.
+
+        This method needs to run in an executor.
+        """
+        name = getattr(stream, "name", "<file>")
+        key = os.fspath(name)
+        content = stream.read()
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        context = _TagContext(name, secrets, self)
+        with self._lock:
+            entry = self._get_entries().get(key)
+            self._used.add(key)
+
+        if entry is not None and entry[0] == digest:
+            return _decode(entry[1], context)  # type: ignore[no-any-return]
+
+        try:
+            obj, has_duplicate_keys = _parse_raw(content, name)
+        except yaml.YAMLError:
+            # Parse the file again to raise the error of the loaders
+            stream.seek(0, 0)
+            return parse_yaml(stream, secrets, self)
+
+        # Files with duplicate keys are not cached, their warning is logged
+        # each time they are loaded
+        if not has_duplicate_keys:
+            try:
+                encoded = _encode(obj)
+            except (_Uncacheable, RecursionError) as err:
+                _LOGGER.debug("Not caching %s: %s", name, err)
+            else:
+                with self._lock:
+                    self._get_entries()[key] = (digest, encoded)
+                    self._dirty = True
+
+        try:
+            return _resolve(obj, context, set())  # type: ignore[no-any-return]
+        except _Uncacheable:
+            stream.seek(0, 0)
+            return parse_yaml(stream, secrets, self)
+
+    def save(self) -> None:
+        """Store the files parsed since the last save.
+
+        The entries of files which were not parsed are removed.
+
+        This method needs to run in an executor.
+        """
+        with self._lock:
+            entries = self._get_entries()
+            if not self._dirty and self._used == entries.keys():
+                self._used = set()
+                return
+            self._entries = entries = {
+                key: entry for key, entry in entries.items() if key in self._used
+            }
+            self._used = set()
+            self._dirty = False
+            data = marshal.dumps((CACHE_VERSION, __version__, entries))
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                file.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            _LOGGER.warning("Unable to store the YAML cache %s: %s", self.path, err)
+
+    def _get_entries(self) -> dict[str, tuple[bytes, Any]]:
+        """Return the entries, loading them from disk on first use.
+
+        Must be called with the lock held.
+        """
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        try:
+            with open(self.path, "rb") as file:
+                version, ha_version, entries = marshal.loads(file.read())
+        except FileNotFoundError:
+            return self._entries
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Ignoring the YAML cache %s: %s", self.path, err)
+            return self._entries
+        if version == CACHE_VERSION and ha_version == __version__:
+            self._entries = entries
+        return self._entries
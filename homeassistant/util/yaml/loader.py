@@ -8,7 +8,7 @@ from io import StringIO, TextIOWrapper
 import logging
 import os
 from pathlib import Path
-from typing import Any, TextIO, overload
+from typing import TYPE_CHECKING, Any, TextIO, overload
 
 import yaml
 
@@ -29,6 +29,9 @@ from homeassistant.exceptions import HomeAssistantError
 from .const import SECRET_YAML
 from .objects import Input, NodeDictClass, NodeListClass, NodeStrClass
 
+if TYPE_CHECKING:
+    from .cache import YamlCache
+
 # mypy: allow-untyped-calls, no-warn-return-any
 
 JSON_TYPE = list | dict | str
@@ -112,6 +115,7 @@ class _LoaderMixin:
 
     name: str
     stream: Any
+    has_duplicate_keys = False
 
     @cached_property
     def get_name(self) -> str:
@@ -127,7 +131,12 @@ class _LoaderMixin:
 class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
     """The fastest available safe loader, either C or Python."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         self.stream = stream
 
@@ -141,30 +150,43 @@ class FastSafeLoader(FastestAvailableSafeLoader, _LoaderMixin):
 
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
 
 class PythonSafeLoader(yaml.SafeLoader, _LoaderMixin):
     """Python safe loader."""
 
-    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+    def __init__(
+        self,
+        stream: Any,
+        secrets: Secrets | None = None,
+        cache: YamlCache | None = None,
+    ) -> None:
         """Initialize a safe line loader."""
         super().__init__(stream)
         self.secrets = secrets
+        self.cache = cache
 
 
 type LoaderType = FastSafeLoader | PythonSafeLoader
 
 
 def load_yaml(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE | None:
     """Load a YAML file.
 
+    The file is only parsed if it is not in the cache, if one is passed.
+
     If opening the file raises an OSError it will be wrapped in a HomeAssistantError,
     except for FileNotFoundError which will be re-raised.
     """
     try:
         with open(fname, encoding="utf-8") as conf_file:
+            if cache is not None:
+                return cache.parse(conf_file, secrets)
             return parse_yaml(conf_file, secrets)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
@@ -176,14 +198,16 @@ def load_yaml(
 
 
 def load_yaml_dict(
-    fname: str | os.PathLike[str], secrets: Secrets | None = None
+    fname: str | os.PathLike[str],
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> dict:
     """Load a YAML file and ensure the top level is a dict.
 
     Raise if the top level is not a dict.
     Return an empty dict if the file is empty.
     """
-    loaded_yaml = load_yaml(fname, secrets)
+    loaded_yaml = load_yaml(fname, secrets, cache)
     if loaded_yaml is None:
         loaded_yaml = {}
     if not isinstance(loaded_yaml, dict):
@@ -192,28 +216,32 @@ def load_yaml_dict(
 
 
 def parse_yaml(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the fastest available loader."""
     if not HAS_C_LOADER:
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache)
     try:
-        return _parse_yaml(FastSafeLoader, content, secrets)
+        return _parse_yaml(FastSafeLoader, content, secrets, cache)
     except yaml.YAMLError:
         # Loading failed, so we now load with the Python loader which has more
         # readable exceptions
         if isinstance(content, (StringIO, TextIO, TextIOWrapper)):
             # Rewind the stream so we can try again
             content.seek(0, 0)
-        return _parse_yaml_python(content, secrets)
+        return _parse_yaml_python(content, secrets, cache)
 
 
 def _parse_yaml_python(
-    content: str | TextIO | StringIO, secrets: Secrets | None = None
+    content: str | TextIO | StringIO,
+    secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Parse YAML with the python loader (this is very slow)."""
     try:
-        return _parse_yaml(PythonSafeLoader, content, secrets)
+        return _parse_yaml(PythonSafeLoader, content, secrets, cache)
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -223,9 +251,10 @@ def _parse_yaml(
     loader: type[FastSafeLoader | PythonSafeLoader],
     content: str | TextIO,
     secrets: Secrets | None = None,
+    cache: YamlCache | None = None,
 ) -> JSON_TYPE:
     """Load a YAML file."""
-    return yaml.load(content, Loader=lambda stream: loader(stream, secrets))  # type: ignore[arg-type]
+    return yaml.load(content, Loader=lambda stream: loader(stream, secrets, cache))  # type: ignore[arg-type]
 
 
 @overload
@@ -316,7 +345,7 @@ def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.get_name), node.value)
     try:
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             loaded_yaml = NodeDictClass()
         return _add_reference(loaded_yaml, loader, node)
@@ -350,7 +379,7 @@ def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> NodeDi
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if loaded_yaml is None:
             # Special case, an empty file included by !include_dir_named is treated
             # as an empty dictionary
@@ -369,7 +398,7 @@ def _include_dir_merge_named_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference_to_node_class(mapping, loader, node)
@@ -385,7 +414,7 @@ def _include_dir_list_yaml(
         loaded_yaml
         for f in _find_files(loc, "*.yaml")
         if os.path.basename(f) != SECRET_YAML
-        and (loaded_yaml := load_yaml(f, loader.secrets)) is not None
+        and (loaded_yaml := load_yaml(f, loader.secrets, loader.cache)) is not None
     ]
 
 
@@ -399,7 +428,7 @@ def _include_dir_merge_list_yaml(
     for fname in _find_files(loc, "*.yaml"):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname, loader.secrets)
+        loaded_yaml = load_yaml(fname, loader.secrets, loader.cache)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -441,6 +470,7 @@ def _handle_mapping_tag(
                 seen[key],
                 line,
             )
+            loader.has_duplicate_keys = True
         seen[key] = line
 
     return _add_reference_to_node_class(NodeDictClass(nodes), loader, node)
@@ -2154,3 +2154,66 @@ async def test_history_stream_live_chained_events(
         "id": 1,
         "type": "event",
     }
+
+
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states to max_points."""
+    start = dt_util.parse_datetime("2024-01-01T00:05:00+00:00")
+    assert start is not None
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, "unavailable", 7, 9, 3, 2, 3, 8, 4]
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for minute, value in enumerate(values):
+        with freeze_time(start + timedelta(minutes=minute)):
+            hass.states.async_set("sensor.power", str(value))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=20)).isoformat(),
+            "entity_ids": ["sensor.power"],
+            "include_start_time_state": False,
+            "significant_changes_only": False,
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    # The first, minimum, maximum and last state of each 10 minute bucket
+    # from the start time in time order, a non numeric state also closes
+    # the bucket.
+    assert [
+        (state["s"], round(state["lu"] - start.timestamp()))
+        for state in response["result"]["sensor.power"]
+    ] == [
+        ("1", 60),
+        ("9", 300),
+        ("3", 540),
+        ("5", 600),
+        ("8", 660),
+        ("unavailable", 720),
+        ("7", 780),
+        ("9", 840),
+        ("2", 960),
+        ("4", 1140),
+    ]
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": start.isoformat(),
+            "entity_ids": ["sensor.power"],
+            "max_points": 3,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
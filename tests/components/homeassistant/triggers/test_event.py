@@ -518,6 +518,149 @@ async def test_event_data_with_list(
     assert len(service_calls) == 1
 
 
+async def test_if_fires_on_scalar_event_data(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test the (non)firing of event when the event data has scalar values."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"some_attr": "some_value", "count": 2},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire(
+        "test_event", {"some_attr": "some_value", "count": 2, "other": "value"}
+    )
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+    # don't match another value of one of the keys
+    hass.bus.async_fire("test_event", {"some_attr": "some_value", "count": 3})
+    hass.bus.async_fire("test_event", {"some_attr": "other_value", "count": 2})
+    # don't match a missing key
+    hass.bus.async_fire("test_event", {"some_attr": "some_value"})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+
+async def test_if_not_fires_on_event_data_list_with_value(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test the event does not fire if the event data is a list with the value."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"some_attr": 1},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire("test_event", {"some_attr": [1, 2]})
+    hass.bus.async_fire("test_event", {"some_attr": [1]})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 0
+
+    hass.bus.async_fire("test_event", {"some_attr": 1})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+
+async def test_if_fires_on_event_data_equal_bool_and_int(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test a bool in the event data matches the int it is equal to."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {"some_attr": True},
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    # The values are compared for equality like dict items
+    hass.bus.async_fire("test_event", {"some_attr": True})
+    hass.bus.async_fire("test_event", {"some_attr": 1})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 2
+
+    hass.bus.async_fire("test_event", {"some_attr": False})
+    hass.bus.async_fire("test_event", {"some_attr": 0})
+    hass.bus.async_fire("test_event", {"some_attr": 2})
+    await hass.async_block_till_done()
+    assert len(service_calls) == 2
+
+
+async def test_if_fires_on_event_with_scalar_and_nested_data(
+    hass: HomeAssistant, service_calls: list[ServiceCall]
+) -> None:
+    """Test the (non)firing of event when the event data is scalar and nested."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "event",
+                    "event_type": "test_event",
+                    "event_data": {
+                        "some_attr": "some_value",
+                        "parent_attr": {"some_attr": "some_value"},
+                    },
+                },
+                "action": {"service": "test.automation"},
+            }
+        },
+    )
+
+    hass.bus.async_fire(
+        "test_event",
+        {
+            "some_attr": "some_value",
+            "parent_attr": {"some_attr": "some_value"},
+            "another": "value",
+        },
+    )
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+    # The nested data is validated by the schema
+    hass.bus.async_fire(
+        "test_event",
+        {"some_attr": "some_value", "parent_attr": {"some_attr": "other_value"}},
+    )
+    hass.bus.async_fire("test_event", {"some_attr": "some_value"})
+    # The scalar data still has to match
+    hass.bus.async_fire(
+        "test_event",
+        {"some_attr": "other_value", "parent_attr": {"some_attr": "some_value"}},
+    )
+    await hass.async_block_till_done()
+    assert len(service_calls) == 1
+
+
 @pytest.mark.parametrize(
     "event_type", ["state_reported", ["test_event", "state_reported"]]
 )
@@ -4,7 +4,8 @@ import asyncio
 from collections.abc import Callable
 from datetime import datetime, timedelta
 from http import HTTPStatus
-from unittest.mock import Mock
+from typing import Any
+from unittest.mock import ANY, Mock
 
 from freezegun import freeze_time
 import pytest
@@ -516,6 +517,66 @@ async def test_logbook_describe_event(
     assert event["domain"] == "test_domain"
 
 
+@pytest.mark.usefixtures("recorder_mock")
+async def test_logbook_describe_event_cached(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test recorded events are only described again after registry updates."""
+    describe = Mock(return_value={"name": "Test Name", "message": "tested"})
+
+    hass.config.components.add("fake_integration")
+    mock_platform(
+        hass,
+        "fake_integration.logbook",
+        Mock(
+            async_describe_events=(
+                lambda hass, async_describe_event: async_describe_event(
+                    "test_domain", "some_event", describe
+                )
+            ),
+        ),
+    )
+
+    assert await async_setup_component(hass, "logbook", {})
+    with freeze_time(dt_util.utcnow() - timedelta(seconds=5)):
+        hass.bus.async_fire("some_event")
+        await async_wait_recording_done(hass)
+
+    client = await hass_client()
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day, tzinfo=dt_util.UTC)
+    end_time = start_date + timedelta(hours=24)
+
+    async def _fetch_entries() -> list[dict[str, Any]]:
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}",
+            params={"end_time": end_time.isoformat()},
+        )
+        return await response.json()
+
+    entries = await _fetch_entries()
+    assert entries == [
+        {
+            "name": "Test Name",
+            "message": "tested",
+            "domain": "test_domain",
+            "when": ANY,
+        }
+    ]
+    assert describe.call_count == 1
+
+    assert await _fetch_entries() == entries
+    assert describe.call_count == 1
+
+    hass.bus.async_fire(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "create", "entity_id": "sensor.new"},
+    )
+    await hass.async_block_till_done()
+    assert await _fetch_entries() == entries
+    assert describe.call_count == 2
+
+
 @pytest.mark.usefixtures("recorder_mock")
 async def test_exclude_described_event(
     hass: HomeAssistant, hass_client: ClientSessionGenerator
@@ -1843,6 +1843,115 @@ async def test_subscribe_unsubscribe_logbook_stream_big_query(
     ) == listeners_without_writes(init_listeners)
 
 
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_historical_events_in_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are sent in partial messages, newest first."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    start_time = dt_util.utcnow()
+    # The first state has no old state so it is not in the logbook
+    for state in ("1", "2", "3", "4", "5", "6"):
+        hass.states.async_set("binary_sensor.chunked", state)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "entity_ids": ["binary_sensor.chunked"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    received: list[tuple[list[str], bool]] = []
+    while True:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        partial = msg["event"].get("partial", False)
+        received.append(([event["state"] for event in msg["event"]["events"]], partial))
+        if not partial:
+            break
+
+    # The newest events are sent first as the client adds older events
+    # after the ones it shows
+    assert received == [(["6"], True), (["4", "5"], True), (["2", "3"], False)]
+
+
+@patch("homeassistant.components.logbook.websocket_api.MAX_EVENTS_PER_MESSAGE", 2)
+async def test_logbook_stream_historical_events_newest_day_first(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test historical events are fetched and sent a day at a time, newest first."""
+    await asyncio.gather(
+        *[
+            async_setup_component(hass, comp, {})
+            for comp in ("homeassistant", "logbook")
+        ]
+    )
+    await hass.async_block_till_done()
+    start_time = dt_util.utcnow() - timedelta(days=3)
+    for hours, state in (
+        (0, "1"),
+        (1, "2"),
+        (30, "3"),
+        (31, "4"),
+        (32, "5"),
+        (60, "6"),
+    ):
+        with freeze_time(start_time + timedelta(hours=hours)):
+            hass.states.async_set("binary_sensor.days", state)
+    await async_wait_recording_done(hass)
+
+    websocket_client = await hass_ws_client()
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": start_time.isoformat(),
+            "end_time": (start_time + timedelta(hours=72)).isoformat(),
+            "entity_ids": ["binary_sensor.days"],
+        }
+    )
+
+    msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+    assert msg["id"] == 7
+    assert msg["type"] == TYPE_RESULT
+    assert msg["success"]
+
+    received: list[tuple[list[str], bool]] = []
+    while True:
+        msg = await asyncio.wait_for(websocket_client.receive_json(), 2)
+        assert msg["id"] == 7
+        assert msg["type"] == "event"
+        partial = msg["event"].get("partial", False)
+        received.append(([event["state"] for event in msg["event"]["events"]], partial))
+        if not partial:
+            break
+
+    assert received == [
+        (["6"], True),
+        (["5"], True),
+        (["3", "4"], True),
+        (["2"], False),
+    ]
+
+
 @patch("homeassistant.components.logbook.websocket_api.EVENT_COALESCE_TIME", 0)
 async def test_subscribe_unsubscribe_logbook_stream_device(
     recorder_mock: Recorder,
@@ -2040,6 +2149,7 @@ async def test_logbook_stream_match_multiple_entities(
         "mock_event", {"entity_id": ["sensor.any", entity_id]}, context=context
     )
     hass.bus.async_fire("mock_event", {"entity_id": [f"sensor.any,{entity_id}"]})
+    hass.bus.async_fire("mock_event", {"entity_id": f"sensor.any,{entity_id}"})
     hass.bus.async_fire("mock_event", {"entity_id": ["sensor.no_match", "light.off"]})
     hass.states.async_set(entity_id, STATE_OFF, context=context)
     await hass.async_block_till_done()
@@ -2055,6 +2165,12 @@ async def test_logbook_stream_match_multiple_entities(
             "name": "device name",
             "when": ANY,
         },
+        {
+            "domain": "test",
+            "message": "is on fire",
+            "name": "device name",
+            "when": ANY,
+        },
         {
             "context_domain": "test",
             "context_event_type": "mock_event",
@@ -429,6 +429,45 @@ async def test_subscribe_topic_level_wildcard(
     assert recorded_calls[0].payload == "test-payload"
 
 
+async def test_subscribe_wildcard_after_topic_was_matched(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test cached topic matches are updated when subscriptions change."""
+    await mqtt_mock_entry()
+    calls_a: list[ReceiveMessage] = []
+
+    @callback
+    def record_calls_a(msg: ReceiveMessage) -> None:
+        calls_a.append(msg)
+
+    await mqtt.async_subscribe(hass, "test-topic/bier/on", record_calls_a)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wijn/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 1
+    assert len(recorded_calls) == 0
+
+    unsub = await mqtt.async_subscribe(hass, "test-topic/+/on", record_calls)
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wijn/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 2
+    assert [msg.topic for msg in recorded_calls] == [
+        "test-topic/bier/on",
+        "test-topic/wijn/on",
+    ]
+
+    unsub()
+    async_fire_mqtt_message(hass, "test-topic/bier/on", "test-payload")
+    async_fire_mqtt_message(hass, "test-topic/wijn/on", "test-payload")
+    await hass.async_block_till_done()
+    assert len(calls_a) == 3
+    assert len(recorded_calls) == 2
+
+
 async def test_subscribe_topic_level_wildcard_no_subtree_match(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
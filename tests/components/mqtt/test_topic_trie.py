@@ -0,0 +1,61 @@
+"""The tests for the MQTT topic trie."""
+
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "match"),
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("a/+", "a/b/c", False),
+        ("a/#", "a/b/c", True),
+        ("a/#", "a", True),
+        ("a/#", "b", False),
+        ("+/+", "/b", True),
+        ("+", "/b", False),
+        ("#", "a/b/c", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match_topic_and_filter(topic_filter: str, topic: str, match: bool) -> None:
+    """Test matching topics against topic filters in both directions."""
+    filters: TopicTrie[str] = TopicTrie()
+    filters.add(topic_filter, "value")
+    assert filters.match_topic(topic) == (["value"] if match else [])
+
+    topics: TopicTrie[str] = TopicTrie()
+    topics.add(topic, topic)
+    assert list(topics.match_filter(topic_filter)) == ([topic] if match else [])
+
+
+def test_match_topic_order_and_remove() -> None:
+    """Test matches are returned in insertion order and can be removed."""
+    trie: TopicTrie[str] = TopicTrie()
+    trie.add("a/#", "first")
+    trie.add("a/+/c", "second")
+    trie.add("+/b/c", "third")
+    trie.add("a/b/c", "fourth")
+    assert trie.match_topic("a/b/c") == ["first", "second", "third", "fourth"]
+    assert "a/+/c" in trie
+    assert "a/+" not in trie
+
+    trie.remove("a/+/c", "second")
+    assert "a/+/c" not in trie
+    assert trie.match_topic("a/b/c") == ["first", "third", "fourth"]
+
+    with pytest.raises(KeyError):
+        trie.remove("a/+/c", "second")
+
+    trie.remove("a/#", "first")
+    trie.remove("+/b/c", "third")
+    trie.remove("a/b/c", "fourth")
+    assert trie.match_topic("a/b/c") == []
+    assert not trie._root.children
@@ -0,0 +1,196 @@
+"""The tests for the recorder history ring buffer."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun import freeze_time
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.history.ring_buffer import (
+    EVICTION_CHECK_INTERVAL,
+    HistoryRingBuffer,
+)
+from homeassistant.core import HomeAssistant, State
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Set up recorder."""
+
+
+def _without_context(
+    states: dict[str, list[State | dict[str, Any]]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the states as dicts without the context."""
+    return {
+        entity_id: [
+            {**state.as_dict(), "context": None} if isinstance(state, State) else state
+            for state in entity_states
+        ]
+        for entity_id, entity_states in states.items()
+    }
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_hours": 1}])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_significant_states_from_ring_buffer(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test the ring buffer returns the same states as the database."""
+    entity_ids = ["sensor.one", "climate.two"]
+    start = dt_util.utcnow()
+    for idx in range(10):
+        with freeze_time(start + timedelta(seconds=idx)):
+            for entity_id in entity_ids:
+                hass.states.async_set(
+                    entity_id, str(idx // 2), {"idx": idx // 3, "unit": "W"}
+                )
+            await async_wait_recording_done(hass)
+
+    ring_buffer = recorder_mock.history_ring_buffer
+    assert ring_buffer is not None
+
+    def _get_states() -> dict:
+        return history.get_significant_states(
+            hass,
+            start + timedelta(seconds=3.5),
+            start + timedelta(seconds=8.5),
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+            minimal_response=minimal_response,
+            no_attributes=no_attributes,
+        )
+
+    with patch.object(
+        ring_buffer, "significant_states", wraps=ring_buffer.significant_states
+    ) as significant_states_mock:
+        buffered = await recorder_mock.async_add_executor_job(_get_states)
+    assert significant_states_mock.return_value is not None
+    assert significant_states_mock.call_count == 1
+
+    recorder_mock.history_ring_buffer = None
+    try:
+        from_db = await recorder_mock.async_add_executor_job(_get_states)
+    finally:
+        recorder_mock.history_ring_buffer = ring_buffer
+
+    assert _without_context(buffered) == _without_context(from_db)
+    assert len(buffered["sensor.one"]) > 1
+
+
+@pytest.mark.parametrize("recorder_config", [{"history_cache_hours": 1}])
+async def test_ring_buffer_misses_fall_back_to_database(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+) -> None:
+    """Test states the ring buffer does not hold are read from the database."""
+    start = dt_util.utcnow()
+    with freeze_time(start):
+        hass.states.async_set("sensor.one", "1")
+        await async_wait_recording_done(hass)
+    with freeze_time(start + timedelta(seconds=1)):
+        hass.states.async_set("sensor.one", "2")
+        await async_wait_recording_done(hass)
+
+    ring_buffer = recorder_mock.history_ring_buffer
+    assert ring_buffer is not None
+    ring_buffer.clear()
+
+    states = await recorder_mock.async_add_executor_job(
+        history.get_significant_states,
+        hass,
+        start + timedelta(seconds=0.5),
+        None,
+        ["sensor.one"],
+    )
+    assert [state.state for state in states["sensor.one"]] == ["1", "2"]
+
+
+def test_ring_buffer_coverage() -> None:
+    """Test the ring buffer only answers for periods it fully holds."""
+    ring_buffer = HistoryRingBuffer(3600, 1024**2)
+    ring_buffer.add("sensor.one", "1", "{}", 10.0, 10.0)
+    ring_buffer.add("sensor.one", "2", "{}", 20.0, 20.0)
+    ring_buffer.add("sensor.two", "1", "{}", 15.0, 15.0)
+
+    assert (
+        ring_buffer.significant_states(["sensor.one"], 5.0, None, True, True, False)
+        is None
+    )
+    assert (
+        ring_buffer.significant_states(
+            ["sensor.one", "sensor.three"], 16.0, None, True, True, False
+        )
+        is None
+    )
+
+    buffered = ring_buffer.significant_states(
+        ["sensor.one", "sensor.two"], 16.0, None, True, True, False
+    )
+    assert buffered is not None
+    assert buffered.entity_id_to_metadata_id == {"sensor.one": 0, "sensor.two": 1}
+    assert [
+        (row.metadata_id, row.state, row.last_updated_ts) for row in buffered.rows
+    ] == [
+        (0, "1", 0),
+        (0, "2", 20.0),
+        (1, "1", 0),
+    ]
+
+    # An out of order state removes the entity from the buffer
+    ring_buffer.add("sensor.one", "3", "{}", 19.0, 19.0)
+    assert ring_buffer.entity_ids() == ["sensor.two"]
+
+    ring_buffer.evict_before(16.0)
+    assert ring_buffer.entity_ids() == []
+
+
+def test_ring_buffer_eviction() -> None:
+    """Test the ring buffer evicts old states and respects the memory cap."""
+    ring_buffer = HistoryRingBuffer(100, 1024**2)
+    for idx in range(EVICTION_CHECK_INTERVAL):
+        ring_buffer.add("sensor.one", str(idx), '{"unit": "W"}', idx, idx)
+
+    # The last state before the window is kept for the start state
+    cutoff_ts = EVICTION_CHECK_INTERVAL - 1 - 100
+    assert (
+        ring_buffer.significant_states(
+            ["sensor.one"], cutoff_ts - 1, None, True, True, True
+        )
+        is None
+    )
+    buffered = ring_buffer.significant_states(
+        ["sensor.one"], cutoff_ts, None, True, True, True
+    )
+    assert buffered is not None
+    assert buffered.rows[0].state == str(cutoff_ts - 1)
+    assert len(buffered.rows) == 101
+
+    # Identical attributes are shared
+    assert len(ring_buffer._attributes) == 1
+
+    ring_buffer = HistoryRingBuffer(1000, 8 * 1024)
+    for idx in range(EVICTION_CHECK_INTERVAL):
+        ring_buffer.add("sensor.one", str(idx), f'{{"idx": {idx}}}', idx, idx)
+    assert ring_buffer.memory_estimate <= 8 * 1024
+    assert (
+        ring_buffer.significant_states(["sensor.one"], 100, None, True, True, True)
+        is None
+    )
@@ -9,10 +9,11 @@ import sqlite3
 import sys
 import threading
 from typing import Any, cast
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -28,12 +29,14 @@ from homeassistant.components.recorder import (
     CONFIG_SCHEMA,
     DOMAIN,
     Recorder,
+    bulk_insert,
     db_schema,
     get_instance,
     migration,
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -287,6 +290,93 @@ async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_states_and_events_in_one_commit(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test saving states which reference states in the same commit."""
+    with patch(
+        "homeassistant.components.recorder.core.supports_bulk_insert_states",
+        return_value=bulk_insert_states,
+    ):
+        for idx in range(3):
+            hass.states.async_set("test.one", str(idx), {"idx": idx})
+            hass.states.async_set("test.two", str(idx))
+            hass.bus.async_fire("test_event", {"idx": idx})
+        hass.states.async_remove("test.two")
+        await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = {
+            db_state.state_id: (
+                states_meta.entity_id,
+                db_state.state,
+                db_state.old_state_id,
+                db_state_attributes.shared_attrs if db_state_attributes else None,
+            )
+            for db_state, db_state_attributes, states_meta in (
+                session.query(States, StateAttributes, StatesMeta)
+                .outerjoin(
+                    StateAttributes,
+                    States.attributes_id == StateAttributes.attributes_id,
+                )
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            )
+        }
+        event_data = [
+            event_data.shared_data
+            for event_data in session.query(EventData)
+            .join(Events, Events.data_id == EventData.data_id)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "test_event")
+            .order_by(Events.time_fired_ts)
+        ]
+
+    history: dict[str, list[tuple[str, str | None]]] = {}
+    for state_id in sorted(db_states):
+        entity_id, state, old_state_id, shared_attrs = db_states[state_id]
+        if old_state_id is None:
+            assert entity_id not in history
+        else:
+            assert db_states[old_state_id][0] == entity_id
+            assert history[entity_id][-1][0] == db_states[old_state_id][1]
+        history.setdefault(entity_id, []).append((state, shared_attrs))
+
+    assert history == {
+        "test.one": [(str(idx), f'{{"idx":{idx}}}') for idx in range(3)],
+        "test.two": [(str(idx), "{}") for idx in range(3)] + [(None, "{}")],
+    }
+    assert event_data == [f'{{"idx":{idx}}}' for idx in range(3)]
+
+
+@pytest.mark.parametrize(
+    ("lock_mode", "increment", "expected_state_ids"),
+    [(0, 1, [11, 12, 13]), (1, 2, [11, 13, 15]), (2, 1, None)],
+)
+def test_bulk_insert_states_mysql(
+    lock_mode: int, increment: int, expected_state_ids: list[int] | None
+) -> None:
+    """Test the ids of bulk inserted states are derived on MySQL."""
+    session = MagicMock()
+    dialect = session.get_bind.return_value.dialect
+    dialect.name = SupportedDialect.MYSQL
+    dialect.insert_executemany_returning_sort_by_parameter_order = False
+    session.connection.return_value.info = {}
+    session.execute.return_value.one.return_value = (lock_mode, increment)
+    session.execute.return_value.lastrowid = 11
+
+    assert bulk_insert.supports_bulk_insert_states(session) is (
+        expected_state_ids is not None
+    )
+    if expected_state_ids is None:
+        return
+    states = [States(state=str(idx)) for idx in range(3)]
+    bulk_insert.bulk_insert_states(session, states)
+    assert [dbstate.state_id for dbstate in states] == expected_state_ids
+    # The server variables are only read once per connection
+    assert session.execute.call_count == 2
+
+
 @pytest.mark.parametrize(
     ("db_engine", "expected_attributes"),
     [
@@ -395,11 +485,8 @@ async def test_saving_state_with_exception(
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+        if get_instance(hass)._pending_states:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
@@ -1808,6 +1895,41 @@ async def test_entity_id_filter(
             assert len(db_events) == idx + 1, data
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_executor_uses_read_only_connections(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test read jobs run on read-only connections which are reused."""
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    def _read_states() -> tuple[str, int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            connection = session.connection().connection.driver_connection
+            count = session.query(States).count()
+        with (
+            pytest.raises(OperationalError, match="readonly"),
+            session_scope(hass=hass) as session,
+        ):
+            session.execute(text("DELETE FROM states"))
+        return threading.current_thread().name, count, id(connection)
+
+    results = [
+        await recorder_mock.async_add_read_executor_job(_read_states) for _ in range(3)
+    ]
+    assert {name.startswith(DB_READ_WORKER_PREFIX) for name, _, _ in results} == {True}
+    assert {count for _, count, _ in results} == {1}
+    # The connection of a worker thread is reused
+    connections = {name: connection for name, _, connection in results}
+    assert all(connection == connections[name] for name, _, connection in results)
+
+    timings = recorder_mock.read_job_timings.as_dict()
+    assert timings.keys() == {"average_wait", "max_wait", "average_run", "max_run"}
+    assert timings["max_run"] >= timings["average_run"] > 0
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
@@ -2776,6 +2898,43 @@ async def test_commit_before_commits_pending_writes(
     await verify_session_commit_future
 
 
+async def test_commit_when_max_pending_rows_reached(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    recorder_db_url: str,
+) -> None:
+    """Test pending rows are committed before the commit interval is reached."""
+    config = {
+        recorder.CONF_DB_URL: recorder_db_url,
+        recorder.CONF_COMMIT_INTERVAL: 60,
+    }
+
+    recorder_helper.async_initialize_recorder(hass)
+    with patch("homeassistant.components.recorder.core.COMMIT_MAX_PENDING_ROWS", 3):
+        hass.async_create_task(async_setup_recorder_instance(hass, config))
+        await recorder_helper.async_wait_recorder(hass)
+    instance = get_instance(hass)
+    commits = instance.commit_scheduler.commits
+    commits_future: asyncio.Future[int] = hass.loop.create_future()
+
+    class GetCommitsTask(recorder.tasks.RecorderTask):
+        """Task to get the number of commits."""
+
+        commit_before = False
+
+        def run(self, instance: Recorder) -> None:
+            hass.loop.call_soon_threadsafe(
+                commits_future.set_result, instance.commit_scheduler.commits
+            )
+
+    # The event type and two events reach the maximum of pending rows
+    instance.queue_task(Event("fake_event"))
+    instance.queue_task(Event("fake_event"))
+    instance.queue_task(GetCommitsTask())
+
+    assert await commits_future > commits
+
+
 async def test_all_tables_use_default_table_args(hass: HomeAssistant) -> None:
     """Test that all tables use the default table args."""
     for table in db_schema.Base.metadata.tables.values():
@@ -6,13 +6,20 @@ import sys
 from unittest.mock import Mock, patch
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, select, text
 from sqlalchemy.orm import Session
 from sqlalchemy.schema import Index
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import core, migration, statistics
-from homeassistant.components.recorder.db_schema import SCHEMA_VERSION
+from homeassistant.components.recorder.db_schema import (
+    SCHEMA_VERSION,
+    MigrationChanges,
+    SchemaChanges,
+    Statistics,
+    StatisticsMeta,
+    StatisticsRollups,
+)
 from homeassistant.components.recorder.migration import MigrationTask
 from homeassistant.components.recorder.queries import get_migration_changes
 from homeassistant.components.recorder.util import (
@@ -101,6 +108,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (1, 1),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollups": (1, 1),
             },
             [
                 "ix_states_context_id",
@@ -117,6 +125,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollups": (1, 1),
             },
             [
                 "ix_states_context_id",
@@ -133,6 +142,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollups": (1, 1),
             },
             ["ix_states_entity_id_last_updated_ts"],
         ),
@@ -145,6 +155,7 @@ def _create_engine_test(
                 "entity_id_migration": (2, 1),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 1),
+                "statistics_rollups": (1, 1),
             },
             ["ix_states_entity_id_last_updated_ts"],
         ),
@@ -157,6 +168,7 @@ def _create_engine_test(
                 "entity_id_migration": (0, 0),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 0),
+                "statistics_rollups": (1, 1),
             },
             [],
         ),
@@ -169,6 +181,7 @@ def _create_engine_test(
                 "entity_id_migration": (0, 0),
                 "event_id_post_migration": (0, 0),
                 "entity_id_post_migration": (0, 0),
+                "statistics_rollups": (0, 0),
             },
             [],
         ),
@@ -205,6 +218,7 @@ async def test_data_migrator_logic(
         "entity_id_migration": migrator_mock(),
         "event_id_post_migration": migrator_mock(),
         "entity_id_post_migration": migrator_mock(),
+        "statistics_rollups": migrator_mock(),
     }
 
     def patch_check(
@@ -232,12 +246,14 @@ async def test_data_migrator_logic(
         patch_check("entity_id_migration", migration.EntityIDMigration),
         patch_check("event_id_post_migration", migration.EventIDPostMigration),
         patch_check("entity_id_post_migration", migration.EntityIDPostMigration),
+        patch_check("statistics_rollups", migration.StatisticsRollupsMigration),
         patch_migrate("state_context_id_as_binary", migration.StatesContextIDMigration),
         patch_migrate("event_context_id_as_binary", migration.EventsContextIDMigration),
         patch_migrate("event_type_id_migration", migration.EventTypeIDMigration),
         patch_migrate("entity_id_migration", migration.EntityIDMigration),
         patch_migrate("event_id_post_migration", migration.EventIDPostMigration),
         patch_migrate("entity_id_post_migration", migration.EntityIDPostMigration),
+        patch_migrate("statistics_rollups", migration.StatisticsRollupsMigration),
         patch(
             CREATE_ENGINE_TARGET,
             new=_create_engine_test(
@@ -372,3 +388,90 @@ async def test_migration_changes_prevent_trying_to_migrate_again(
         if not isinstance(task, MigrationTask):
             continue
         assert not isinstance(task.migrator, migration.StatesContextIDMigration)
+
+
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.usefixtures("hass_storage")  # Prevent test hass from writing to storage
+async def test_statistics_rollups_computed_when_migrating_from_schema_48(
+    async_test_recorder: RecorderInstanceGenerator,
+) -> None:
+    """Test the rollups of existing statistics are computed after schema 48."""
+    config = {recorder.CONF_COMMIT_INTERVAL: 1}
+    # 2022-10-03 00:00:00 in the US/Pacific time zone of the tests, a Monday
+    start_ts = 1664780400.0
+
+    def _downgrade_to_schema_48(hass: HomeAssistant) -> None:
+        with session_scope(hass=hass) as session:
+            meta = StatisticsMeta(
+                has_mean=True,
+                has_sum=False,
+                name=None,
+                source="test",
+                statistic_id="test:total",
+                unit_of_measurement=None,
+            )
+            session.add(meta)
+            session.flush()
+            session.add_all(
+                Statistics.from_stats_ts(
+                    meta.id,
+                    {
+                        "start_ts": start_ts + hour * 3600,
+                        "mean": hour,
+                        "min": hour,
+                        "max": hour,
+                    },
+                )
+                for hour in range(3)
+            )
+            session.execute(
+                delete(MigrationChanges).where(
+                    MigrationChanges.migration_id
+                    == migration.StatisticsRollupsMigration.migration_id
+                )
+            )
+            session.execute(delete(SchemaChanges))
+            session.add(SchemaChanges(schema_version=48))
+            session.execute(text("DROP TABLE statistics_rollups"))
+
+    def _get_rollups(hass: HomeAssistant) -> list[tuple[int, float, float | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                tuple(row)
+                for row in session.execute(
+                    select(
+                        StatisticsRollups.period,
+                        StatisticsRollups.start_ts,
+                        StatisticsRollups.mean,
+                    ).order_by(StatisticsRollups.period)
+                )
+            ]
+
+    async with async_test_home_assistant() as hass, async_test_recorder(hass, config):
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+        instance = recorder.get_instance(hass)
+        assert instance.statistics_rollups_ready
+        await instance.async_add_executor_job(_downgrade_to_schema_48, hass)
+        await hass.async_stop()
+
+    async with async_test_home_assistant() as hass, async_test_recorder(hass, config):
+        await hass.async_block_till_done()
+        await async_wait_recording_done(hass)
+        await _async_wait_migration_done(hass)
+        instance = recorder.get_instance(hass)
+        assert instance.schema_version == SCHEMA_VERSION
+        assert instance.statistics_rollups_ready
+        assert await instance.async_add_executor_job(_get_rollups, hass) == [
+            (0, start_ts, 1.0),
+            (1, start_ts, 1.0),
+            (2, start_ts - 2 * 86400, 1.0),  # 2022-10-01
+        ]
+        migration_changes = await instance.async_add_executor_job(
+            _get_migration_id, hass
+        )
+        assert (
+            migration_changes[migration.StatisticsRollupsMigration.migration_id]
+            == migration.StatisticsRollupsMigration.migration_version
+        )
+        await hass.async_stop()
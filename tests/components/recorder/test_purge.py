@@ -12,7 +12,7 @@ from sqlalchemy.exc import DatabaseError, OperationalError
 from sqlalchemy.orm.session import Session
 from voluptuous.error import MultipleInvalid
 
-from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, Recorder, purge
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
     Events,
@@ -425,6 +425,103 @@ async def test_purge_old_statistics_runs(
         assert statistics_runs.count() == 1
 
 
+@pytest.mark.parametrize("recorder_config", [{"purge_by_day": True}])
+async def test_purge_by_day(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test purging the oldest day of rows as one range of ids."""
+    await _add_test_states(hass)
+    await _add_test_events(hass)
+    await _add_test_statistics(hass)
+    # A state which was not recorded in order
+    with session_scope(hass=hass) as session:
+        _add_state_without_event_linkage(
+            session, "test.late", "late", dt_util.utcnow() - timedelta(days=11)
+        )
+
+    def _count_rows() -> tuple[int, int, int, int]:
+        with session_scope(hass=hass) as session:
+            return (
+                session.query(States).count(),
+                session.query(StateAttributes).count(),
+                session.query(Events)
+                .filter(
+                    Events.event_type_id.in_(select_event_type_ids(TEST_EVENT_TYPES))
+                )
+                .count(),
+                session.query(StatisticsShortTerm).count(),
+            )
+
+    assert _count_rows() == (7, 4, 6, 6)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    # The rows of 11 days ago which were recorded in order
+    assert not purge_old_data(recorder_mock, purge_before, repack=False)
+    assert _count_rows() == (5, 3, 4, 4)
+
+    # The rows of 5 days ago, the late state is purged in batches
+    assert not purge_old_data(recorder_mock, purge_before, repack=False)
+    assert _count_rows() == (2, 1, 2, 2)
+
+    assert purge_old_data(recorder_mock, purge_before, repack=False)
+    assert _count_rows() == (2, 1, 2, 2)
+
+    with session_scope(hass=hass) as session:
+        states = {state.state: state for state in session.query(States)}
+        assert states["dontpurgeme_5"].old_state_id == states["dontpurgeme_4"].state_id
+        assert states["dontpurgeme_4"].old_state_id is None
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+
+@pytest.mark.parametrize("recorder_config", [{"purge_by_day": True}])
+async def test_purge_by_day_in_batches(
+    hass: HomeAssistant, recorder_mock: Recorder, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the oldest day is purged in ranges of up to max_bind_vars state ids."""
+    now = dt_util.utcnow()
+    eleven_days_ago = now - timedelta(days=11)
+    with session_scope(hass=hass) as session:
+        for entity_id, timestamp in (
+            ("test.old_0", eleven_days_ago),
+            # A newer state which was recorded among the oldest ones
+            ("test.new_a", now - timedelta(hours=1)),
+            ("test.old_1", eleven_days_ago + timedelta(minutes=1)),
+            ("test.old_2", eleven_days_ago + timedelta(minutes=2)),
+            ("test.new_b", now - timedelta(hours=2)),
+        ):
+            _add_state_without_event_linkage(session, entity_id, "on", timestamp)
+        session.flush()
+        state_ids = {state.entity_id: state.state_id for state in session.query(States)}
+        session.add(
+            States(
+                entity_id="test.new_a",
+                state="off",
+                last_changed_ts=now.timestamp(),
+                last_updated_ts=now.timestamp(),
+                old_state_id=state_ids["test.new_a"],
+            )
+        )
+    last_committed_ids = recorder_mock.states_manager._last_committed_id
+    last_committed_ids["test.new_a"] = state_ids["test.new_a"]
+
+    with patch.object(recorder_mock, "max_bind_vars", 2):
+        assert not purge_old_data(recorder_mock, now - timedelta(days=4), repack=False)
+
+    old_0, old_1, old_2 = (state_ids[f"test.old_{idx}"] for idx in range(3))
+    assert f"Deleted 2 states from state_id {old_0} to {old_1}" in caplog.text
+    assert f"Deleted 1 states from state_id {old_2} to {old_2}" in caplog.text
+    with session_scope(hass=hass) as session:
+        states = {
+            (state.entity_id, state.state): state for state in session.query(States)
+        }
+        assert set(states) == {
+            ("test.new_a", "on"),
+            ("test.new_a", "off"),
+            ("test.new_b", "on"),
+        }
+        # States linked to kept states in the range of ids stay linked
+        assert states["test.new_a", "off"].old_state_id == state_ids["test.new_a"]
+    assert last_committed_ids["test.new_a"] == state_ids["test.new_a"]
+
+
 @pytest.mark.parametrize("use_sqlite", [True, False], indirect=True)
 @pytest.mark.usefixtures("recorder_mock")
 async def test_purge_method(
@@ -2249,3 +2346,53 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_skips_lookup_of_attributes_used_by_recent_states(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test purging does not look up attributes used by states that are kept."""
+    await async_wait_recording_done(hass)
+    one_week_ago = dt_util.utcnow() - timedelta(days=7)
+    with freeze_time(one_week_ago):
+        hass.states.async_set("sensor.shared", "old", {"unit": "shared"})
+        hass.states.async_set("sensor.orphan", "old", {"unit": "orphan"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.shared", "now", {"unit": "shared"})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        attributes_ids = {
+            json.loads(shared_attrs)["unit"]: attributes_id
+            for attributes_id, shared_attrs in session.query(
+                StateAttributes.attributes_id, StateAttributes.shared_attrs
+            )
+        }
+    assert set(attributes_ids) == {"shared", "orphan"}
+
+    looked_up_ids: set[int] = set()
+    original_query = purge.attributes_ids_exist_in_states_with_fast_in_distinct
+
+    def _attributes_ids_exist_in_states(attributes_ids: set[int]):
+        looked_up_ids.update(attributes_ids)
+        return original_query(attributes_ids)
+
+    with patch.object(
+        purge,
+        "attributes_ids_exist_in_states_with_fast_in_distinct",
+        _attributes_ids_exist_in_states,
+    ):
+        finished = purge_old_data(
+            recorder_mock,
+            dt_util.utcnow() - timedelta(days=4),
+            repack=False,
+        )
+    assert finished
+    assert looked_up_ids == {attributes_ids["orphan"]}
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+        assert [
+            attributes_id
+            for (attributes_id,) in session.query(StateAttributes.attributes_id)
+        ] == [attributes_ids["shared"]]
@@ -0,0 +1,254 @@
+"""The tests for the recorder event spool."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.db_schema import EventData, Events, EventTypes
+from homeassistant.components.recorder.spool import EventSpool
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Context, Event, EventOrigin, HomeAssistant, State
+from homeassistant.helpers.json import json_bytes
+import homeassistant.util.dt as dt_util
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@pytest.fixture
+def spool_dir(tmp_path: Path) -> Generator[Path]:
+    """Spool the events to a temporary directory."""
+    path = tmp_path / "spool"
+    with patch("homeassistant.components.recorder.core.SPOOL_DIR", str(path)):
+        yield path
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceGenerator, spool_dir: Path
+) -> None:
+    """Set up recorder."""
+
+
+def _state_changed_events(count: int) -> list[Event]:
+    """Return state changed events with a parent context."""
+    context = Context(user_id="user", parent_id="parent")
+    return [
+        Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.test",
+                "old_state": None
+                if idx == 0
+                else State("sensor.test", str(idx - 1), context=context),
+                "new_state": State(
+                    "sensor.test", str(idx), {"unit": "W"}, context=context
+                ),
+            },
+            EventOrigin.local,
+            1000.0 + idx,
+            context,
+        )
+        for idx in range(count)
+    ]
+
+
+def test_spool_events_in_order(tmp_path: Path) -> None:
+    """Test events are taken from the spool in the order they were appended."""
+    spool = EventSpool(str(tmp_path), segment_size=512)
+    spool.recover()
+    events = _state_changed_events(10)
+    events.append(Event("test_event", {"key": "value"}, EventOrigin.remote))
+
+    assert not spool.append(events[0])
+    spool.start()
+    for event in events:
+        assert spool.append(event)
+        if spool.start_preparing_segment():
+            spool.prepare_segment()
+    assert len(spool) == 11
+    # The events do not fit in one segment
+    assert len(os.listdir(tmp_path)) > 2
+
+    taken = spool.take(4) + spool.take(100)
+    assert len(spool) == 0
+    assert not spool.active
+    # Only the spare segment is left
+    assert len(os.listdir(tmp_path)) == 1
+
+    assert [json_bytes(event.as_dict()) for event in taken] == [
+        json_bytes(event.as_dict()) for event in events
+    ]
+    new_state = taken[1].data["new_state"]
+    assert isinstance(new_state, State)
+    assert new_state.last_updated == events[1].data["new_state"].last_updated
+    assert new_state.context is taken[1].context
+    assert new_state.context.parent_id == "parent"
+    assert not spool.append(events[0])
+
+
+def test_spool_append_without_segment(tmp_path: Path) -> None:
+    """Test events are held in memory until a segment is prepared."""
+    spool = EventSpool(str(tmp_path), segment_size=512)
+    spool.start()
+    events = _state_changed_events(5)
+    for event in events:
+        assert spool.append(event)
+    # Segments are only created once the spool is ready
+    assert not spool.start_preparing_segment()
+    assert not tmp_path.exists() or os.listdir(tmp_path) == []
+
+    spool.recover()
+    assert os.listdir(tmp_path)
+    assert spool.append(Event("test_event"))
+    assert [event.event_type for event in spool.take(100)] == [
+        *(EVENT_STATE_CHANGED for _ in events),
+        "test_event",
+    ]
+
+
+def test_spool_event_not_json_serializable(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test data which is not JSON serializable is dropped from spooled events."""
+    spool = EventSpool(str(tmp_path), segment_size=512)
+    spool.recover()
+    spool.start()
+    context = Context()
+    assert spool.append(Event("test_event", {"a": object()}))
+    assert spool.append(
+        Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.test",
+                "old_state": None,
+                "new_state": State(
+                    "sensor.test", "on", {"a": object()}, context=context
+                ),
+            },
+            context=context,
+        )
+    )
+    assert "Event is not JSON serializable" in caplog.text
+
+    event, state_event = spool.take(100)
+    assert event.event_type == "test_event"
+    assert event.data == {}
+    new_state = state_event.data["new_state"]
+    assert state_event.data["entity_id"] == "sensor.test"
+    assert state_event.data["old_state"] is None
+    assert (new_state.entity_id, new_state.state) == ("sensor.test", "on")
+    assert new_state.attributes == {}
+
+
+def test_spool_recover_segments(tmp_path: Path) -> None:
+    """Test the events which were not taken are recovered after a restart."""
+    spool = EventSpool(str(tmp_path), segment_size=512)
+    spool.recover()
+    spool.start()
+    events = _state_changed_events(10)
+    for event in events:
+        assert spool.append(event)
+        if spool.start_preparing_segment():
+            spool.prepare_segment()
+    # Events which are not in a segment yet are written when closing
+    spool._spare = None
+    assert spool.append(Event("test_event"))
+    assert [event.data["new_state"].state for event in spool.take(3)] == [
+        "0",
+        "1",
+        "2",
+    ]
+    spool.close()
+    (tmp_path / "other.spool").write_bytes(b"ignored")
+
+    spool = EventSpool(str(tmp_path), segment_size=512)
+    spool.recover()
+    assert spool.take(100) == []
+    recovered = spool.take_recovered(4) + spool.take_recovered(100)
+    assert [json_bytes(event.as_dict()) for event in recovered[:-1]] == [
+        json_bytes(event.as_dict()) for event in events[3:]
+    ]
+    assert recovered[-1].event_type == "test_event"
+    assert spool.take_recovered(100) == []
+    spool.close()
+    assert sorted(os.listdir(tmp_path)) == ["other.spool"]
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{"spool_backlog": 1}])
+async def test_events_spooled_while_database_locked(
+    hass: HomeAssistant, recorder_mock: Recorder, spool_dir: Path
+) -> None:
+    """Test the backlog is spooled while the database is locked."""
+    start = dt_util.utcnow()
+    assert recorder_mock.spool is not None
+    assert await recorder_mock.lock_database()
+
+    for idx in range(10):
+        hass.states.async_set("sensor.test", str(idx))
+    await hass.async_block_till_done()
+
+    # The first event is queued, the backlog after it is spooled
+    assert recorder_mock.backlog == 2
+    assert len(recorder_mock.spool) == 9
+    assert os.listdir(spool_dir)
+
+    assert recorder_mock.unlock_database()
+    await async_wait_recording_done(hass)
+
+    states = await recorder_mock.async_add_executor_job(
+        history.state_changes_during_period, hass, start, None, "sensor.test"
+    )
+    assert [state.state for state in states["sensor.test"]] == [
+        str(idx) for idx in range(10)
+    ]
+    assert not recorder_mock.spool.active
+    # Only the spare segment is left
+    assert len(os.listdir(spool_dir)) == 1
+
+
+@pytest.fixture
+def spooled_event(spool_dir: Path) -> Event:
+    """Leave an event in the spool as if the previous run stopped."""
+    spool = EventSpool(str(spool_dir))
+    spool.recover()
+    spool.start()
+    event = Event("spooled_event", {"key": "value"}, EventOrigin.local, 1000.0)
+    assert spool.append(event)
+    spool.close()
+    return event
+
+
+@pytest.mark.parametrize("recorder_config", [{"spool_backlog": 1}])
+async def test_events_spooled_by_previous_run_recorded(
+    spooled_event: Event, hass: HomeAssistant, recorder_mock: Recorder, spool_dir: Path
+) -> None:
+    """Test the events left in the spool by the previous run are recorded."""
+    await async_wait_recording_done(hass)
+
+    def _get_events() -> list[tuple[str | None, float | None]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (event_data.shared_data, event.time_fired_ts)
+                for event, event_data in session.query(Events, EventData)
+                .join(EventData, Events.data_id == EventData.data_id)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .filter(EventTypes.event_type == "spooled_event")
+            ]
+
+    assert await recorder_mock.async_add_executor_job(_get_events) == [
+        ('{"key":"value"}', spooled_event.time_fired_timestamp)
+    ]
+    # Only the spare segment is left
+    assert len(os.listdir(spool_dir)) == 1
@@ -6,14 +6,22 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    Statistics,
+    StatisticsMeta,
+    StatisticsRollups,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
+    StatisticDataTimestamp,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
+from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     PlatformCompiledStatistics,
@@ -1844,6 +1852,323 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_daily_statistics_from_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test daily statistics are read from rollups aligned with the time zone."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_ready
+
+    zero = dt_util.utcnow()
+    period1 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    period2 = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 23:00:00"))
+    period3 = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    external_statistics = (
+        {"start": period1, "last_reset": None, "state": 0, "sum": 2},
+        {"start": period2, "last_reset": None, "state": 1, "sum": 3},
+        {"start": period3, "last_reset": None, "state": 2, "sum": 4},
+    )
+    external_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(hass, external_metadata, external_statistics)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        rollups = session.execute(
+            select(
+                StatisticsRollups.period,
+                StatisticsRollups.start_ts,
+                StatisticsRollups.sum,
+            ).order_by(StatisticsRollups.period, StatisticsRollups.start_ts)
+        ).all()
+    assert rollups == [
+        (0, period1.timestamp(), 3),
+        (0, period3.timestamp(), 4),
+        (1, dt_util.parse_datetime("2022-10-03 00:00:00+00:00").timestamp(), 4),
+        (2, dt_util.parse_datetime("2022-10-01 00:00:00+00:00").timestamp(), 4),
+    ]
+
+    stats = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats == {
+        "test:total_energy_import": [
+            {
+                "start": period1.timestamp(),
+                "end": period3.timestamp(),
+                "last_reset": None,
+                "state": 1.0,
+                "sum": 3.0,
+            },
+            {
+                "start": period3.timestamp(),
+                "end": (period3 + timedelta(days=1)).timestamp(),
+                "last_reset": None,
+                "state": 2.0,
+                "sum": 4.0,
+            },
+        ]
+    }
+
+    # The rollups computed in UTC are not used after the time zone changed
+    await hass.config.async_set_time_zone("Europe/Vienna")
+    stats = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    day1_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-03 00:00:00"))
+    day2_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-04 00:00:00"))
+    day3_start = dt_util.as_utc(dt_util.parse_datetime("2022-10-05 00:00:00"))
+    expected_stats = {
+        "test:total_energy_import": [
+            {
+                "start": day1_start.timestamp(),
+                "end": day2_start.timestamp(),
+                "last_reset": None,
+                "state": 0.0,
+                "sum": 2.0,
+            },
+            {
+                "start": day2_start.timestamp(),
+                "end": day3_start.timestamp(),
+                "last_reset": None,
+                "state": 2.0,
+                "sum": 4.0,
+            },
+        ]
+    }
+    assert stats == expected_stats
+    assert not instance.statistics_rollups_ready
+
+    # The rollups are rebuilt in the background
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_ready
+    stats = statistics_during_period(
+        hass, zero, period="day", statistic_ids={"test:total_energy_import"}
+    )
+    assert stats == expected_stats
+    assert instance.statistics_rollups_ready
+
+
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_statistics_rollups_merge_compiled_hours(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiled hours are merged into the rollups like a rebuild."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    start = dt_util.parse_datetime("2022-10-03 22:00:00+00:00")
+    hours = [
+        {
+            "start_ts": (start + timedelta(hours=idx)).timestamp(),
+            "mean": mean,
+            "min": mean - 1,
+            "max": mean + idx,
+            "last_reset_ts": None,
+            "state": idx,
+            "sum": idx * 2,
+        }
+        for idx, mean in enumerate((1.5, 4.0, 2.25, 7.0))
+    ]
+    hours[1]["mean"] = None
+
+    def _rollups(session: Session) -> list[tuple[Any, ...]]:
+        return [
+            tuple(row)
+            for row in session.execute(
+                select(
+                    StatisticsRollups.period,
+                    StatisticsRollups.start_ts,
+                    StatisticsRollups.end_ts,
+                    StatisticsRollups.mean_count,
+                    StatisticsRollups.min,
+                    StatisticsRollups.max,
+                    StatisticsRollups.state,
+                    StatisticsRollups.sum,
+                ).order_by(StatisticsRollups.period, StatisticsRollups.start_ts)
+            )
+        ]
+
+    def _means(session: Session) -> list[float]:
+        return list(
+            session.execute(
+                select(StatisticsRollups.mean).order_by(
+                    StatisticsRollups.period, StatisticsRollups.start_ts
+                )
+            ).scalars()
+        )
+
+    def _merge_and_rebuild() -> tuple[list[tuple[Any, ...]], list[float]]:
+        with session_scope(session=instance.get_session()) as session:
+            meta = StatisticsMeta(
+                has_mean=True,
+                has_sum=True,
+                name=None,
+                source="test",
+                statistic_id="test:rollups",
+                unit_of_measurement=None,
+            )
+            session.add(meta)
+            session.flush()
+            for hour in hours:
+                session.add(Statistics.from_stats_ts(meta.id, hour))
+                statistics._update_statistics_rollups(
+                    session, {meta.id: hour}, hour["start_ts"], 100
+                )
+            session.flush()
+            merged = _rollups(session)
+            merged_means = _means(session)
+
+            statistics._rebuild_statistics_rollups(session, meta.id)
+            session.flush()
+            assert _rollups(session) == merged
+            assert _means(session) == pytest.approx(merged_means)
+        return merged, merged_means
+
+    merged, merged_means = await instance.async_add_executor_job(_merge_and_rebuild)
+
+    day2 = dt_util.parse_datetime("2022-10-04 00:00:00+00:00").timestamp()
+    assert merged[:2] == [
+        (0, start.replace(hour=0).timestamp(), day2, 1, 0.5, 5.0, 1, 2),
+        (0, day2, day2 + 86400, 2, 1.25, 10.0, 3, 6),
+    ]
+    assert merged_means[:2] == [1.5, pytest.approx(4.625)]
+
+
+async def test_statistics_rollups_only_used_for_whole_periods(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the rollups are not read for ranges which do not start a period."""
+    await hass.config.async_set_time_zone("UTC")
+    instance = recorder.get_instance(hass)
+    day = dt_util.parse_datetime("2022-10-03 00:00:00+00:00")
+    with session_scope(hass=hass, read_only=True) as session:
+        for start_time, end_time in (
+            (day + timedelta(hours=1), None),
+            (day, day + timedelta(hours=25)),
+        ):
+            assert (
+                statistics._statistics_rollups_during_period(
+                    hass,
+                    instance,
+                    session,
+                    start_time,
+                    end_time,
+                    None,
+                    None,
+                    {},
+                    "day",
+                    None,
+                    {"sum"},
+                )
+                is None
+            )
+
+
+@pytest.mark.parametrize("recorder_config", [{"statistics_keep_days": 30}])
+async def test_statistics_rollups_kept_when_hourly_statistics_are_purged(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test the rollups of purged hourly statistics are kept and read."""
+    await hass.config.async_set_time_zone("UTC")
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+    assert instance.statistics_rollups_ready
+    today = dt_util.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    old_day = today - timedelta(days=60)
+    recent_day = today - timedelta(days=2)
+
+    def _rollups(session: Session) -> list[tuple[Any, ...]]:
+        return [
+            tuple(row)
+            for row in session.execute(
+                select(
+                    StatisticsRollups.period,
+                    StatisticsRollups.start_ts,
+                    StatisticsRollups.sum,
+                ).order_by(StatisticsRollups.period, StatisticsRollups.start_ts)
+            )
+        ]
+
+    def _add_statistics() -> list[tuple[Any, ...]]:
+        with session_scope(session=instance.get_session()) as session:
+            meta = StatisticsMeta(
+                has_mean=False,
+                has_sum=True,
+                name=None,
+                source="test",
+                statistic_id="test:rollups",
+                unit_of_measurement=None,
+            )
+            session.add(meta)
+            session.flush()
+            for idx, start in enumerate(
+                (old_day, old_day + timedelta(hours=1), recent_day)
+            ):
+                hour: StatisticDataTimestamp = {
+                    "start_ts": start.timestamp(),
+                    "last_reset_ts": None,
+                    "state": idx,
+                    "sum": idx * 2,
+                }
+                session.add(Statistics.from_stats_ts(meta.id, hour))
+                statistics._update_statistics_rollups(
+                    session, {meta.id: hour}, hour["start_ts"], 100
+                )
+            session.flush()
+            return _rollups(session)
+
+    def _purge_and_rebuild() -> tuple[list[float], list[tuple[Any, ...]]]:
+        purge_before = dt_util.utcnow() - timedelta(days=10)
+        # The first purge deletes the hourly statistics, the second finishes
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert purge_old_data(instance, purge_before, repack=False)
+        assert statistics.rebuild_statistics_rollups(instance, 0, 100) is None
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            return (
+                list(session.execute(select(Statistics.start_ts)).scalars()),
+                _rollups(session),
+            )
+
+    rollups = await instance.async_add_executor_job(_add_statistics)
+    hourly_starts, rebuilt_rollups = await instance.async_add_executor_job(
+        _purge_and_rebuild
+    )
+    assert hourly_starts == [recent_day.timestamp()]
+    assert rebuilt_rollups == rollups
+
+    stats = statistics_during_period(
+        hass, old_day, old_day + timedelta(days=1), {"test:rollups"}, "day", None
+    )
+    assert [(row["start"], row["sum"]) for row in stats["test:rollups"]] == [
+        (old_day.timestamp(), 2)
+    ]
+
+    # The rollups of the purged hours can't be aligned to another time zone
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    local_day = dt_util.as_local(old_day).replace(hour=0)
+    stats = statistics_during_period(
+        hass, local_day, local_day + timedelta(days=2), {"test:rollups"}, "day", None
+    )
+    assert [
+        (row["start"], row["end"], row["sum"]) for row in stats["test:rollups"]
+    ] == [(old_day.timestamp(), old_day.timestamp() + 86400, 2)]
+    assert instance.statistics_rollups_ready
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -1,5 +1,6 @@
 """Test recorder system health."""
 
+import re
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -35,6 +36,9 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "commits": ANY,
+        "commit_size": ANY,
+        "commit_time": ANY,
     }
 
 
@@ -64,6 +68,9 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "commits": ANY,
+        "commit_size": ANY,
+        "commit_time": ANY,
     }
 
 
@@ -99,6 +106,9 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "commits": ANY,
+        "commit_size": ANY,
+        "commit_time": ANY,
     }
 
 
@@ -127,4 +137,37 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "commits": ANY,
+        "commit_size": ANY,
+        "commit_time": ANY,
     }
+
+
+async def test_recorder_system_health_read_query_timings(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health includes the timings of read queries."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert "read_query_time" not in info
+    assert "read_query_queue_wait" not in info
+
+    await instance.async_add_read_executor_job(lambda: None)
+    info = await get_system_health_info(hass, "recorder")
+    assert re.fullmatch(r"\d+\.\d / \d+\.\d", info["read_query_time"])
+    assert re.fullmatch(r"\d+\.\d / \d+\.\d", info["read_query_queue_wait"])
+
+
+async def test_recorder_system_health_commit_stats(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health includes the sizes and times of commits."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["commits"] >= 1
+    assert re.fullmatch(r"\d+\.\d / \d+", info["commit_size"])
+    assert re.fullmatch(r"\d+\.\d / \d+\.\d", info["commit_time"])
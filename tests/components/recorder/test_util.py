@@ -128,6 +128,14 @@ def test_validate_or_move_away_sqlite_database(
     assert util.validate_or_move_away_sqlite_database(dburl) is True
 
 
+def test_sqlite_read_only_url() -> None:
+    """Test converting a SQLite url into a url which opens it read-only."""
+    url = util.sqlite_read_only_url(f"{SQLITE_URL_PREFIX}//config/my db.db")
+    assert url.render_as_string() == (
+        "sqlite:///file:/config/my%20db.db?mode=ro&uri=true"
+    )
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
@@ -17,12 +17,14 @@ from homeassistant.components.recorder import (
     DOMAIN as RECORDER_DOMAIN,
     Recorder,
     history,
+    statistics,
 )
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
     StatesMeta,
     StatisticsMeta,
+    StatisticsShortTerm,
 )
 from homeassistant.components.recorder.models import (
     StatisticData,
@@ -34,8 +36,16 @@ from homeassistant.components.recorder.statistics import (
     get_metadata,
     list_statistic_ids,
 )
+from homeassistant.components.recorder.statistics_accumulator import (
+    StatisticsAccumulators,
+)
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
@@ -2330,6 +2340,148 @@ async def test_compile_hourly_statistics_partially_unavailable(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize("recorder_config", [{"incremental_statistics": True}])
+async def test_compile_statistics_from_accumulators(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test statistics compiled from the accumulated states match the database."""
+    zero = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    freezer.move_to(zero)
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    energy_attributes = {
+        **ENERGY_SENSOR_ATTRIBUTES,
+        "last_reset": zero.isoformat(),
+    }
+    changes: list[tuple[timedelta, str, str, dict[str, Any]]] = [
+        (timedelta(seconds=30), "sensor.power", "10", POWER_SENSOR_ATTRIBUTES),
+        (timedelta(seconds=30), "sensor.energy", "100", energy_attributes),
+        (timedelta(minutes=5, seconds=10), "sensor.energy", "110", energy_attributes),
+        (
+            timedelta(minutes=5, seconds=20),
+            "sensor.power",
+            "20",
+            POWER_SENSOR_ATTRIBUTES,
+        ),
+        (
+            timedelta(minutes=5, seconds=100),
+            "sensor.power",
+            STATE_UNAVAILABLE,
+            POWER_SENSOR_ATTRIBUTES,
+        ),
+        (timedelta(minutes=5, seconds=100), "sensor.energy", "120", energy_attributes),
+        (
+            timedelta(minutes=5, seconds=200),
+            "sensor.power",
+            "15",
+            POWER_SENSOR_ATTRIBUTES,
+        ),
+        (
+            timedelta(minutes=15, seconds=30),
+            "sensor.energy",
+            "5",
+            {
+                **energy_attributes,
+                "last_reset": (zero + timedelta(minutes=15)).isoformat(),
+            },
+        ),
+        (
+            timedelta(minutes=15, seconds=60),
+            "sensor.power",
+            "30",
+            POWER_SENSOR_ATTRIBUTES,
+        ),
+        (
+            timedelta(minutes=15, seconds=90),
+            "sensor.power",
+            "30",
+            {**POWER_SENSOR_ATTRIBUTES, "friendly_name": "Power"},
+        ),
+    ]
+    for offset, entity_id, state, attributes in changes:
+        freezer.move_to(zero + offset)
+        hass.states.async_set(entity_id, state, attributes)
+        await async_wait_recording_done(hass)
+    freezer.move_to(zero + timedelta(hours=1, seconds=10))
+
+    accumulators = recorder_mock.statistics_accumulators
+    assert accumulators is not None
+
+    def _compile(start: datetime) -> list[dict[str, Any]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return recorder.compile_statistics(
+                hass, session, start, start + timedelta(minutes=5)
+            ).platform_stats
+
+    pop_aggregates = accumulators.pop_aggregates
+    served: list[set[str]] = []
+
+    def _pop_aggregates(*args: Any) -> dict[str, Any]:
+        aggregates = pop_aggregates(*args)
+        served.append(set(aggregates))
+        return aggregates
+
+    for minutes in (0, 5, 10, 15):
+        start = zero + timedelta(minutes=minutes)
+        with patch.object(accumulators, "pop_aggregates", _pop_aggregates):
+            accumulated = await recorder_mock.async_add_executor_job(_compile, start)
+        recorder_mock.statistics_accumulators = None
+        try:
+            from_db = await recorder_mock.async_add_executor_job(_compile, start)
+        finally:
+            recorder_mock.statistics_accumulators = accumulators
+        assert accumulated == [
+            {
+                "meta": stat["meta"],
+                "stat": {
+                    key: pytest.approx(value) if isinstance(value, float) else value
+                    for key, value in stat["stat"].items()
+                },
+            }
+            for stat in from_db
+        ]
+
+    # The first period after starting is compiled from the database
+    assert served == [set(), *[{"sensor.power", "sensor.energy"}] * 3]
+
+    # The hourly summary accumulated from the 5-minute statistics matches
+    # the summary queried from the database
+    for minutes in range(0, 60, 5):
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=minutes))
+    await async_wait_recording_done(hass)
+
+    def _hourly_summaries() -> tuple[dict[int, Any] | None, dict[int, Any]]:
+        hourly_accumulators = StatisticsAccumulators()
+        with session_scope(hass=hass, read_only=True) as session:
+            for minutes in range(0, 60, 5):
+                start = zero + timedelta(minutes=minutes)
+                hourly_accumulators.add_short_term_statistics(
+                    start.timestamp(),
+                    session.query(StatisticsShortTerm)
+                    .filter(StatisticsShortTerm.start_ts == start.timestamp())
+                    .all(),
+                )
+            return (
+                hourly_accumulators.pop_hourly_summary(zero.timestamp()),
+                statistics._query_hourly_statistics_summary(session, zero),
+            )
+
+    accumulated_hourly, from_db_hourly = await recorder_mock.async_add_executor_job(
+        _hourly_summaries
+    )
+    assert len(from_db_hourly) == 2
+    assert accumulated_hourly == {
+        metadata_id: {
+            key: pytest.approx(value) if isinstance(value, float) else value
+            for key, value in summary.items()
+        }
+        for metadata_id, summary in from_db_hourly.items()
+    }
+
+
 @pytest.mark.parametrize(
     ("device_class", "state_unit", "value"),
     [
@@ -5,7 +5,9 @@ from copy import deepcopy
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
+import zlib
 
+from aiohttp import WSMsgType
 import pytest
 import voluptuous as vol
 
@@ -17,9 +19,14 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.const import (
+    COMPRESSED_MESSAGE_MIN_SIZE,
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_COMPRESSED_MESSAGES,
+    URL,
+)
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
@@ -1310,6 +1317,57 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_share_one_listener(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscribe_entities subscriptions share one state_changed listener."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("switch.two", "off")
+    init_count = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    subscriptions: list[dict[str, Any]] = [
+        {"id": 7},
+        {"id": 8, "entity_ids": ["light.one"]},
+        {"id": 9, "include": {"domains": ["switch"]}},
+        {"id": 10, "include": {"domains": ["switch"]}},
+    ]
+    for subscription in subscriptions:
+        await websocket_client.send_json({**subscription, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == subscription["id"]
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == subscription["id"]
+        assert msg["type"] == "event"
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == init_count + 1
+
+    hass.states.async_set("light.one", "on")
+    received = [await websocket_client.receive_json() for _ in range(2)]
+    assert sorted(msg["id"] for msg in received) == [7, 8]
+    assert received[0]["event"] == received[1]["event"]
+    assert received[0]["event"]["c"]["light.one"]["+"]["s"] == "on"
+
+    hass.states.async_set("switch.two", "on")
+    received = [await websocket_client.receive_json() for _ in range(3)]
+    assert sorted(msg["id"] for msg in received) == [7, 9, 10]
+
+    for subscription in subscriptions:
+        await websocket_client.send_json(
+            {
+                "id": subscription["id"] + 10,
+                "type": "unsubscribe_events",
+                "subscription": subscription["id"],
+            }
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == subscription["id"] + 10
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == init_count
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2566,6 +2624,59 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_template_render_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the render statistics of templates."""
+    hass.states.async_set("light.test", "on")
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "render_template",
+            "template": "State is: {{ states('light.test') }}",
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["result"] == "State is: on"
+
+    hass.states.async_set("light.test", "on", force_update=True)
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "template/render_stats", "limit": 1}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "template": "State is: {{ states('light.test') }}",
+            "renders": 2,
+            "cached": 1,
+            "total_time": ANY,
+            "max_time": ANY,
+        }
+    ]
+
+
+async def test_template_render_stats_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test the render statistics of templates require an admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 5, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2730,6 +2841,39 @@ async def test_message_coalescing(
     await hass.async_block_till_done()
 
 
+async def test_message_compression(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test enabling compression of large messages."""
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COMPRESSED_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    # Small messages are sent as text
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["result"] == []
+
+    for idx in range(200):
+        hass.states.async_set(f"sensor.test_{idx}", "on", {"value": "x" * 100})
+    await websocket_client.send_json({"id": 6, "type": "get_states"})
+    message = await websocket_client.receive()
+    assert message.type is WSMsgType.BINARY
+    assert len(message.data) < COMPRESSED_MESSAGE_MIN_SIZE
+    msg = json_loads(zlib.decompress(message.data))
+    assert msg["id"] == 6
+    assert len(msg["result"]) == 200
+
+
 async def test_message_coalescing_not_supported_by_websocket_client(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -0,0 +1,49 @@
+"""Test the shared fan-out of state changes to subscribe_entities."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.components.websocket_api.entity_subscriptions import (
+    async_get_entity_subscriptions,
+)
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockUser
+
+
+async def test_failing_subscription_does_not_stop_others(
+    hass: HomeAssistant,
+    hass_admin_user: MockUser,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an error sending to one subscription is logged and skipped."""
+    entity_subscriptions = async_get_entity_subscriptions(hass)
+    failing_send = Mock(side_effect=RuntimeError("connection closed"))
+    send = Mock()
+    unsubs = [
+        entity_subscriptions.async_subscribe(
+            failing_send, b"1", hass_admin_user, {"light.kitchen"}, None, None
+        ),
+        entity_subscriptions.async_subscribe(
+            send, b"2", hass_admin_user, {"light.kitchen"}, None, None
+        ),
+        entity_subscriptions.async_subscribe(
+            send, b"3", hass_admin_user, None, None, None
+        ),
+    ]
+
+    hass.states.async_set("light.kitchen", "on")
+    await hass.async_block_till_done()
+
+    failing_send.assert_called_once()
+    assert send.call_count == 2
+    assert send.call_args_list[0].args[0].endswith(b'"id":2}')
+    assert send.call_args_list[1].args[0].endswith(b'"id":3}')
+    assert (
+        "Error sending the state change of light.kitchen to a subscription"
+        in caplog.text
+    )
+
+    for unsub in unsubs:
+        unsub()
@@ -1,6 +1,7 @@
 """Test config validators."""
 
 from collections import OrderedDict
+from collections.abc import Callable
 from datetime import date, datetime, timedelta
 import enum
 from functools import partial
@@ -543,6 +544,49 @@ def test_entity_service_schema() -> None:
         assert "metadata" not in validated
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "Light.Kitchen, light.hall"},
+        {"entity_id": ["light.kitchen", "LIGHT.HALL"]},
+        {"entity_id": "ALL"},
+        {"entity_id": None},
+        {"entity_id": []},
+        {"entity_id": "invalid"},
+        {"entity_id": ["light.kitchen", 5]},
+        {"entity_id": "{{ 'light.kitchen' }}"},
+        {"entity_id": ["light.kitchen", "{{ 'light.hall' }}"]},
+        {"area_id": "kitchen"},
+        {"area_id": ["kitchen", "none"]},
+        {"area_id": "none"},
+        {"area_id": None},
+        {"device_id": 5},
+        {"device_id": [5]},
+        {"device_id": "{{ 'device' }}"},
+        {"floor_id": ["first", "{{ 'second' }}"]},
+        {"label_id": []},
+    ],
+)
+async def test_entity_service_schema_compiled_fields(
+    hass: HomeAssistant, value: dict[str, Any]
+) -> None:
+    """Test the compiled entity service fields validate like the fields."""
+    schema = cv.make_entity_service_schema({})
+    uncompiled_schema = vol.All(
+        vol.Schema(cv.ENTITY_SERVICE_FIELDS),
+        cv.has_at_least_one_key(*cv.ENTITY_SERVICE_FIELDS),
+    )
+
+    def validate(schema: Callable[[Any], Any]) -> Any:
+        try:
+            return schema(value)
+        except vol.Invalid as err:
+            return str(err)
+
+    assert validate(schema) == validate(uncompiled_schema)
+
+
 def test_entity_service_schema_with_metadata() -> None:
     """Test make_entity_service_schema with overridden metadata key."""
     schema = cv.make_entity_service_schema({vol.Required("metadata"): cv.positive_int})
@@ -50,7 +50,11 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    Template,
+    async_get_render_stats,
+    result_as_boolean,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -3183,6 +3187,49 @@ async def test_async_track_template_result_multiple_templates(
     ]
 
 
+async def test_async_track_template_result_skips_unchanged_inputs(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates are not re-rendered when the states they read are unchanged."""
+    template_state = Template("{{ states('sensor.test') }}", hass)
+    template_updated = Template("{{ states.sensor.test.last_updated }}", hass)
+    hass.states.async_set("sensor.test", "on")
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        refresh_runs.append(updates)
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_state, None), TrackTemplate(template_updated, None)],
+        refresh_listener,
+    )
+    info.async_refresh()
+    render_stats = async_get_render_stats(hass)
+    assert render_stats[template_state.template].renders == 2
+    assert render_stats[template_state.template].cached == 0
+
+    hass.states.async_set("sensor.test", "on", force_update=True)
+    await hass.async_block_till_done()
+
+    assert len(refresh_runs) == 2
+    assert [update.template for update in refresh_runs[1]] == [template_updated]
+    assert render_stats[template_state.template].renders == 2
+    assert render_stats[template_state.template].cached == 1
+    assert render_stats[template_updated.template].renders == 3
+
+    hass.states.async_set("sensor.test", "off")
+    await hass.async_block_till_done()
+
+    assert len(refresh_runs) == 3
+    assert render_stats[template_state.template].renders == 3
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(
     hass: HomeAssistant,
 ) -> None:
@@ -10,7 +10,7 @@ import math
 import random
 from types import MappingProxyType
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
 import orjson
@@ -4912,6 +4912,57 @@ async def test_async_render_to_info_in_conditional(hass: HomeAssistant) -> None:
     assert_result_info(info, "oink", ["sensor.xyz", "sensor.pig"], [])
 
 
+async def test_async_render_to_info_is_current(hass: HomeAssistant) -> None:
+    """Test RenderInfo tracks the versions of the states it read."""
+    hass.states.async_set("sensor.xyz", "dog", {"size": "big"})
+
+    info = template.Template("{{ states('sensor.xyz') }}", hass).async_render_to_info()
+    assert not info.has_state_metadata
+    assert info.async_is_current()
+
+    # A write with the same state and attributes does not change the inputs
+    hass.states.async_set("sensor.xyz", "dog", {"size": "big"}, force_update=True)
+    assert info.async_is_current()
+
+    hass.states.async_set("sensor.xyz", "dog", {"size": "small"})
+    assert not info.async_is_current()
+
+    info = template.Template(
+        "{{ states.sensor.xyz.last_updated }}", hass
+    ).async_render_to_info()
+    assert info.has_state_metadata
+    assert info.async_is_current()
+    hass.states.async_set("sensor.xyz", "dog", {"size": "small"}, force_update=True)
+    assert not info.async_is_current()
+
+    info = template.Template("{{ states.sensor | count }}", hass).async_render_to_info()
+    assert not info.async_is_current()
+
+    info = template.Template("{{ now() }}", hass).async_render_to_info()
+    assert not info.async_is_current()
+
+    render_stats = template.async_get_render_stats(hass)
+    assert render_stats["{{ states('sensor.xyz') }}"].renders == 1
+    assert render_stats["{{ now() }}"].as_dict() == {
+        "renders": 1,
+        "cached": 0,
+        "total_time": ANY,
+        "max_time": ANY,
+    }
+
+
+async def test_render_stats_bounded(hass: HomeAssistant) -> None:
+    """Test only the render statistics of the recent templates are kept."""
+    with patch.object(template, "MAX_RENDER_STATS", 2):
+        for value in ("first", "second", "first", "third"):
+            template.Template(f"{{{{ '{value}' }}}}", hass).async_render_to_info()
+
+    assert {
+        template_str: stats.renders
+        for template_str, stats in template.async_get_render_stats(hass).items()
+    } == {"{{ 'first' }}": 2, "{{ 'third' }}": 1}
+
+
 def test_jinja_namespace(hass: HomeAssistant) -> None:
     """Test Jinja's namespace command can be used."""
     test_template = template.Template(
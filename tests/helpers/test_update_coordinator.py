@@ -11,8 +11,8 @@ import pytest
 import requests
 
 from homeassistant import config_entries
-from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, HomeAssistant, StateMachine, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -21,7 +21,12 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import (
+    MockConfigEntry,
+    MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -492,6 +497,101 @@ async def test_async_set_updated_data(
     remove_callbacks()
 
 
+class _CoordinatedEntity(update_coordinator.CoordinatorEntity):
+    """Coordinator entity which writes the data of the coordinator as state."""
+
+    def __init__(
+        self, coordinator: update_coordinator.DataUpdateCoordinator[int], name: str
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_id = f"sensor.{name}"
+
+    @property
+    def state(self) -> str:
+        """Return the state."""
+        if self.entity_id == "sensor.invalid":
+            return "x" * 300
+        return str(self.coordinator.data)
+
+
+async def test_async_update_listeners_batches_entity_state_writes(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states of the coordinator entities are set together."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities(
+        [
+            _CoordinatedEntity(crd, "one"),
+            _CoordinatedEntity(crd, "invalid"),
+            _CoordinatedEntity(crd, "two"),
+        ]
+    )
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    def update_callback() -> None:
+        # Other writes are not deferred
+        hass.states.async_set("sensor.other", str(crd.data))
+        assert hass.states.get("sensor.other").state == str(crd.data)
+        # The states of the entities are set when all listeners are updated
+        assert hass.states.get("sensor.one").state == "None"
+
+    remove_callback = crd.async_add_listener(update_callback)
+    crd.async_set_updated_data(100)
+
+    assert hass.states.get("sensor.one").state == "100"
+    assert hass.states.get("sensor.two").state == "100"
+    assert hass.states.get("sensor.invalid").state == "unknown"
+    await hass.async_block_till_done()
+    events_by_entity_id = {event.data["entity_id"]: event for event in events}
+    assert events_by_entity_id.keys() == {"sensor.one", "sensor.two", "sensor.other"}
+    one, two = events_by_entity_id["sensor.one"], events_by_entity_id["sensor.two"]
+    assert one.context is two.context
+    assert one.time_fired_timestamp == two.time_fired_timestamp
+    assert events_by_entity_id["sensor.other"].context is not one.context
+
+    remove_callback()
+    await platform.async_reset()
+
+
+async def test_async_update_listeners_listener_exception(
+    hass: HomeAssistant,
+    crd: update_coordinator.DataUpdateCoordinator[int],
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the exception of a listener propagates and earlier states are set."""
+    platform = MockEntityPlatform(hass)
+    await platform.async_add_entities([_CoordinatedEntity(crd, "one")])
+    remove_callback = crd.async_add_listener(Mock(side_effect=ValueError("boom")))
+
+    with (
+        patch.object(
+            StateMachine,
+            "async_set_many",
+            autospec=True,
+            side_effect=StateMachine.async_set_many,
+        ) as mock_set_many,
+        pytest.raises(ValueError, match="boom"),
+    ):
+        crd.async_set_updated_data(100)
+
+    mock_set_many.assert_called_once()
+    assert hass.states.get("sensor.one").state == "100"
+    assert crd._state_updates is None
+
+    # An error setting the states does not hide the exception of the listener
+    with (
+        patch.object(StateMachine, "async_set_many", side_effect=RuntimeError),
+        pytest.raises(ValueError, match="boom"),
+    ):
+        crd.async_set_updated_data(200)
+    assert "Error setting the states of the listeners of" in caplog.text
+
+    remove_callback()
+    await platform.async_reset()
+
+
 async def test_stop_refresh_on_ha_stop(
     hass: HomeAssistant, crd: update_coordinator.DataUpdateCoordinator[int]
 ) -> None:
@@ -10,6 +10,7 @@ import sys
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import bootstrap, loader, runner
@@ -19,8 +20,15 @@ from homeassistant.const import (
     BASE_PLATFORMS,
     CONF_DEBUG,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
+    __version__,
+)
+from homeassistant.core import (
+    CoreState,
+    HomeAssistant,
+    ReleaseChannel,
+    async_get_hass,
+    callback,
 )
-from homeassistant.core import CoreState, HomeAssistant, async_get_hass, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.translation import async_translations_loaded
@@ -31,6 +39,7 @@ from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -1528,3 +1537,144 @@ def test_should_rollover_is_always_false() -> None:
         ).shouldRollover(Mock())
         is False
     )
+
+
+async def test_startup_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the integrations resolved at startup are stored and reused."""
+    caplog.set_level(logging.DEBUG)
+    with patch(
+        "homeassistant.core.get_release_channel", return_value=ReleaseChannel.STABLE
+    ):
+        assert await bootstrap.async_from_config_dict({"group": {}}, hass)
+        freezer.tick(bootstrap.STARTUP_SNAPSHOT_SAVE_DELAY)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        data = hass_storage[bootstrap.STARTUP_SNAPSHOT_STORAGE_KEY]["data"]
+        assert data["key"]["version"] == __version__
+        assert "group" in data["bootstrap"]["domains"]
+        assert data["bootstrap"]["stage_1"] == []
+        assert "group" in data["integrations"]
+
+        # Resolve the domains again like the next start would
+        hass.data[loader.DATA_INTEGRATIONS].clear()
+        await bootstrap._async_load_startup_snapshot(hass)
+        with patch.object(
+            loader, "_resolve_integrations_from_root", side_effect=AssertionError
+        ):
+            (
+                domains_to_setup,
+                integrations,
+            ) = await bootstrap._async_resolve_domains_to_setup(hass, {"group": {}})
+
+    assert sorted(domains_to_setup) == data["bootstrap"]["domains"]
+    assert sorted(integrations) == data["bootstrap"]["manifests"]
+    assert integrations["group"].all_dependencies_resolved
+    assert "(from startup snapshot: True)" in caplog.text
+
+
+async def test_startup_snapshot_new_platform(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the snapshot is not used when a platform integration is added."""
+    caplog.set_level(logging.DEBUG)
+    with patch(
+        "homeassistant.core.get_release_channel", return_value=ReleaseChannel.STABLE
+    ):
+        await bootstrap._async_load_startup_snapshot(hass)
+        snapshot = hass.data[bootstrap.DATA_STARTUP_SNAPSHOT]
+        await bootstrap._async_resolve_domains_to_setup(
+            hass, {"sensor": [{"platform": "template"}]}
+        )
+        assert snapshot.resolved["platforms"] == ["template"]
+        snapshot.previous = snapshot.resolved
+        caplog.clear()
+
+        (
+            domains_to_setup,
+            integrations,
+        ) = await bootstrap._async_resolve_domains_to_setup(
+            hass,
+            {"sensor": [{"platform": "template"}, {"platform": "min_max"}]},
+        )
+
+    assert "min_max" not in snapshot.previous["manifests"]
+    assert "min_max" in integrations
+    assert "min_max" not in domains_to_setup
+    assert "(from startup snapshot: False)" in caplog.text
+
+
+async def test_startup_snapshot_outdated(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the snapshot of another version is not used."""
+    hass_storage[bootstrap.STARTUP_SNAPSHOT_STORAGE_KEY] = {
+        "version": bootstrap.STARTUP_SNAPSHOT_STORAGE_VERSION,
+        "key": bootstrap.STARTUP_SNAPSHOT_STORAGE_KEY,
+        "data": {
+            "key": {"version": "2000.1.0", "custom_components": {}},
+            "integrations": {"group": {}},
+            "bootstrap": None,
+        },
+    }
+    with patch(
+        "homeassistant.core.get_release_channel", return_value=ReleaseChannel.STABLE
+    ):
+        await bootstrap._async_load_startup_snapshot(hass)
+
+    assert loader.DATA_INTEGRATION_SNAPSHOT not in hass.data
+    assert hass.data[bootstrap.DATA_STARTUP_SNAPSHOT].previous is None
+
+
+async def test_prefetch_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are imported ahead of setup with the leaves first."""
+    imported: list[str] = []
+
+    def _mock_integration(
+        domain: str, all_dependencies: set[str], platforms: list[str]
+    ) -> Mock:
+        """Return a mock integration recording its imports."""
+
+        async def _async_get_component(log_import_errors: bool) -> None:
+            # The setup logs the import errors, not the prefetch
+            assert not log_import_errors
+            imported.append(domain)
+
+        async def _async_get_platforms(
+            platform_names: list[str], log_import_errors: bool
+        ) -> None:
+            assert not log_import_errors
+            imported.extend(f"{domain}.{platform}" for platform in platform_names)
+
+        return Mock(
+            import_executor=True,
+            all_dependencies=all_dependencies,
+            async_get_component=_async_get_component,
+            async_get_platforms=_async_get_platforms,
+            platforms_exists=Mock(return_value=platforms),
+        )
+
+    integrations = {
+        "app": _mock_integration("app", {"middle", "leaf"}, ["sensor"]),
+        "middle": _mock_integration("middle", {"leaf"}, []),
+        "leaf": _mock_integration("leaf", set(), ["light", "switch"]),
+        "in_loop": Mock(import_executor=False),
+    }
+    with patch.object(bootstrap, "PREFETCH_CONCURRENCY", 1):
+        await bootstrap._async_prefetch_integrations(
+            hass, {*integrations, "not_found"}, integrations
+        )
+
+    assert imported == [
+        "leaf",
+        "leaf.light",
+        "leaf.switch",
+        "middle",
+        "app",
+        "app.sensor",
+    ]
@@ -610,6 +610,29 @@ async def test_async_hass_config_yaml_merge(
     assert len(conf["light"]) == 1
 
 
+async def test_async_hass_config_yaml_cache(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test the parsed configuration files are cached between runs."""
+    hass.config.config_dir = str(tmp_path)
+    await hass.async_add_executor_job(
+        (tmp_path / config_util.YAML_CONFIG_FILE).write_text,
+        "input_boolean:\n  ib1:\n",
+    )
+    config_util.async_enable_yaml_cache(hass)
+
+    conf = await config_util.async_hass_config_yaml(hass)
+    assert conf == {"input_boolean": {"ib1": None}}
+    assert await hass.async_add_executor_job(
+        (tmp_path / ".storage" / config_util.YAML_CACHE_FILE).exists
+    )
+
+    config_util.async_enable_yaml_cache(hass)
+    with patch("homeassistant.util.yaml.cache._parse_raw") as mock_parse:
+        assert await config_util.async_hass_config_yaml(hass) == conf
+    assert not mock_parse.called
+
+
 @pytest.fixture
 def merge_log_err() -> Generator[MagicMock]:
     """Patch _merge_log_error from packages."""
@@ -1789,3 +1812,91 @@ async def test_loading_platforms_gathers(hass: HomeAssistant) -> None:
         ("platform_int", "sensor"),
         ("platform_int2", "sensor"),
     ]
+
+
+async def test_process_component_config_validates_changed_platforms(
+    hass: HomeAssistant,
+) -> None:
+    """Test only the changed platform configs are validated again."""
+    component_schema = Mock(wraps=cv.PLATFORM_SCHEMA_BASE)
+    platform_schema = Mock(wraps=cv.PLATFORM_SCHEMA.extend({"name": str}))
+    mock_integration(
+        hass, MockModule("platform_conf", platform_schema_base=component_schema)
+    )
+    mock_integration(hass, MockModule("whatever"))
+    mock_platform(
+        hass,
+        "whatever.platform_conf",
+        MockPlatform(platform_schema=platform_schema),
+    )
+    integration = await async_get_integration(hass, "platform_conf")
+
+    config = {
+        "platform_conf": [
+            {"platform": "whatever", "name": "first"},
+            {"platform": "whatever", "name": "second"},
+        ],
+    }
+    info = await config_util.async_process_component_config(hass, config, integration)
+    assert info.exception_info_list == []
+    assert info.config == config
+    assert component_schema.call_count == 2
+    assert platform_schema.call_count == 2
+
+    component_schema.reset_mock()
+    platform_schema.reset_mock()
+    config = {
+        "platform_conf": [{"platform": "whatever", "name": "first"}],
+        "platform_conf 2": [
+            {"platform": "whatever", "name": "changed"},
+            {"platform": "whatever", "name": 1},
+        ],
+    }
+    info = await config_util.async_process_component_config(hass, config, integration)
+    assert info.config == {
+        "platform_conf": [
+            {"platform": "whatever", "name": "first"},
+            {"platform": "whatever", "name": "changed"},
+        ]
+    }
+    assert len(info.exception_info_list) == 1
+    assert component_schema.call_count == 2
+    assert platform_schema.call_count == 2
+    assert platform_schema.call_args_list[0][0][0]["name"] == "changed"
+
+
+async def test_process_component_config_copies_reused_platform_configs(
+    hass: HomeAssistant,
+) -> None:
+    """Test reused platform configs do not share nested values."""
+    platform_schema = cv.PLATFORM_SCHEMA.extend(
+        {"sensors": [{"name": str, "options": [str]}]}
+    )
+    mock_integration(
+        hass,
+        MockModule("platform_conf", platform_schema_base=cv.PLATFORM_SCHEMA_BASE),
+    )
+    mock_integration(hass, MockModule("whatever"))
+    mock_platform(
+        hass,
+        "whatever.platform_conf",
+        MockPlatform(platform_schema=platform_schema),
+    )
+    integration = await async_get_integration(hass, "platform_conf")
+    config = {
+        "platform_conf": {
+            "platform": "whatever",
+            "sensors": [{"name": "first", "options": ["a"]}],
+        },
+    }
+
+    first = await config_util.async_process_component_config(hass, config, integration)
+    # A platform mutating its config must not change the next reload
+    sensor = first.config["platform_conf"][0]["sensors"][0]
+    sensor["name"] = "mutated"
+    sensor["options"].append("b")
+
+    second = await config_util.async_process_component_config(hass, config, integration)
+    assert second.config["platform_conf"] == [
+        {"platform": "whatever", "sensors": [{"name": "first", "options": ["a"]}]}
+    ]
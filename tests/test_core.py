@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections.abc import Callable
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -1165,6 +1166,126 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can filter events on indexed event data keys."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return not event_data.get("filtered")
+
+    listeners = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen(
+        "test",
+        listener,
+        event_filter=mock_filter,
+        event_keys={"device_id": ("abc", "def"), "type": ("press",)},
+    )
+    assert hass.bus.async_listeners()["test"] == listeners + 1
+
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "def", "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "release"})
+    hass.bus.async_fire("test", {"device_id": "xyz", "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": ["xyz", "abc"], "type": "press"})
+    hass.bus.async_fire("test", {"device_id": ["abc", "def"], "type": "press"})
+    hass.bus.async_fire("test", {"device_id": {"abc": 1}, "type": "press"})
+    hass.bus.async_fire("test", {"device_id": "abc", "type": ["press"]})
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "press", "filtered": 1})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [call.data for call in calls] == [
+        {"device_id": "abc", "type": "press"},
+        {"device_id": "def", "type": "press"},
+        {"device_id": ["xyz", "abc"], "type": "press"},
+        {"device_id": ["abc", "def"], "type": "press"},
+        {"device_id": "abc", "type": ["press"]},
+    ]
+
+    unsub()
+    assert hass.bus.async_listeners().get("test", 0) == listeners
+    hass.bus.async_fire("test", {"device_id": "abc", "type": "press"})
+    await hass.async_block_till_done()
+    assert len(calls) == 5
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test event keys are applied when listening to all events."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen(
+        MATCH_ALL, listener, event_keys={"device_id": ("abc",)}
+    )
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test2", {"device_id": "def"})
+    await hass.async_block_till_done()
+    assert [call.event_type for call in calls] == ["test"]
+
+    unsub()
+
+
+async def test_eventbus_keyed_listener_order(hass: HomeAssistant) -> None:
+    """Test keyed listeners run after the other listeners of the event type."""
+    calls = []
+
+    def _listener(name: str) -> Callable[[ha.Event], None]:
+        @ha.callback
+        def listener(event: ha.Event) -> None:
+            """Mock listener."""
+            calls.append(name)
+
+        return listener
+
+    hass.bus.async_listen(MATCH_ALL, _listener("match_all"))
+    hass.bus.async_listen("test", _listener("keyed"), event_keys={"id": ("abc",)})
+    hass.bus.async_listen("test", _listener("first"))
+    hass.bus.async_listen("test", _listener("second"))
+
+    hass.bus.async_fire("test", {"id": "abc"})
+    await hass.async_block_till_done()
+    assert calls == ["first", "second", "keyed", "match_all"]
+
+
+async def test_eventbus_dispatch_stats(hass: HomeAssistant) -> None:
+    """Test the dispatch cost counters of the event bus."""
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+
+    @ha.callback
+    def mock_filter(event_data):
+        """Mock filter."""
+        return event_data["match"]
+
+    hass.bus.async_listen("test", listener, event_filter=mock_filter)
+    hass.bus.async_listen("test", listener, event_keys={"device_id": ("abc",)})
+
+    hass.bus.async_fire("test", {"match": True, "device_id": "abc"})
+    hass.bus.async_fire("test", {"match": False, "device_id": "def"})
+    await hass.async_block_till_done()
+
+    assert hass.bus.async_dispatch_stats()["test"] == {
+        "fired": 2,
+        "evaluated": 3,
+        "dispatched": 2,
+    }
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1540,6 +1661,50 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states at once."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    own_context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateUpdate("light.bowl", "off"),
+            ha.StateUpdate("Light.Kitchen", "on", {"brightness": 100}),
+            ha.StateUpdate("light.porch", "on", context=own_context),
+        ],
+        timestamp=1234.0,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.kitchen",
+        "light.porch",
+    ]
+    assert events[0].context is events[1].context
+    assert events[2].context is own_context
+    assert {event.time_fired_timestamp for event in events} == {1234.0}
+    assert hass.states.get("light.bowl").state == "off"
+    assert hass.states.get("light.kitchen").attributes == {"brightness": 100}
+    assert hass.states.get("light.porch").last_updated_timestamp == 1234.0
+
+
+async def test_statemachine_set_many_invalid_state(hass: HomeAssistant) -> None:
+    """Test setting multiple states stops at an invalid state."""
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [
+                ha.StateUpdate("light.bowl", "on"),
+                ha.StateUpdate("light.invalid", "x" * 300),
+                ha.StateUpdate("light.kitchen", "on"),
+            ]
+        )
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("light.kitchen") is None
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
@@ -1560,6 +1725,55 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test equal attributes of different entities share one ReadOnlyDict."""
+    attrs = {"unit_of_measurement": "°C", "device_class": "temperature"}
+
+    hass.states.async_set("sensor.one", "1", attrs)
+    hass.states.async_set("sensor.two", "2", dict(attrs))
+    attrs["unit_of_measurement"] = "°F"
+    hass.states.async_set("sensor.three", "3", attrs)
+
+    one = hass.states.get("sensor.one")
+    assert one.attributes == {
+        "unit_of_measurement": "°C",
+        "device_class": "temperature",
+    }
+    assert hass.states.get("sensor.two").attributes is one.attributes
+    assert hass.states.get("sensor.three").attributes is not one.attributes
+
+    # Attributes in a different order are not shared
+    hass.states.async_set(
+        "sensor.reversed", "4", dict(reversed(list(one.attributes.items())))
+    )
+    reversed_attributes = hass.states.get("sensor.reversed").attributes
+    assert reversed_attributes is not one.attributes
+    assert list(reversed_attributes) == ["device_class", "unit_of_measurement"]
+
+    # Equal values of a different type are not shared
+    hass.states.async_set("sensor.int", "1", {"value": 1})
+    hass.states.async_set("sensor.bool", "1", {"value": True})
+    assert hass.states.get("sensor.bool").attributes["value"] is True
+
+    # Containers are not shared
+    hass.states.async_set("sensor.list_one", "1", {"value": [1]})
+    hass.states.async_set("sensor.list_two", "1", {"value": [1]})
+    hass.states.async_set("sensor.tuple_one", "1", {"value": (1, 2)})
+    hass.states.async_set("sensor.tuple_two", "1", {"value": (1, 2)})
+    assert (
+        hass.states.get("sensor.list_one").attributes
+        is not hass.states.get("sensor.list_two").attributes
+    )
+    assert (
+        hass.states.get("sensor.tuple_one").attributes
+        is not hass.states.get("sensor.tuple_two").attributes
+    )
+
+    # Passing on the attributes of a state takes the identity check
+    hass.states.async_set("sensor.one", "1", one.attributes)
+    assert hass.states.get("sensor.one") is one
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
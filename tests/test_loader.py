@@ -235,6 +235,40 @@ async def test_get_integration(hass: HomeAssistant) -> None:
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_snapshot(hass: HomeAssistant) -> None:
+    """Test integrations in the snapshot are not resolved from their manifest."""
+    integration = await loader.async_get_integration(hass, "hue")
+    assert await integration.resolve_dependencies()
+    snapshot = json_loads(json_dumps(loader.async_get_integration_snapshot(hass)))
+    assert set(snapshot) == {"hue", *integration.all_dependencies}
+
+    hass.data[loader.DATA_INTEGRATIONS].clear()
+    loader.async_set_integration_snapshot(hass, snapshot)
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        restored = await loader.async_get_integration(hass, "hue")
+
+    assert restored is not integration
+    assert restored.manifest == integration.manifest
+    assert restored.file_path == integration.file_path
+    assert restored.has_translations == integration.has_translations
+    assert restored.all_dependencies_resolved
+    assert restored.all_dependencies == integration.all_dependencies
+    assert hue == await restored.async_get_component()
+
+
+async def test_import_timings(hass: HomeAssistant) -> None:
+    """Test the time taken by the import of components and platforms is recorded."""
+    integration = await loader.async_get_integration(hass, "hue")
+    await integration.async_get_component()
+    await integration.async_get_platform("light")
+
+    timings = loader.async_get_import_timings(hass)
+    assert timings["homeassistant.components.hue"] >= 0
+    assert timings["homeassistant.components.hue.light"] >= 0
+
+
 async def test_async_get_component(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     with pytest.raises(loader.IntegrationNotLoaded):
@@ -1626,6 +1660,72 @@ async def test_async_get_component_raises_after_import_failure(
     assert "loaded_executor=False" not in caplog.text
 
 
+@pytest.mark.parametrize("log_import_errors", [True, False])
+async def test_async_get_component_and_platforms_log_import_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, log_import_errors: bool
+) -> None:
+    """Verify unexpected import exceptions are only logged if requested."""
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        raise ValueError(f"Broken {module}")
+
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        with pytest.raises(ImportError):
+            await executor_import_integration.async_get_component(
+                log_import_errors=log_import_errors
+            )
+        with pytest.raises(ImportError):
+            await executor_import_integration.async_get_platforms(
+                ["config_flow"], log_import_errors=log_import_errors
+            )
+
+    assert (
+        "Unexpected exception importing component" in caplog.text
+    ) is log_import_errors
+    assert (
+        "Unexpected exception importing platform" in caplog.text
+    ) is log_import_errors
+
+
+async def test_joining_unlogged_import_logs_import_errors(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Verify a caller joining an import which does not log logs the errors."""
+    executor_import_integration = _get_test_integration(
+        hass, "executor_import", True, import_executor=True
+    )
+
+    def mock_import(module: str, *args: Any, **kwargs: Any) -> Any:
+        raise ValueError(f"Broken {module}")
+
+    with patch("homeassistant.loader.importlib.import_module", mock_import):
+        unlogged_component = hass.async_create_task(
+            executor_import_integration.async_get_component(log_import_errors=False)
+        )
+        unlogged_platforms = hass.async_create_task(
+            executor_import_integration.async_get_platforms(
+                ["config_flow"], log_import_errors=False
+            )
+        )
+        assert executor_import_integration._component_future is not None
+        assert "config_flow" in executor_import_integration._import_futures
+        with pytest.raises(ImportError):
+            await executor_import_integration.async_get_component()
+        with pytest.raises(ImportError):
+            await executor_import_integration.async_get_platforms(["config_flow"])
+        with pytest.raises(ImportError):
+            await unlogged_component
+        with pytest.raises(ImportError):
+            await unlogged_platforms
+
+    assert "Unexpected exception importing component" in caplog.text
+    assert "Unexpected exception importing platform" in caplog.text
+    assert not executor_import_integration._unlogged_import_futures
+
+
 async def test_async_get_platform_deadlock_fallback(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
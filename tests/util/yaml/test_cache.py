@@ -0,0 +1,208 @@
+"""Test the cache of parsed YAML files."""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import yaml as yaml_util
+from homeassistant.util.yaml import cache as yaml_cache
+from homeassistant.util.yaml.cache import YamlCache
+
+CONFIGURATION_YAML = """
+homeassistant:
+  name: !secret name
+  unit_system: !env_var UNIT_SYSTEM metric
+sensor: !include sensors.yaml
+automation: !include_dir_merge_list automations
+anchors:
+  base: &base
+    value: 1.5
+  derived:
+    <<: *base
+    enabled: true
+"""
+
+SENSORS_YAML = """
+- platform: template
+  name: First
+"""
+
+
+def _with_annotations(obj: Any) -> Any:
+    """Return the parsed YAML with the file and line annotations."""
+    if isinstance(obj, dict):
+        return (
+            getattr(obj, "__config_file__", None),
+            getattr(obj, "__line__", None),
+            {key: _with_annotations(value) for key, value in obj.items()},
+        )
+    if isinstance(obj, list):
+        return (
+            getattr(obj, "__config_file__", None),
+            getattr(obj, "__line__", None),
+            [_with_annotations(item) for item in obj],
+        )
+    return (
+        getattr(obj, "__config_file__", None),
+        getattr(obj, "__line__", None),
+        obj,
+    )
+
+
+@pytest.fixture
+def config_dir(tmp_path: Path) -> Path:
+    """Create a configuration with included files and secrets."""
+    (tmp_path / "configuration.yaml").write_text(CONFIGURATION_YAML)
+    (tmp_path / "sensors.yaml").write_text(SENSORS_YAML)
+    (tmp_path / "secrets.yaml").write_text("name: Home\n")
+    (tmp_path / "automations").mkdir()
+    (tmp_path / "automations" / "lights.yaml").write_text("- alias: Lights\n")
+    return tmp_path
+
+
+def _load(config_dir: Path, cache: YamlCache | None) -> Any:
+    """Load the configuration."""
+    return yaml_util.load_yaml(
+        config_dir / "configuration.yaml", yaml_util.Secrets(config_dir), cache
+    )
+
+
+def test_cache(config_dir: Path) -> None:
+    """Test only files with a changed content are parsed again."""
+    cache_path = config_dir / ".storage" / "core.yaml_cache"
+    cache = YamlCache(str(cache_path))
+
+    with patch.object(
+        yaml_cache, "_parse_raw", wraps=yaml_cache._parse_raw
+    ) as mock_parse:
+        loaded = _load(config_dir, cache)
+    assert mock_parse.call_count == 3
+    assert _with_annotations(loaded) == _with_annotations(_load(config_dir, None))
+    assert loaded["homeassistant"] == {"name": "Home", "unit_system": "metric"}
+    assert loaded["anchors"]["derived"] == {"value": 1.5, "enabled": True}
+    cache.save()
+    assert cache_path.exists()
+
+    (config_dir / "sensors.yaml").write_text(f"{SENSORS_YAML}- platform: time\n")
+    (config_dir / "secrets.yaml").write_text("name: Away\n")
+    cache = YamlCache(str(cache_path))
+    with (
+        patch.dict("os.environ", {"UNIT_SYSTEM": "us_customary"}),
+        patch.object(
+            yaml_cache, "_parse_raw", wraps=yaml_cache._parse_raw
+        ) as mock_parse,
+    ):
+        loaded = _load(config_dir, cache)
+        expected = _load(config_dir, None)
+
+    # Only the changed file was parsed, the tags are resolved again
+    assert mock_parse.call_count == 1
+    assert mock_parse.call_args[0][1] == str(config_dir / "sensors.yaml")
+    assert _with_annotations(loaded) == _with_annotations(expected)
+    assert loaded["homeassistant"] == {"name": "Away", "unit_system": "us_customary"}
+    assert len(loaded["sensor"]) == 2
+
+
+def test_cache_removes_unused_files(config_dir: Path) -> None:
+    """Test files which are no longer loaded are removed from the cache."""
+    cache_path = config_dir / ".storage" / "core.yaml_cache"
+    cache = YamlCache(str(cache_path))
+    _load(config_dir, cache)
+    cache.save()
+
+    (config_dir / "configuration.yaml").write_text("sensor: !include sensors.yaml\n")
+    cache = YamlCache(str(cache_path))
+    _load(config_dir, cache)
+    cache.save()
+
+    cache = YamlCache(str(cache_path))
+    with patch.object(
+        yaml_cache, "_parse_raw", wraps=yaml_cache._parse_raw
+    ) as mock_parse:
+        _load(config_dir, cache)
+    assert mock_parse.call_count == 0
+    assert cache._entries is not None
+    assert set(cache._entries) == {
+        str(config_dir / "configuration.yaml"),
+        str(config_dir / "sensors.yaml"),
+    }
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "key: value\nkey: other\n",
+        "date: 2024-01-01\n",
+        "!secret name : value\n",
+    ],
+)
+def test_cache_uncacheable(
+    config_dir: Path, content: str, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test files which can not be cached are loaded each time."""
+    (config_dir / "configuration.yaml").write_text(content)
+    cache = YamlCache(str(config_dir / ".storage" / "core.yaml_cache"))
+
+    for _ in range(2):
+        caplog.clear()
+        assert _with_annotations(_load(config_dir, cache)) == _with_annotations(
+            _load(config_dir, None)
+        )
+    assert cache._entries == {}
+    assert caplog.text.count("contains duplicate key") == (
+        2 if "other" in content else 0
+    )
+
+
+def test_cache_duplicate_key_warning_has_file_name(
+    config_dir: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the duplicate key warning names the file which is parsed."""
+    (config_dir / "configuration.yaml").write_text("a: 1\na: 2\n")
+    cache = YamlCache(str(config_dir / ".storage" / "core.yaml_cache"))
+
+    _load(config_dir, cache)
+    assert (
+        f'YAML file {config_dir / "configuration.yaml"} contains duplicate key "a"'
+        in caplog.text
+    )
+
+
+def test_cache_syntax_error(config_dir: Path) -> None:
+    """Test the error of the loader is raised for invalid files."""
+    (config_dir / "configuration.yaml").write_text("key: [value\n")
+    cache = YamlCache(str(config_dir / ".storage" / "core.yaml_cache"))
+
+    with pytest.raises(HomeAssistantError, match="configuration.yaml"):
+        _load(config_dir, cache)
+
+
+def test_cache_tag_error(config_dir: Path) -> None:
+    """Test the error of a tag refers to its line in the cached file."""
+    (config_dir / "configuration.yaml").write_text("key:\n  sub: !include\n")
+    cache = YamlCache(str(config_dir / ".storage" / "core.yaml_cache"))
+
+    for _ in range(2):
+        with pytest.raises(HomeAssistantError, match="line 2, column 8"):
+            _load(config_dir, cache)
+
+
+def test_cache_ignores_invalid_file(config_dir: Path) -> None:
+    """Test an invalid or outdated cache file is ignored."""
+    cache_path = config_dir / ".storage" / "core.yaml_cache"
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b"invalid")
+    cache = YamlCache(str(cache_path))
+    assert _load(config_dir, cache)["sensor"][0]["name"] == "First"
+    cache.save()
+
+    with patch.object(yaml_cache, "__version__", "0.0.0"):
+        cache = YamlCache(str(cache_path))
+        with patch.object(
+            yaml_cache, "_parse_raw", wraps=yaml_cache._parse_raw
+        ) as mock_parse:
+            _load(config_dir, cache)
+    assert mock_parse.call_count == 3